@@ -1,11 +1,18 @@
 # paper_search_mcp/sources/arxiv.py
-from typing import List
+from typing import AsyncIterator, List, Optional
+import asyncio
 from datetime import datetime
 import httpx
 import feedparser
+from ..httpclient import SharedClientMixin
 from ..paper import Paper
-from PyPDF2 import PdfReader
+from ..pdfcache import PdfCache, stream_to_file
+from ..pdftext import extract_text, iter_page_texts
 import os
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class PaperSource:
     """Abstract base class for paper sources"""
@@ -18,9 +25,21 @@ class PaperSource:
     async def read_paper(self, paper_id: str, save_path: str) -> str:
         raise NotImplementedError
 
-class ArxivSearcher(PaperSource):
+class ArxivSearcher(SharedClientMixin, PaperSource):
     """Searcher for arXiv papers"""
     BASE_URL = "http://export.arxiv.org/api/query"
+    PDF_URL = "https://arxiv.org/pdf/{}.pdf"
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, pdf_cache: Optional[PdfCache] = None):
+        """Initialize the searcher.
+
+        Args:
+            client: Optional shared ``httpx.AsyncClient``; when given, it is
+                used for every request instead of a client per call.
+            pdf_cache: Optional ``PdfCache`` that download_pdf goes through.
+        """
+        self.client = client
+        self.pdf_cache = pdf_cache
 
     async def search(self, query: str, max_results: int = 10) -> List[Paper]:
         params = {
@@ -29,7 +48,7 @@ class ArxivSearcher(PaperSource):
             'sortBy': 'submittedDate',
             'sortOrder': 'descending'
         }
-        async with httpx.AsyncClient() as client:
+        async with self._client_context() as client:
             response = await client.get(self.BASE_URL, params=params)
             response.raise_for_status()
         feed = feedparser.parse(response.content)
@@ -55,18 +74,33 @@ class ArxivSearcher(PaperSource):
                     doi=entry.get('doi', '')
                 ))
             except Exception as e:
-                print(f"Error parsing arXiv entry: {e}")
+                logger.warning(f"Error parsing arXiv entry: {e}")
         return papers
 
-    async def download_pdf(self, paper_id: str, save_path: str) -> str:
-        pdf_url = f"https://arxiv.org/pdf/{paper_id}.pdf"
-        async with httpx.AsyncClient() as client:
+    async def _fetch_pdf(self, paper_id: str) -> bytes:
+        pdf_url = self.PDF_URL.format(paper_id)
+        async with self._client_context() as client:
             response = await client.get(pdf_url)
             response.raise_for_status()
+        return response.content
+
+    async def download_pdf(self, paper_id: str, save_path: str) -> str:
         output_file = f"{save_path}/{paper_id}.pdf"
-        with open(output_file, 'wb') as f:
-            f.write(response.content)
-        return output_file
+        download = self.pdf_cache.download if self.pdf_cache is not None else stream_to_file
+        async with self._client_context() as client:
+            return await download(client, self.PDF_URL.format(paper_id), output_file)
+
+    async def read_paper_bytes(self, paper_id: str) -> str:
+        """Fetch a paper's PDF and extract its text in memory, without saving it.
+        
+        Args:
+            paper_id: arXiv paper ID
+            
+        Returns:
+            str: The extracted text content of the paper
+        """
+        content = await self._fetch_pdf(paper_id)
+        return await asyncio.to_thread(extract_text, content)
 
     async def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
         """Read a paper and convert it to text format.
@@ -81,22 +115,31 @@ class ArxivSearcher(PaperSource):
         # First ensure we have the PDF
         pdf_path = f"{save_path}/{paper_id}.pdf"
         if not os.path.exists(pdf_path):
-            pdf_path = await self.download_pdf(paper_id, save_path)
+            await self.download_pdf(paper_id, save_path)
         
         # Read the PDF
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            
-            # Extract text from each page
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            
+            text = "".join([page async for page in self.read_paper_stream(paper_id, save_path)])
             return text.strip()
         except Exception as e:
-            print(f"Error reading PDF for paper {paper_id}: {e}")
+            logger.error(f"Error reading PDF for paper {paper_id}: {e}")
             return ""
 
+    async def read_paper_stream(self, paper_id: str, save_path: str = "./downloads") -> AsyncIterator[str]:
+        """Yield the text of a paper one page at a time.
+
+        Callers that only need the beginning of a paper can stop early
+        without extracting the remaining pages.
+        """
+        pdf_path = f"{save_path}/{paper_id}.pdf"
+        if not os.path.exists(pdf_path):
+            pdf_path = await self.download_pdf(paper_id, save_path)
+        
+        # PDF parsing is CPU-bound; keep it off the event loop
+        pages = iter_page_texts(pdf_path)
+        while (text := await asyncio.to_thread(next, pages, None)) is not None:
+            yield text + "\n"
+
 if __name__ == "__main__":
     import asyncio
     
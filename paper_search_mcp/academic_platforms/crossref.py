@@ -1,14 +1,64 @@
 # paper_search_mcp/academic_platforms/crossref.py
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import quote, quote_plus, urlencode
+import asyncio
 import httpx
-import time
-import random
+from ..jsonutil import decode_response
 from ..paper import Paper
+from ..ratelimit import RateLimitedTransport, retry_delay
 import logging
 
+try:
+    import ijson
+except ImportError:  # optional: search pages are then decoded in one piece
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Date fields tried in order for a paper's publication date
+_DATE_FIELDS = ('published', 'issued', 'created')
+_EPOCH = datetime(1970, 1, 1)
+
+
+class _StreamReader:
+    """Adapts a streamed response to the async ``read()`` that ijson expects."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes the stream type with read(0)
+            return b''
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b''
+
+
+async def _read_message(response: httpx.Response) -> Dict[str, Any]:
+    """
+    Read the ``message`` object of a streamed works response.
+
+    With ijson the body is parsed as it arrives, so large pages are never
+    held in memory as raw bytes; otherwise it is read and decoded at once.
+    """
+    if ijson is None:
+        await response.aread()
+        return decode_response(response).get('message', {})
+    return {
+        key: value
+        async for key, value in ijson.kvitems(_StreamReader(response), 'message', use_float=True)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _encode_doi(doi: str) -> str:
+    """Percent-encode a DOI for use as a /works/ path segment."""
+    return quote(doi.strip(), safe='/')
+
 class PaperSource:
     """Abstract base class for paper sources"""
     def search(self, query: str, **kwargs) -> List[Paper]:
@@ -26,13 +76,177 @@ class CrossRefSearcher(PaperSource):
     BASE_URL = "https://api.crossref.org"
     
     # User agent for polite API usage as per CrossRef etiquette
-    USER_AGENT = "paper-search-mcp/0.1.3 (https://github.com/Dragonatorul/paper-search-mcp; mailto:paper-search@example.org)"
+    MAILTO = "paper-search@example.org"
+    USER_AGENT = f"paper-search-mcp/0.1.3 (https://github.com/Dragonatorul/paper-search-mcp; mailto:{MAILTO})"
+    
+    # Retry policy for rate-limited (429) responses
+    MAX_RETRIES = 3
+    RETRY_DELAY = 2  # seconds
     
-    def __init__(self):
+    # Works queries return at most PAGE_SIZE rows per request, and offset
+    # paging stops at MAX_RESULTS
+    PAGE_SIZE = 1000
+    MAX_RESULTS = 10000
+    
+    # Number of DOI lookups remembered by get_paper_by_doi
+    DOI_CACHE_SIZE = 1024
+    
+    # Fields returned by search_columnar (the Paper fields CrossRef populates)
+    COLUMNS = (
+        'paper_id', 'title', 'authors', 'abstract', 'doi', 'published_date',
+        'pdf_url', 'url', 'source', 'categories', 'keywords', 'citations', 'extra',
+    )
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the searcher.
+
+        Args:
+            client: Optional shared ``httpx.AsyncClient``; when given, it is
+                used instead of the searcher's own pooled client.
+        """
+        self.client = client
         self.headers = {
             'User-Agent': self.USER_AGENT,
             'Accept': 'application/json'
         }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._doi_cache: "OrderedDict[str, Optional[Paper]]" = OrderedDict()
+        
+        # Constant query-string parts, encoded once
+        self._polite_qs = urlencode({'mailto': self.MAILTO})
+        self._default_order_qs = urlencode({'sort': 'relevance', 'order': 'desc'})
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the injected client, or else the pooled client for the running
+        event loop.
+
+        The pooled client is created lazily and kept alive so that keep-alive
+        connections (and their TLS sessions) are reused across calls. A new
+        client is built if the previous one was closed or belongs to a
+        different event loop.
+        """
+        if self.client is not None:
+            return self.client
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                # Stays under the polite pool's rate limit rather than
+                # tripping 429s and backing off
+                transport=RateLimitedTransport(
+                    http2=True,
+                    pool_limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                ),
+                timeout=30,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (an injected client is left open)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    @staticmethod
+    def _doi_cache_key(doi: str) -> str:
+        """Normalize a DOI for cache lookups (DOIs are case-insensitive)."""
+        return doi.strip().lower()
+
+    def _cache_doi(self, key: str, paper: Optional[Paper]) -> None:
+        """Store a DOI lookup result, evicting the least recently used entry."""
+        self._doi_cache[key] = paper
+        self._doi_cache.move_to_end(key)
+        if len(self._doi_cache) > self.DOI_CACHE_SIZE:
+            self._doi_cache.popitem(last=False)
+
+    def invalidate(self, doi: Optional[str] = None) -> None:
+        """
+        Drop cached DOI lookups.
+        
+        Args:
+            doi: DOI to forget; if omitted the whole cache is cleared
+        """
+        if doi is None:
+            self._doi_cache.clear()
+        else:
+            self._doi_cache.pop(self._doi_cache_key(doi), None)
+
+    async def __aenter__(self) -> "CrossRefSearcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def _fetch_page(self, url: str, rows: int, offset: int = 0) -> Dict[str, Any]:
+        """
+        Fetch one page of a works query, backing off when rate limited.
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        url = f"{url}&rows={rows}&offset={offset}" if offset else f"{url}&rows={rows}"
+        client = self._get_client()
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with client.stream("GET", url, headers=self.headers) as response:
+                if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                    response.raise_for_status()
+                    return await _read_message(response)
+                wait_time = retry_delay(response, attempt, self.RETRY_DELAY)
+            # Rate limited - back off without blocking the event loop
+            logger.warning(f"Rate limited by CrossRef API, waiting {wait_time:.1f} seconds...")
+            await asyncio.sleep(wait_time)
+    
+    async def _fetch_items(self, query: str, max_results: int, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Run a CrossRef works query and return the raw result items.
+        
+        Up to PAGE_SIZE results come from a single request. Beyond that the
+        first page reports the total, and the remaining pages (up to
+        MAX_RESULTS) are fetched concurrently by offset.
+        
+        Raises:
+            httpx.HTTPError: If the first request fails
+        """
+        max_results = min(max_results, self.MAX_RESULTS)
+        
+        # Sort order and the polite pool parameter are usually constant, so
+        # their encoded form is reused unless the caller overrides them
+        if 'sort' in kwargs or 'order' in kwargs:
+            order_qs = urlencode({
+                'sort': kwargs.get('sort', 'relevance'),
+                'order': kwargs.get('order', 'desc'),
+            })
+        else:
+            order_qs = self._default_order_qs
+        
+        url = f"{self.BASE_URL}/works?query={quote_plus(query)}&{order_qs}&{self._polite_qs}"
+        
+        # Add any additional filters from kwargs
+        if 'filter' in kwargs:
+            url += f"&filter={quote_plus(kwargs['filter'])}"
+        
+        message = await self._fetch_page(url, min(max_results, self.PAGE_SIZE))
+        items = message.get('items', [])
+        wanted = min(max_results, message.get('total-results', 0))
+        if len(items) == self.PAGE_SIZE and wanted > len(items):
+            pages = await asyncio.gather(
+                *(
+                    self._fetch_page(url, min(self.PAGE_SIZE, wanted - offset), offset)
+                    for offset in range(self.PAGE_SIZE, wanted, self.PAGE_SIZE)
+                ),
+                return_exceptions=True,
+            )
+            for page in pages:
+                if isinstance(page, Exception):
+                    # Keep what was fetched rather than failing the search
+                    logger.error(f"Error fetching CrossRef results page: {page}")
+                    continue
+                items.extend(page.get('items', []))
+        return items
     
     async def search(self, query: str, max_results: int = 10, **kwargs) -> List[Paper]:
         """
@@ -47,196 +261,159 @@ class CrossRefSearcher(PaperSource):
             List of Paper objects
         """
         try:
-            params = {
-                'query': query,
-                'rows': min(max_results, 1000),  # CrossRef API max is 1000
-                'sort': 'relevance',
-                'order': 'desc'
-            }
-            
-            # Add any additional filters from kwargs
-            if 'filter' in kwargs:
-                params['filter'] = kwargs['filter']
-            if 'sort' in kwargs:
-                params['sort'] = kwargs['sort']
-            if 'order' in kwargs:
-                params['order'] = kwargs['order']
-                
-            # Add polite pool parameter
-            params['mailto'] = 'paper-search@example.org'
-            
-            url = f"{self.BASE_URL}/works"
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=30, headers=self.headers)
-                
-                if response.status_code == 429:
-                    # Rate limited - wait and retry once
-                    logger.warning("Rate limited by CrossRef API, waiting 2 seconds...")
-                    time.sleep(2)
-                    response = await client.get(url, params=params, timeout=30, headers=self.headers)
-                
-                response.raise_for_status()
-                data = response.json()
-            
-            papers = []
-            items = data.get('message', {}).get('items', [])
-            
-            for item in items:
-                try:
-                    paper = self._parse_crossref_item(item)
-                    if paper:
-                        papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Error parsing CrossRef item: {e}")
-                    continue
-                    
-            return papers
-            
+            items = await self._fetch_items(query, max_results, **kwargs)
         except httpx.HTTPError as e:
             logger.error(f"Error searching CrossRef: {e}")
             return []
         except Exception as e:
             logger.error(f"Unexpected error in CrossRef search: {e}")
             return []
+        
+        return [self._parse_crossref_item(item) for item in items]
     
-    def _parse_crossref_item(self, item: Dict[str, Any]) -> Optional[Paper]:
-        """Parse a CrossRef API item into a Paper object."""
-        try:
-            # Extract basic information
-            doi = item.get('DOI', '')
-            title = self._extract_title(item)
-            authors = self._extract_authors(item)
-            abstract = item.get('abstract', '')
-            
-            # Extract publication date
-            published_date = self._extract_date(item, 'published')
-            if not published_date:
-                published_date = self._extract_date(item, 'issued')
-            if not published_date:
-                published_date = self._extract_date(item, 'created')
-            
-            # Default to epoch if no date found
-            if not published_date:
-                published_date = datetime(1970, 1, 1)
-            
-            # Extract URLs
-            url = item.get('URL', f"https://doi.org/{doi}" if doi else '')
-            pdf_url = self._extract_pdf_url(item)
-            
-            # Extract additional metadata
-            container_title = self._extract_container_title(item)
-            publisher = item.get('publisher', '')
-            categories = [item.get('type', '')]
-            
-            # Extract subjects/keywords if available
-            subjects = item.get('subject', [])
-            if isinstance(subjects, list):
-                keywords = subjects
-            else:
-                keywords = []
-            
-            return Paper(
-                paper_id=doi,
-                title=title,
-                authors=authors,
-                abstract=abstract,
-                doi=doi,
-                published_date=published_date,
-                pdf_url=pdf_url,
-                url=url,
-                source='crossref',
-                categories=categories,
-                keywords=keywords,
-                citations=item.get('is-referenced-by-count', 0),
-                extra={
-                    'publisher': publisher,
-                    'container_title': container_title,
-                    'volume': item.get('volume', ''),
-                    'issue': item.get('issue', ''),
-                    'page': item.get('page', ''),
-                    'issn': item.get('ISSN', []),
-                    'isbn': item.get('ISBN', []),
-                    'crossref_type': item.get('type', ''),
-                    'member': item.get('member', ''),
-                    'prefix': item.get('prefix', '')
-                }
-            )
+    async def search_columnar(self, query: str, max_results: int = 10, **kwargs) -> Dict[str, List[Any]]:
+        """
+        Search CrossRef and return results as parallel columns.
+        
+        Skips building a Paper per result, which is cheaper for large result
+        sets that are projected or serialized as a whole.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return (default: 10)
+            **kwargs: Additional parameters like filters, sort, etc. (see search)
             
+        Returns:
+            Dict mapping each name in COLUMNS to a list with one value per result
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in self.COLUMNS}
+        try:
+            items = await self._fetch_items(query, max_results, **kwargs)
+        except httpx.HTTPError as e:
+            logger.error(f"Error searching CrossRef: {e}")
+            return columns
         except Exception as e:
-            logger.error(f"Error parsing CrossRef item: {e}")
-            return None
+            logger.error(f"Unexpected error in CrossRef search: {e}")
+            return columns
+        
+        appenders = [(name, columns[name].append) for name in self.COLUMNS]
+        for item in items:
+            fields = self._extract_fields(item)
+            for name, append in appenders:
+                append(fields[name])
+                
+        return columns
     
-    def _extract_title(self, item: Dict[str, Any]) -> str:
-        """Extract title from CrossRef item."""
-        titles = item.get('title', [])
-        if isinstance(titles, list) and titles:
-            return titles[0]
-        return str(titles) if titles else ''
+    def _parse_crossref_item(self, item: Dict[str, Any]) -> Paper:
+        """Parse a CrossRef API item into a Paper object."""
+        return Paper(**self._extract_fields(item))
     
+    def _extract_fields(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract Paper fields (keyed as in COLUMNS) from a CrossRef API item.
+
+        Missing or malformed dates fall back to the epoch; any other error
+        propagates so that parsing bugs are not silently dropped.
+        """
+        # Called once per result item, so look-ups are kept local and
+        # the title/container/PDF extraction is done inline.
+        item_get = item.get
+        
+        # Extract basic information
+        doi = item_get('DOI', '')
+        titles = item_get('title', [])
+        if titles.__class__ is list:
+            title = titles[0] if titles else ''
+        else:
+            title = str(titles) if titles else ''
+        authors = self._extract_authors(item)
+        abstract = item_get('abstract', '')
+        
+        # Extract publication date from the first usable fallback field,
+        # defaulting to epoch if none is found
+        for date_field in _DATE_FIELDS:
+            try:
+                parts = item_get(date_field)['date-parts'][0]
+                published_date = datetime(
+                    parts[0],
+                    parts[1] if len(parts) > 1 else 1,
+                    parts[2] if len(parts) > 2 else 1,
+                )
+                break
+            except (KeyError, IndexError, TypeError, ValueError):
+                pass
+        else:
+            published_date = _EPOCH
+        
+        # Extract URLs
+        url = item_get('URL', f"https://doi.org/{doi}" if doi else '')
+        
+        # PDF URL: prefer a primary resource ending in .pdf, then any PDF link
+        pdf_url = ''
+        resource = item_get('resource')
+        primary = resource.get('primary') if resource else None
+        if primary and primary.get('URL', '').endswith('.pdf'):
+            pdf_url = primary['URL']
+        else:
+            for link in item_get('link', ()):
+                if link.__class__ is dict and 'pdf' in link.get('content-type', '').lower():
+                    pdf_url = link.get('URL', '')
+                    break
+        
+        # Extract additional metadata
+        container_titles = item_get('container-title', [])
+        if container_titles.__class__ is list:
+            container_title = container_titles[0] if container_titles else ''
+        else:
+            container_title = str(container_titles) if container_titles else ''
+        crossref_type = item_get('type', '')
+        
+        # Extract subjects/keywords if available
+        subjects = item_get('subject', [])
+        keywords = subjects if subjects.__class__ is list else []
+        
+        return dict(
+            paper_id=doi,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            doi=doi,
+            published_date=published_date,
+            pdf_url=pdf_url,
+            url=url,
+            source='crossref',
+            categories=[crossref_type],
+            keywords=keywords,
+            citations=item_get('is-referenced-by-count', 0),
+            extra={
+                'publisher': item_get('publisher', ''),
+                'container_title': container_title,
+                'volume': item_get('volume', ''),
+                'issue': item_get('issue', ''),
+                'page': item_get('page', ''),
+                'issn': item_get('ISSN', []),
+                'isbn': item_get('ISBN', []),
+                'crossref_type': crossref_type,
+                'member': item_get('member', ''),
+                'prefix': item_get('prefix', '')
+            }
+        )
+        
     def _extract_authors(self, item: Dict[str, Any]) -> List[str]:
         """Extract author names from CrossRef item."""
         authors = []
-        author_list = item.get('author', [])
+        append = authors.append
         
-        for author in author_list:
-            if isinstance(author, dict):
-                given = author.get('given', '')
-                family = author.get('family', '')
+        for author in item.get('author', ()):
+            if author.__class__ is dict:
+                given = author.get('given')
+                family = author.get('family')
                 if given and family:
-                    authors.append(f"{given} {family}")
-                elif family:
-                    authors.append(family)
-                elif given:
-                    authors.append(given)
+                    append(f"{given} {family}")
+                elif family or given:
+                    append(family or given)
                     
         return authors
     
-    def _extract_date(self, item: Dict[str, Any], date_field: str) -> Optional[datetime]:
-        """Extract date from CrossRef item."""
-        date_info = item.get(date_field, {})
-        if not date_info:
-            return None
-            
-        date_parts = date_info.get('date-parts', [])
-        if not date_parts or not date_parts[0]:
-            return None
-            
-        parts = date_parts[0]
-        try:
-            year = parts[0] if len(parts) > 0 else 1970
-            month = parts[1] if len(parts) > 1 else 1
-            day = parts[2] if len(parts) > 2 else 1
-            return datetime(year, month, day)
-        except (ValueError, IndexError):
-            return None
-    
-    def _extract_container_title(self, item: Dict[str, Any]) -> str:
-        """Extract container title (journal/book title) from CrossRef item."""
-        container_titles = item.get('container-title', [])
-        if isinstance(container_titles, list) and container_titles:
-            return container_titles[0]
-        return str(container_titles) if container_titles else ''
-    
-    def _extract_pdf_url(self, item: Dict[str, Any]) -> str:
-        """Extract PDF URL from CrossRef item."""
-        # Check for link in the resource field
-        resource = item.get('resource', {})
-        if resource:
-            primary = resource.get('primary', {})
-            if primary and primary.get('URL', '').endswith('.pdf'):
-                return primary['URL']
-        
-        # Check in links array
-        links = item.get('link', [])
-        for link in links:
-            if isinstance(link, dict):
-                content_type = link.get('content-type', '')
-                if 'pdf' in content_type.lower():
-                    return link.get('URL', '')
-                    
-        return ''
-    
     def download_pdf(self, paper_id: str, save_path: str) -> str:
         """
         CrossRef doesn't provide direct PDF downloads.
@@ -279,23 +456,32 @@ class CrossRefSearcher(PaperSource):
             
         Returns:
             Paper object if found, None otherwise
+            
+        Results (including "not found") are cached per DOI; transport and
+        server errors are not. Use invalidate() to force a fresh lookup.
         """
+        key = self._doi_cache_key(doi)
+        if key in self._doi_cache:
+            self._doi_cache.move_to_end(key)
+            return self._doi_cache[key]
+        
         try:
-            url = f"{self.BASE_URL}/works/{doi}"
-            params = {'mailto': 'paper-search@example.org'}
+            response = await self._get_client().get(
+                f"{self.BASE_URL}/works/{_encode_doi(doi)}?{self._polite_qs}", headers=self.headers
+            )
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=30, headers=self.headers)
-                
-                if response.status_code == 404:
-                    logger.warning(f"DOI not found in CrossRef: {doi}")
-                    return None
-                    
-                response.raise_for_status()
-                data = response.json()
+            if response.status_code == 404:
+                logger.warning(f"DOI not found in CrossRef: {doi}")
+                self._cache_doi(key, None)
+                return None
                 
-                item = data.get('message', {})
-                return self._parse_crossref_item(item)
+            response.raise_for_status()
+            data = decode_response(response)
+            
+            item = data.get('message', {})
+            paper = self._parse_crossref_item(item)
+            self._cache_doi(key, paper)
+            return paper
                 
         except httpx.HTTPError as e:
             logger.error(f"Error fetching DOI {doi} from CrossRef: {e}")
@@ -304,6 +490,33 @@ class CrossRefSearcher(PaperSource):
             logger.error(f"Unexpected error fetching DOI {doi}: {e}")
             return None
 
+    async def get_papers_by_dois(self, dois: List[str], concurrency: int = 8) -> List[Optional[Paper]]:
+        """
+        Get several papers by DOI concurrently.
+        
+        Args:
+            dois: List of Digital Object Identifiers
+            concurrency: Maximum number of lookups in flight at once (default: 8)
+            
+        Returns:
+            List of Paper objects (or None where a DOI was not found), in the same order as dois
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def bounded(doi: str) -> Optional[Paper]:
+            async with semaphore:
+                return await self.get_paper_by_doi(doi)
+        
+        results = await asyncio.gather(*(bounded(doi) for doi in dois), return_exceptions=True)
+        papers = []
+        for doi, result in zip(dois, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching DOI {doi} from CrossRef: {result}")
+                papers.append(None)
+            else:
+                papers.append(result)
+        return papers
+
 if __name__ == "__main__":
     import asyncio
     
@@ -1,9 +1,10 @@
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import httpx
 from bs4 import BeautifulSoup
-import time
 import random
+from ..httpclient import SharedClientMixin
 from ..paper import Paper
 import logging
 
@@ -21,7 +22,7 @@ class PaperSource:
         raise NotImplementedError
     
 
-class GoogleScholarSearcher(PaperSource):
+class GoogleScholarSearcher(SharedClientMixin, PaperSource):
     """Custom implementation of Google Scholar paper search"""
     
     SCHOLAR_URL = "https://scholar.google.com/scholar"
@@ -31,12 +32,13 @@ class GoogleScholarSearcher(PaperSource):
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
     ]
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.headers = {
             'User-Agent': random.choice(self.BROWSERS),
             'Accept': 'text/html,application/xhtml+xml',
             'Accept-Language': 'en-US,en;q=0.9'
         }
+        self.client = client
 
     def _extract_year(self, text: str) -> Optional[int]:
         """Extract year from publication info"""
@@ -94,7 +96,7 @@ class GoogleScholarSearcher(PaperSource):
         start = 0
         results_per_page = min(10, max_results)
 
-        async with httpx.AsyncClient() as client:
+        async with self._client_context() as client:
             while len(papers) < max_results:
                 try:
                     # Construct search parameters
@@ -105,8 +107,8 @@ class GoogleScholarSearcher(PaperSource):
                         'as_sdt': '0,5'  # Include articles and citations
                     }
 
-                    # Make request with random delay
-                    time.sleep(random.uniform(1.0, 3.0))
+                    # Make request with random delay, without blocking the event loop
+                    await asyncio.sleep(random.uniform(1.0, 3.0))
                     response = await client.get(self.SCHOLAR_URL, params=params, headers=self.headers)
                     
                     if response.status_code != 200:
@@ -1,12 +1,16 @@
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import httpx
+import io
 from bs4 import BeautifulSoup
 import time
 import random
+from ..httpclient import SharedClientMixin
 from ..paper import Paper
 import logging
-from PyPDF2 import PdfReader
+from ..pdfcache import PdfCache, stream_to_file
+from ..pdftext import extract_paged_text
 import os
 
 logger = logging.getLogger(__name__)
@@ -25,23 +29,28 @@ class PaperSource:
         raise NotImplementedError
 
 
-class IACRSearcher(PaperSource):
+class IACRSearcher(SharedClientMixin, PaperSource):
     """IACR ePrint Archive paper search implementation"""
 
     IACR_SEARCH_URL = "https://eprint.iacr.org/search"
     IACR_BASE_URL = "https://eprint.iacr.org"
+    PDF_URL = IACR_BASE_URL + "/{}.pdf"
     BROWSERS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
     ]
+    # Detail pages fetched at once per search
+    DETAIL_CONCURRENCY = 8
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, pdf_cache: Optional[PdfCache] = None):
         self.headers = {
             "User-Agent": random.choice(self.BROWSERS),
             "Accept": "text/html,application/xhtml+xml",
             "Accept-Language": "en-US,en;q=0.9",
         }
+        self.client = client
+        self.pdf_cache = pdf_cache
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date from IACR format (e.g., '2025-06-02')"""
@@ -51,8 +60,8 @@ class IACRSearcher(PaperSource):
             logger.warning(f"Could not parse date: {date_str}")
             return None
 
-    def _parse_paper(self, item, fetch_details: bool = True) -> Optional[Paper]:
-        """Parse single paper entry from IACR HTML and optionally fetch detailed info"""
+    def _parse_paper(self, item) -> Optional[Paper]:
+        """Parse single paper entry from IACR search results HTML"""
         try:
             # Extract paper ID from the search result
             header_div = item.find("div", class_="d-flex")
@@ -65,19 +74,6 @@ class IACRSearcher(PaperSource):
                 return None
 
             paper_id = paper_link.get_text(strip=True)  # e.g., "2025/1014"
-
-            if fetch_details:
-                # Fetch detailed information for this paper
-                logger.info(f"Fetching detailed info for paper {paper_id}")
-                detailed_paper = await self.get_paper_details(paper_id)
-                if detailed_paper:
-                    return detailed_paper
-                else:
-                    logger.warning(
-                        f"Could not fetch details for {paper_id}, falling back to search result parsing"
-                    )
-
-            # Fallback: parse from search results if detailed fetch fails or is disabled
             paper_url = self.IACR_BASE_URL + paper_link["href"]
 
             # Get PDF URL
@@ -164,7 +160,7 @@ class IACRSearcher(PaperSource):
             params = {"q": query}
 
             # Make request
-            async with httpx.AsyncClient() as client:
+            async with self._client_context() as client:
                 response = await client.get(self.IACR_SEARCH_URL, params=params, headers=self.headers)
                 response.raise_for_status()
 
@@ -179,15 +175,29 @@ class IACRSearcher(PaperSource):
                     return papers
 
                 # Process each result
-                for i, item in enumerate(results):
+                for item in results:
                     if len(papers) >= max_results:
                         break
-
-                    logger.info(f"Processing paper {i+1}/{min(len(results), max_results)}")
-                    paper = self._parse_paper(item, fetch_details=fetch_details)
+                    paper = self._parse_paper(item)
                     if paper:
                         papers.append(paper)
 
+                if fetch_details:
+                    # Fetch all detail pages concurrently, a few at a time
+                    limit = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+
+                    async def with_details(paper: Paper) -> Paper:
+                        async with limit:
+                            detailed_paper = await self._fetch_paper_details(client, paper.paper_id)
+                        if detailed_paper:
+                            return detailed_paper
+                        logger.warning(
+                            f"Could not fetch details for {paper.paper_id}, falling back to search result parsing"
+                        )
+                        return paper
+
+                    papers = list(await asyncio.gather(*(with_details(paper) for paper in papers)))
+
         except Exception as e:
             logger.error(f"IACR search error: {e}")
 
@@ -205,16 +215,13 @@ class IACRSearcher(PaperSource):
             str: Path to downloaded file or error message
         """
         try:
-            pdf_url = f"{self.IACR_BASE_URL}/{paper_id}.pdf"
+            pdf_url = self.PDF_URL.format(paper_id)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(pdf_url, headers=self.headers)
-                response.raise_for_status()
+            filename = f"{save_path}/iacr_{paper_id.replace('/', '_')}.pdf"
 
-                filename = f"{save_path}/iacr_{paper_id.replace('/', '_')}.pdf"
-                with open(filename, "wb") as f:
-                    f.write(response.content)
-                return filename
+            download = self.pdf_cache.download if self.pdf_cache is not None else stream_to_file
+            async with self._client_context() as client:
+                return await download(client, pdf_url, filename, headers=self.headers)
 
         except Exception as e:
             logger.error(f"PDF download error: {e}")
@@ -238,35 +245,15 @@ class IACRSearcher(PaperSource):
                 return f"Error: Could not find PDF URL for paper {paper_id}"
 
             # Download the PDF
-            async with httpx.AsyncClient() as client:
-                pdf_response = await client.get(paper.pdf_url, timeout=30)
-                pdf_response.raise_for_status()
-
-                # Create download directory if it doesn't exist
-                os.makedirs(save_path, exist_ok=True)
-
-                # Save the PDF
+            async with self._client_context() as client:
+                # Save the PDF, creating the download directory if needed
                 filename = f"iacr_{paper_id.replace('/', '_')}.pdf"
                 pdf_path = os.path.join(save_path, filename)
+                download = self.pdf_cache.download if self.pdf_cache is not None else stream_to_file
+                await download(client, paper.pdf_url, pdf_path, timeout=30)
 
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_response.content)
-
-                # Extract text using PyPDF2
-                reader = PdfReader(pdf_path)
-                text = ""
-
-                for page_num, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += f"\n--- Page {page_num + 1} ---\n"
-                            text += page_text + "\n"
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to extract text from page {page_num + 1}: {e}"
-                        )
-                        continue
+                # Extract text off the event loop
+                text = await asyncio.to_thread(extract_paged_text, pdf_path)
 
                 if not text.strip():
                     return (
@@ -290,6 +277,47 @@ class IACRSearcher(PaperSource):
             logger.error(f"Read paper error: {e}")
             return f"Error reading paper: {e}"
 
+    async def read_paper_bytes(self, paper_id: str) -> str:
+        """
+        Extract text from IACR paper PDF in memory, without saving it
+
+        Args:
+            paper_id: IACR paper ID (e.g., "2009/101") or full URL
+
+        Returns:
+            str: Extracted text from the PDF or error message
+        """
+        try:
+            # The PDF URL follows from the ID, so fetch it alongside the details
+            async with self._client_context() as client:
+                paper, pdf_response = await asyncio.gather(
+                    self._fetch_paper_details(client, paper_id),
+                    client.get(self.PDF_URL.format(self._normalize_id(paper_id)), headers=self.headers, timeout=30),
+                )
+            if not paper:
+                return f"Error: Could not find PDF URL for paper {paper_id}"
+            pdf_response.raise_for_status()
+
+            text = await asyncio.to_thread(extract_paged_text, io.BytesIO(pdf_response.content))
+            if not text.strip():
+                return "PDF fetched, but unable to extract readable text"
+
+            # Add paper metadata at the beginning
+            metadata = f"Title: {paper.title}\n"
+            metadata += f"Authors: {', '.join(paper.authors)}\n"
+            metadata += f"Published Date: {paper.published_date}\n"
+            metadata += f"URL: {paper.url}\n"
+            metadata += "=" * 80 + "\n\n"
+
+            return metadata + text.strip()
+
+        except httpx.HTTPError as e:
+            logger.error(f"Error downloading PDF: {e}")
+            return f"Error downloading PDF: {e}"
+        except Exception as e:
+            logger.error(f"Read paper error: {e}")
+            return f"Error reading paper: {e}"
+
     async def get_paper_details(self, paper_id: str) -> Optional[Paper]:
         """
         Fetch detailed information for a specific IACR paper
@@ -300,24 +328,34 @@ class IACRSearcher(PaperSource):
         Returns:
             Paper: Detailed paper object with full metadata
         """
+        async with self._client_context() as client:
+            return await self._fetch_paper_details(client, paper_id)
+
+    @staticmethod
+    def _normalize_id(paper_id: str) -> str:
+        """Return the ePrint ID (e.g. "2009/101") of an ID or full paper URL."""
+        if paper_id.startswith("http"):
+            parts = paper_id.split("/")
+            if len(parts) >= 2:
+                return f"{parts[-2]}/{parts[-1]}"
+        return paper_id
+
+    async def _fetch_paper_details(self, client: httpx.AsyncClient, paper_id: str) -> Optional[Paper]:
+        """Fetch and parse a paper's detail page with ``client``."""
         try:
             # Handle both paper ID and full URL
             if paper_id.startswith("http"):
                 paper_url = paper_id
-                # Extract paper ID from URL
-                parts = paper_url.split("/")
-                if len(parts) >= 2:
-                    paper_id = f"{parts[-2]}/{parts[-1]}"
             else:
                 paper_url = f"{self.IACR_BASE_URL}/{paper_id}"
+            paper_id = self._normalize_id(paper_id)
 
             # Make request
-            async with httpx.AsyncClient() as client:
-                response = await client.get(paper_url, headers=self.headers)
-                response.raise_for_status()
+            response = await client.get(paper_url, headers=self.headers)
+            response.raise_for_status()
 
-                # Parse the page
-                soup = BeautifulSoup(response.text, "html.parser")
+            # Parse the page
+            soup = BeautifulSoup(response.text, "html.parser")
 
             # Extract title from h3 element
             title = ""
@@ -394,7 +432,7 @@ class IACRSearcher(PaperSource):
             history = "; ".join(history_entries) if history_entries else ""
 
             # Construct PDF URL
-            pdf_url = f"{self.IACR_BASE_URL}/{paper_id}.pdf"
+            pdf_url = self.PDF_URL.format(paper_id)
 
             # Use last updated date or current date as published date
             published_date = last_updated if last_updated else datetime.now()
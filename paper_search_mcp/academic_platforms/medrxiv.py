@@ -1,9 +1,17 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
+import asyncio
 import httpx
 import os
 from datetime import datetime, timedelta
+from ..httpclient import SharedClientMixin
+from ..jsonutil import decode_response
 from ..paper import Paper
-from PyPDF2 import PdfReader
+from ..pdfcache import PdfCache, stream_to_file
+from ..pdftext import extract_text, iter_page_texts
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class PaperSource:
     """Abstract base class for paper sources"""
@@ -16,13 +24,20 @@ class PaperSource:
     def read_paper(self, paper_id: str, save_path: str) -> str:
         raise NotImplementedError
 
-class MedRxivSearcher(PaperSource):
+class MedRxivSearcher(SharedClientMixin, PaperSource):
     """Searcher for medRxiv papers"""
     BASE_URL = "https://api.biorxiv.org/details/medrxiv"
+    CONTENT_URL = "https://www.medrxiv.org/content/{doi}v{version}"
+    # PDF requests send a browser User-Agent to avoid potential 403 errors
+    PDF_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, pdf_cache: Optional[PdfCache] = None):
         self.timeout = 30
         self.max_retries = 3
+        self.client = client
+        self.pdf_cache = pdf_cache
 
     async def search(self, query: str, max_results: int = 10, days: int = 30) -> List[Paper]:
         """
@@ -45,29 +60,29 @@ class MedRxivSearcher(PaperSource):
         
         papers = []
         cursor = 0
-        async with httpx.AsyncClient() as client:
+        async with self._client_context() as client:
             while len(papers) < max_results:
                 url = f"{self.BASE_URL}/{start_date}/{end_date}/{cursor}"
-                if category:
-                    url += f"?category={category}"
+                params = {'category': category} if category else None
 
                 tries = 0
                 while tries < self.max_retries:
                     try:
-                        response = await client.get(url, timeout=self.timeout)
+                        response = await client.get(url, params=params, timeout=self.timeout)
                         response.raise_for_status()
-                        data = response.json()
+                        data = decode_response(response)
                         collection = data.get('collection', [])
                         for item in collection:
                             try:
                                 date = datetime.strptime(item['date'], '%Y-%m-%d')
+                                content_url = self.CONTENT_URL.format(doi=item['doi'], version=item.get('version', '1'))
                                 papers.append(Paper(
                                     paper_id=item['doi'],
                                     title=item['title'],
                                     authors=item['authors'].split('; '),
                                     abstract=item['abstract'],
-                                    url=f"https://www.medrxiv.org/content/{item['doi']}v{item.get('version', '1')}",
-                                    pdf_url=f"https://www.medrxiv.org/content/{item['doi']}v{item.get('version', '1')}.full.pdf",
+                                    url=content_url,
+                                    pdf_url=f"{content_url}.full.pdf",
                                     published_date=date,
                                     updated_date=date,
                                     source="medrxiv",
@@ -76,7 +91,7 @@ class MedRxivSearcher(PaperSource):
                                     doi=item['doi']
                                 ))
                             except Exception as e:
-                                print(f"Error parsing medRxiv entry: {e}")
+                                logger.warning(f"Error parsing medRxiv entry: {e}")
                         if len(collection) < 100:
                             break  # No more results
                         cursor += 100
@@ -84,15 +99,41 @@ class MedRxivSearcher(PaperSource):
                     except httpx.HTTPError as e:
                         tries += 1
                         if tries == self.max_retries:
-                            print(f"Failed to connect to medRxiv API after {self.max_retries} attempts: {e}")
+                            logger.error(f"Failed to connect to medRxiv API after {self.max_retries} attempts: {e}")
                             break
-                        print(f"Attempt {tries} failed, retrying...")
+                        logger.warning(f"Attempt {tries} failed, retrying...")
                 else:
                     continue
                 break
 
         return papers[:max_results]
 
+    async def _retry_pdf(self, paper_id: str, fetch):
+        """Run ``fetch(client, pdf_url)`` for a paper's PDF, retrying failed requests."""
+        if not paper_id:
+            raise ValueError("Invalid paper_id: paper_id is empty")
+
+        pdf_url = self.CONTENT_URL.format(doi=paper_id, version=1) + ".full.pdf"
+        tries = 0
+        async with self._client_context() as client:
+            while tries < self.max_retries:
+                try:
+                    return await fetch(client, pdf_url)
+                except httpx.HTTPError as e:
+                    tries += 1
+                    if tries == self.max_retries:
+                        raise Exception(f"Failed to download PDF after {self.max_retries} attempts: {e}")
+                    logger.warning(f"Attempt {tries} failed, retrying...")
+
+    async def _fetch_pdf(self, paper_id: str) -> bytes:
+        """Fetch a paper's PDF, retrying failed requests."""
+        async def fetch(client: httpx.AsyncClient, pdf_url: str) -> bytes:
+            response = await client.get(pdf_url, timeout=self.timeout, headers=self.PDF_HEADERS)
+            response.raise_for_status()
+            return response.content
+
+        return await self._retry_pdf(paper_id, fetch)
+
     async def download_pdf(self, paper_id: str, save_path: str) -> str:
         """
         Download a PDF for a given paper ID from medRxiv.
@@ -104,30 +145,24 @@ class MedRxivSearcher(PaperSource):
         Returns:
             Path to the downloaded PDF file.
         """
-        if not paper_id:
-            raise ValueError("Invalid paper_id: paper_id is empty")
+        os.makedirs(save_path, exist_ok=True)
+        output_file = f"{save_path}/{paper_id.replace('/', '_')}.pdf"
+        download = self.pdf_cache.download if self.pdf_cache is not None else stream_to_file
+        return await self._retry_pdf(paper_id, lambda client, pdf_url: download(
+            client, pdf_url, output_file, timeout=self.timeout, headers=self.PDF_HEADERS))
 
-        pdf_url = f"https://www.medrxiv.org/content/{paper_id}v1.full.pdf"
-        tries = 0
-        async with httpx.AsyncClient() as client:
-            while tries < self.max_retries:
-                try:
-                    # Add User-Agent to avoid potential 403 errors
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    response = await client.get(pdf_url, timeout=self.timeout, headers=headers)
-                    response.raise_for_status()
-                    os.makedirs(save_path, exist_ok=True)
-                    output_file = f"{save_path}/{paper_id.replace('/', '_')}.pdf"
-                    with open(output_file, 'wb') as f:
-                        f.write(response.content)
-                    return output_file
-                except httpx.HTTPError as e:
-                    tries += 1
-                    if tries == self.max_retries:
-                        raise Exception(f"Failed to download PDF after {self.max_retries} attempts: {e}")
-                    print(f"Attempt {tries} failed, retrying...")
+    async def read_paper_bytes(self, paper_id: str) -> str:
+        """
+        Fetch a paper's PDF and extract its text in memory, without saving it.
+        
+        Args:
+            paper_id: medRxiv DOI
+            
+        Returns:
+            str: The extracted text content of the paper
+        """
+        content = await self._fetch_pdf(paper_id)
+        return await asyncio.to_thread(extract_text, content)
     
     async def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
         """
@@ -142,14 +177,27 @@ class MedRxivSearcher(PaperSource):
         """
         pdf_path = f"{save_path}/{paper_id.replace('/', '_')}.pdf"
         if not os.path.exists(pdf_path):
-            pdf_path = await self.download_pdf(paper_id, save_path)
+            await self.download_pdf(paper_id, save_path)
         
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            text = "".join([page async for page in self.read_paper_stream(paper_id, save_path)])
             return text.strip()
         except Exception as e:
-            print(f"Error reading PDF for paper {paper_id}: {e}")
-            return ""
\ No newline at end of file
+            logger.error(f"Error reading PDF for paper {paper_id}: {e}")
+            return ""
+
+    async def read_paper_stream(self, paper_id: str, save_path: str = "./downloads") -> AsyncIterator[str]:
+        """
+        Yield the text of a paper one page at a time.
+        
+        Callers that only need the beginning of a paper can stop early
+        without extracting the remaining pages.
+        """
+        pdf_path = f"{save_path}/{paper_id.replace('/', '_')}.pdf"
+        if not os.path.exists(pdf_path):
+            pdf_path = await self.download_pdf(paper_id, save_path)
+        
+        # PDF parsing is CPU-bound; keep it off the event loop
+        pages = iter_page_texts(pdf_path)
+        while (text := await asyncio.to_thread(next, pages, None)) is not None:
+            yield text + "\n"
\ No newline at end of file
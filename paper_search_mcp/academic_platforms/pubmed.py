@@ -1,10 +1,14 @@
 # paper_search_mcp/sources/pubmed.py
-from typing import List
+from typing import List, Optional
 import httpx
 from xml.etree import ElementTree as ET
 from datetime import datetime
+from ..httpclient import SharedClientMixin
 from ..paper import Paper
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 class PaperSource:
     """Abstract base class for paper sources"""
@@ -17,30 +21,51 @@ class PaperSource:
     def read_paper(self, paper_id: str, save_path: str) -> str:
         raise NotImplementedError
 
-class PubMedSearcher(PaperSource):
+class PubMedSearcher(SharedClientMixin, PaperSource):
     """Searcher for PubMed papers"""
     SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
     FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the searcher.
+
+        Args:
+            client: Optional shared ``httpx.AsyncClient``; when given, it is
+                used for every request instead of a client per call.
+        """
+        self.client = client
+        # An NCBI API key raises the E-utilities rate limit from 3 to 10 req/s
+        self.api_key = os.getenv("NCBI_API_KEY", "").strip() or None
+
+    def _params(self, **params) -> dict:
+        """Return E-utilities parameters, with the API key when one is set."""
+        if self.api_key:
+            params['api_key'] = self.api_key
+        return params
+
     async def search(self, query: str, max_results: int = 10) -> List[Paper]:
-        async with httpx.AsyncClient() as client:
-            search_params = {
-                'db': 'pubmed',
-                'term': query,
-                'retmax': max_results,
-                'retmode': 'xml'
-            }
+        async with self._client_context() as client:
+            search_params = self._params(
+                db='pubmed',
+                term=query,
+                retmax=max_results,
+                retmode='xml'
+            )
             search_response = await client.get(self.SEARCH_URL, params=search_params)
             search_response.raise_for_status()
             search_root = ET.fromstring(search_response.content)
             ids = [id.text for id in search_root.findall('.//Id')]
+            if not ids:
+                return []
             
-            fetch_params = {
-                'db': 'pubmed',
-                'id': ','.join(ids),
-                'retmode': 'xml'
-            }
-            fetch_response = await client.get(self.FETCH_URL, params=fetch_params)
+            # All PMIDs go in one POSTed efetch, which keeps long ID lists
+            # out of the URL
+            fetch_params = self._params(
+                db='pubmed',
+                id=','.join(ids),
+                retmode='xml'
+            )
+            fetch_response = await client.post(self.FETCH_URL, data=fetch_params)
             fetch_response.raise_for_status()
             fetch_root = ET.fromstring(fetch_response.content)
             
@@ -70,7 +95,7 @@ class PubMedSearcher(PaperSource):
                         doi=doi
                     ))
                 except Exception as e:
-                    print(f"Error parsing PubMed article: {e}")
+                    logger.warning(f"Error parsing PubMed article: {e}")
             return papers
 
     def download_pdf(self, paper_id: str, save_path: str) -> str:
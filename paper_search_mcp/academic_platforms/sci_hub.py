@@ -3,32 +3,112 @@
 Simple wrapper adapted from scihub.py for downloading PDFs via Sci-Hub.
 """
 from pathlib import Path
+import asyncio
+import functools
+import os
 import re
 import hashlib
+import html
 import logging
+import ssl
+import tempfile
 from typing import Optional
 
+import certifi
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+_ONCLICK_RE = re.compile(r"location\.href='([^']+)'")
+_VIEW_FRAG_RE = re.compile(r'#view=(.+)')
+_SANITIZE_RE = re.compile(r'[^\w\-_.]')
+_NOT_FOUND_RE = re.compile(rb'article not found', re.IGNORECASE)
+# Fast path: the <embed type="application/pdf"> tags in the raw HTML, and their src
+_EMBED_RE = re.compile(rb'<embed\b[^>]*>', re.IGNORECASE)
+_PDF_TYPE_RE = re.compile(rb'(?<![\w-])type\s*=\s*["\']application/pdf["\']', re.IGNORECASE)
+_SRC_RE = re.compile(rb'(?<![\w-])src\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Only the tags _get_direct_url inspects are kept in the parsed tree
+_LINK_TAGS = SoupStrainer(['embed', 'iframe', 'button', 'a'])
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """Return the SSL context for ``verify``, built once on first use.
+
+    Loading the CA bundle is most of this module's import time, so it waits
+    until a client is actually created. Certificates are verified against
+    the certifi bundle (httpx's default); the unverified context is only
+    used when verify_ssl=False.
+    """
+    if verify:
+        return ssl.create_default_context(cafile=certifi.where())
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _content_hasher():
+    """Return the hash used for the short filename prefix (8 hex chars)."""
+    return hashlib.blake2b(digest_size=4)
 
 
 class SciHubFetcher:
     """Simple Sci-Hub PDF downloader."""
 
-    def __init__(self, base_url: str = "https://sci-hub.se", output_dir: str = "./downloads"):
-        """Initialize with Sci-Hub URL and output directory."""
+    # Bytes read per chunk when streaming PDFs to disk
+    CHUNK_SIZE = 65536
+
+    def __init__(self, base_url: str = "https://sci-hub.se", output_dir: str = "./downloads",
+                 verify_ssl: bool = True):
+        """Initialize with Sci-Hub URL and output directory.
+
+        Set ``verify_ssl=False`` for mirrors with broken certificates.
+        """
         self.base_url = base_url.rstrip("/")
+        self.verify_ssl = verify_ssl
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running event loop.
+
+        Sharing one client between the HTML lookup and the PDF fetch keeps the
+        Sci-Hub connection (and TLS session) alive between the two requests.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                http2=True,
+                verify=_ssl_context(self.verify_ssl),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def __aenter__(self) -> "SciHubFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def download_pdf(self, identifier: str) -> Optional[str]:
         """Download a PDF from Sci-Hub using a DOI, PMID, or URL.
@@ -49,26 +129,42 @@ class SciHubFetcher:
                 logging.error(f"Could not find PDF URL for identifier: {identifier}")
                 return None
 
-            # Download the PDF
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.get(pdf_url, timeout=30)
-                
-                if response.status_code != 200:
-                    logging.error(f"Failed to download PDF, status {response.status_code}")
-                    return None
+            # Stream the PDF to a temporary file, hashing as we go. Anything
+            # failing before the rename (the stream closing included) must not
+            # leave the .part file behind in output_dir.
+            tmp_path = None
+            try:
+                async with self._get_client().stream("GET", pdf_url, timeout=30) as response:
+                    if response.status_code != 200:
+                        logging.error(f"Failed to download PDF, status {response.status_code}")
+                        return None
 
-                if response.headers.get('Content-Type') != 'application/pdf':
-                    logging.error("Response is not a PDF")
-                    return None
+                    if response.headers.get('Content-Type') != 'application/pdf':
+                        logging.error("Response is not a PDF")
+                        return None
 
-                # Generate filename and save
-                filename = self._generate_filename(response, identifier)
+                    hasher = _content_hasher()
+                    fd, tmp_name = tempfile.mkstemp(dir=self.output_dir, suffix='.part')
+                    tmp_path = Path(tmp_name)
+                    with os.fdopen(fd, 'wb') as f:
+                        async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                            f.write(chunk)
+                            hasher.update(chunk)
+
+                # Filenames are content-addressed, so an existing file with the
+                # same name already holds this PDF and the new copy is dropped
+                filename = self._generate_filename(response, identifier, hasher.hexdigest())
                 file_path = self.output_dir / filename
-                
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
-                    
-                return str(file_path)
+                if file_path.exists():
+                    tmp_path.unlink()
+                else:
+                    tmp_path.replace(file_path)
+            except BaseException:
+                if tmp_path is not None:
+                    tmp_path.unlink(missing_ok=True)
+                raise
+
+            return str(file_path)
 
         except Exception as e:
             logging.error(f"Error downloading PDF for {identifier}: {e}")
@@ -84,19 +180,28 @@ class SciHubFetcher:
             # Search on Sci-Hub
             search_url = f"{self.base_url}/{identifier}"
             
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.get(search_url, timeout=20)
-                
-                if response.status_code != 200:
-                    return None
-
-                soup = BeautifulSoup(response.content, 'html.parser')
+            response = await self._get_client().get(search_url, timeout=20)
             
-            # Check for article not found
-            if "article not found" in response.text.lower():
+            if response.status_code != 200:
+                return None
+
+            # Check for article not found before doing any parsing
+            content = response.content
+            if _NOT_FOUND_RE.search(content) is not None:
                 logging.warning("Article not found on Sci-Hub")
                 return None
 
+            # Most pages carry the PDF in an embed tag, so look for one with a
+            # scan over the raw bytes before building a DOM
+            for tag in _EMBED_RE.finditer(content):
+                if _PDF_TYPE_RE.search(tag.group()) is None:
+                    continue
+                match = _SRC_RE.search(tag.group())
+                if match is not None:
+                    return self._abs_url(html.unescape(match.group(1).decode('utf-8', 'replace')))
+
+            soup = BeautifulSoup(content, 'lxml', parse_only=_LINK_TAGS)
+
             # Look for embed tag with PDF (most common in modern Sci-Hub)
             embed = soup.find('embed', {'type': 'application/pdf'})
             logging.debug(f"Found embed tag: {embed}")
@@ -104,55 +209,30 @@ class SciHubFetcher:
                 src = embed.get('src') if hasattr(embed, 'get') else None
                 logging.debug(f"Embed src: {src}")
                 if src and isinstance(src, str):
-                    if src.startswith('//'):
-                        pdf_url = 'https:' + src
-                        logging.debug(f"Returning PDF URL: {pdf_url}")
-                        return pdf_url
-                    elif src.startswith('/'):
-                        pdf_url = self.base_url + src
-                        logging.debug(f"Returning PDF URL: {pdf_url}")
-                        return pdf_url
-                    else:
-                        logging.debug(f"Returning PDF URL: {src}")
-                        return src
+                    return self._abs_url(src)
 
             # Look for iframe with PDF (fallback)
             iframe = soup.find('iframe')
             if iframe:
                 src = iframe.get('src') if hasattr(iframe, 'get') else None
                 if src and isinstance(src, str):
-                    if src.startswith('//'):
-                        return 'https:' + src
-                    elif src.startswith('/'):
-                        return self.base_url + src
-                    else:
-                        return src
+                    return self._abs_url(src)
 
             # Look for download button with onclick
             for button in soup.find_all('button'):
                 onclick = button.get('onclick', '') if hasattr(button, 'get') else ''
                 if isinstance(onclick, str) and 'pdf' in onclick.lower():
                     # Extract URL from onclick JavaScript
-                    url_match = re.search(r"location\.href='([^']+)'", onclick)
+                    url_match = _ONCLICK_RE.search(onclick)
                     if url_match:
-                        url = url_match.group(1)
-                        if url.startswith('//'):
-                            return 'https:' + url
-                        elif url.startswith('/'):
-                            return self.base_url + url
-                        else:
-                            return url
+                        return self._abs_url(url_match.group(1))
 
             # Look for direct download links
             for link in soup.find_all('a'):
                 href = link.get('href', '') if hasattr(link, 'get') else ''
                 if isinstance(href, str) and href and ('pdf' in href.lower() or href.endswith('.pdf')):
-                    if href.startswith('//'):
-                        return 'https:' + href
-                    elif href.startswith('/'):
-                        return self.base_url + href
-                    elif href.startswith('http'):
-                        return href
+                    if href.startswith(('/', 'http')):
+                        return self._abs_url(href)
 
             return None
 
@@ -160,21 +240,35 @@ class SciHubFetcher:
             logging.error(f"Error getting direct URL for {identifier}: {e}")
             return None
 
-    def _generate_filename(self, response, identifier: str) -> str:
-        """Generate a unique filename for the PDF."""
+    def _abs_url(self, src: str) -> str:
+        """Resolve a protocol- or root-relative link against the mirror."""
+        if src.startswith('//'):
+            return 'https:' + src
+        if src.startswith('/'):
+            return self.base_url + src
+        return src
+
+    def _generate_filename(self, response, identifier: str, pdf_hash: Optional[str] = None) -> str:
+        """Generate a unique filename for the PDF.
+
+        ``pdf_hash`` is the short content digest computed while streaming; if
+        omitted it is derived from ``response.content``.
+        """
+        if pdf_hash is None:
+            hasher = _content_hasher()
+            hasher.update(response.content)
+            pdf_hash = hasher.hexdigest()
+
         # Try to get filename from URL
-        url_parts = response.url.split('/')
+        url_parts = str(response.url).split('/')
         if url_parts:
             name = url_parts[-1]
             # Remove view parameters
-            name = re.sub(r'#view=(.+)', '', name)
+            name = _VIEW_FRAG_RE.sub('', name)
             if name.endswith('.pdf'):
-                # Generate hash for uniqueness
-                pdf_hash = hashlib.md5(response.content).hexdigest()[:8]
                 base_name = name[:-4]  # Remove .pdf
                 return f"{pdf_hash}_{base_name}.pdf"
 
         # Fallback: use identifier
-        clean_identifier = re.sub(r'[^\w\-_.]', '_', identifier)
-        pdf_hash = hashlib.md5(response.content).hexdigest()[:8]
+        clean_identifier = _SANITIZE_RE.sub('_', identifier)
         return f"{pdf_hash}_{clean_identifier}.pdf"
\ No newline at end of file
@@ -3,23 +3,30 @@ SearXNG metasearch engine integration for paper-search-mcp.
 Provides privacy-focused search across multiple academic and general search engines.
 """
 import os
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 import httpx
+from ..httpclient import SharedClientMixin
+from ..jsonutil import decode_response
 from ..paper import Paper
+import logging
 
-class SearXNGSearcher:
+logger = logging.getLogger(__name__)
+
+class SearXNGSearcher(SharedClientMixin):
     """Searcher using SearXNG metasearch engine."""
     
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize SearXNG searcher.
         
         Args:
             base_url: SearXNG instance URL (default: from env SEARXNG_URL)
+            client: Optional shared httpx.AsyncClient used for every request
         """
         self.base_url = base_url or os.getenv('SEARXNG_URL', 'http://localhost:8080')
-    
+        self.client = client
+
     async def search(self, query: str, max_results: int = 10, 
                     category: str = 'science') -> List[Paper]:
         """
@@ -40,7 +47,7 @@ class SearXNGSearcher:
             'pageno': 1
         }
         
-        async with httpx.AsyncClient() as client:
+        async with self._client_context() as client:
             try:
                 response = await client.get(
                     f"{self.base_url}/search",
@@ -48,9 +55,9 @@ class SearXNGSearcher:
                     timeout=30.0
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = decode_response(response)
             except httpx.HTTPError as e:
-                print(f"SearXNG search error: {e}")
+                logger.error(f"SearXNG search error: {e}")
                 return []
         
         papers = []
@@ -87,7 +94,7 @@ class SearXNGSearcher:
                     }
                 ))
             except Exception as e:
-                print(f"Error parsing SearXNG result: {e}")
+                logger.warning(f"Error parsing SearXNG result: {e}")
                 continue
         
         return papers
@@ -1,12 +1,16 @@
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import httpx
 from bs4 import BeautifulSoup
-import time
 import random
+from ..httpclient import SharedClientMixin
+from ..jsonutil import decode_response
 from ..paper import Paper
 import logging
-from PyPDF2 import PdfReader
+from ..pdfcache import PdfCache, stream_to_file
+from ..pdftext import extract_paged_text
+from ..ratelimit import retry_delay
 import os
 import re
 
@@ -26,23 +30,29 @@ class PaperSource:
         raise NotImplementedError
 
 
-class SemanticSearcher(PaperSource):
+class SemanticSearcher(SharedClientMixin, PaperSource):
     """Semantic Scholar paper search implementation"""
 
     SEMANTIC_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
     SEMANTIC_BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    # Most IDs the paper/batch endpoint accepts per request
+    BATCH_SIZE = 500
+    # Most PDFs read_papers downloads and parses at once
+    READ_CONCURRENCY = 8
     BROWSERS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
     ]
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, pdf_cache: Optional[PdfCache] = None):
         self.headers = {
             "User-Agent": random.choice(self.BROWSERS),
             "Accept": "text/html,application/xhtml+xml",
             "Accept-Language": "en-US,en;q=0.9",
         }
+        self.client = client
+        self.pdf_cache = pdf_cache
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date from Semantic Scholar format (e.g., '2025-06-02')"""
@@ -149,12 +159,14 @@ class SemanticSearcher(PaperSource):
             return None
         return api_key.strip()
     
-    async def request_api(self, path: str, params: dict) -> dict:
+    async def request_api(self, path: str, params: dict, body: Optional[dict] = None) -> dict:
         """
         Make a request to the Semantic Scholar API with optional API key.
+        
+        A GET request is sent unless ``body`` is given, which is POSTed as JSON.
         """
         max_retries = 3
-        retry_delay = 2  # seconds
+        base_delay = 2  # seconds
         
         for attempt in range(max_retries):
             try:
@@ -164,15 +176,19 @@ class SemanticSearcher(PaperSource):
                     headers["x-api-key"] = api_key
                 url = f"{self.SEMANTIC_BASE_URL}/{path}"
                 
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url, params=params, headers=headers)
+                async with self._client_context() as client:
+                    if body is None:
+                        response = await client.get(url, params=params, headers=headers)
+                    else:
+                        response = await client.post(url, params=params, json=body, headers=headers)
                     
                     # 检查是否是429错误（限流）
                     if response.status_code == 429:
                         if attempt < max_retries - 1:
-                            wait_time = retry_delay * (2 ** attempt)  # 指数退避
-                            logger.warning(f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                            time.sleep(wait_time)
+                            # Retry-After if given, otherwise exponential backoff
+                            wait_time = retry_delay(response, attempt, base_delay)
+                            logger.warning(f"Rate limited (429). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                            await asyncio.sleep(wait_time)
                             continue
                         else:
                             logger.error(f"Rate limited (429) after {max_retries} attempts. Please wait before making more requests.")
@@ -184,9 +200,9 @@ class SemanticSearcher(PaperSource):
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
                     if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
+                        wait_time = retry_delay(e.response, attempt, base_delay)
+                        logger.warning(f"Rate limited (429). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                        await asyncio.sleep(wait_time)
                         continue
                     else:
                         logger.error(f"Rate limited (429) after {max_retries} attempts. Please wait before making more requests.")
@@ -246,7 +262,7 @@ class SemanticSearcher(PaperSource):
                 logger.error(f"Semantic Scholar search failed with status {status_code}")
                 return papers
                 
-            data = response.json()
+            data = decode_response(response)
             results = data['data']
 
             if not results:
@@ -293,19 +309,15 @@ class SemanticSearcher(PaperSource):
                 return f"Error: Could not find PDF URL for paper {paper_id}"
             pdf_url = paper.pdf_url
             
-            async with httpx.AsyncClient() as client:
-                pdf_response = await client.get(pdf_url, timeout=30)
-                pdf_response.raise_for_status()
-                
-                # Create download directory if it doesn't exist
-                os.makedirs(save_path, exist_ok=True)
-                
-                filename = f"semantic_{paper_id.replace('/', '_')}.pdf"
-                pdf_path = os.path.join(save_path, filename)
-                
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_response.content)
-                return pdf_path
+            # Create download directory if it doesn't exist
+            os.makedirs(save_path, exist_ok=True)
+            
+            filename = f"semantic_{paper_id.replace('/', '_')}.pdf"
+            pdf_path = os.path.join(save_path, filename)
+            
+            download = self.pdf_cache.download if self.pdf_cache is not None else stream_to_file
+            async with self._client_context() as client:
+                return await download(client, pdf_url, pdf_path, timeout=30)
         except Exception as e:
             logger.error(f"PDF download error: {e}")
             return f"Error downloading PDF: {e}"
@@ -332,39 +344,27 @@ class SemanticSearcher(PaperSource):
         try:
             # First get paper details to get the PDF URL
             paper = await self.get_paper_details(paper_id)
-            if not paper or not paper.pdf_url:
-                return f"Error: Could not find PDF URL for paper {paper_id}"
-
-            # Download the PDF
-            async with httpx.AsyncClient() as client:
-                pdf_response = await client.get(paper.pdf_url, timeout=30)
-                pdf_response.raise_for_status()
+            return await self._read_pdf(paper, paper_id, save_path)
+        except Exception as e:
+            logger.error(f"Read paper error: {e}")
+            return f"Error reading paper: {e}"
 
-                # Create download directory if it doesn't exist
-                os.makedirs(save_path, exist_ok=True)
+    async def _read_pdf(self, paper: Optional[Paper], paper_id: str, save_path: str) -> str:
+        """Download ``paper``'s PDF and return its text after a metadata header."""
+        if not paper or not paper.pdf_url:
+            return f"Error: Could not find PDF URL for paper {paper_id}"
 
-                # Save the PDF
+        try:
+            # Download the PDF
+            async with self._client_context() as client:
+                # Save the PDF, creating the download directory if needed
                 filename = f"semantic_{paper_id.replace('/', '_')}.pdf"
                 pdf_path = os.path.join(save_path, filename)
+                download = self.pdf_cache.download if self.pdf_cache is not None else stream_to_file
+                await download(client, paper.pdf_url, pdf_path, timeout=30)
 
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_response.content)
-
-                # Extract text using PyPDF2
-                reader = PdfReader(pdf_path)
-                text = ""
-
-                for page_num, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += f"\n--- Page {page_num + 1} ---\n"
-                            text += page_text + "\n"
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to extract text from page {page_num + 1}: {e}"
-                        )
-                        continue
+                # Extract text off the event loop
+                text = await asyncio.to_thread(extract_paged_text, pdf_path)
 
                 if not text.strip():
                     return (
@@ -388,6 +388,75 @@ class SemanticSearcher(PaperSource):
             logger.error(f"Read paper error: {e}")
             return f"Error reading paper: {e}"
 
+    async def read_papers(
+        self, paper_ids: List[str], save_path: str = "./downloads", concurrency: Optional[int] = None
+    ) -> List[str]:
+        """
+        Read several papers, looking up their details in batch requests.
+
+        Args:
+            paper_ids: Paper identifiers in any format accepted by read_paper
+            save_path: Directory to save downloaded PDFs
+            concurrency: Most PDFs downloaded and parsed at once (default:
+                READ_CONCURRENCY); each parse occupies a worker thread
+
+        Returns:
+            List[str]: Extracted text or error message for each ID, in order
+        """
+        papers = await self.get_papers_batch(paper_ids)
+        limit = asyncio.Semaphore(max(concurrency or self.READ_CONCURRENCY, 1))
+
+        async def read(paper: Optional[Paper], paper_id: str) -> str:
+            async with limit:
+                return await self._read_pdf(paper, paper_id, save_path)
+
+        return list(await asyncio.gather(
+            *(read(paper, paper_id) for paper, paper_id in zip(papers, paper_ids))
+        ))
+
+    async def get_papers_batch(self, paper_ids: List[str]) -> List[Optional[Paper]]:
+        """
+        Fetch details for many papers through the paper/batch endpoint.
+
+        IDs are sent BATCH_SIZE at a time, with the batches requested
+        concurrently.
+
+        Args:
+            paper_ids: Paper identifiers in any format accepted by get_paper_details
+
+        Returns:
+            List[Optional[Paper]]: One entry per ID, in order; None where the
+            paper was not found or its batch failed
+        """
+        batches = await asyncio.gather(*(
+            self._fetch_batch(paper_ids[start:start + self.BATCH_SIZE])
+            for start in range(0, len(paper_ids), self.BATCH_SIZE)
+        ))
+        return [paper for batch in batches for paper in batch]
+
+    async def _fetch_batch(self, paper_ids: List[str]) -> List[Optional[Paper]]:
+        """Fetch one paper/batch request of at most BATCH_SIZE IDs."""
+        missing = [None] * len(paper_ids)
+        try:
+            # openAccessPdf supplies the PDF URL that read_papers downloads
+            fields = ["title", "abstract", "year", "citationCount", "authors", "url","publicationDate","externalIds","fieldsOfStudy","openAccessPdf"]
+            params = {
+                "fields": ",".join(fields),
+            }
+            
+            response = await self.request_api("paper/batch", params, body={"ids": paper_ids})
+            
+            # Check for errors
+            if isinstance(response, dict) and "error" in response:
+                logger.error(f"Semantic Scholar API error: {response.get('message', 'Unknown error')}")
+                return missing
+            
+            # Unknown IDs come back as null
+            return [self._parse_paper(item) if item else None for item in decode_response(response)]
+        except Exception as e:
+            logger.error(f"Error fetching paper batch: {e}")
+            return missing
+
     async def get_paper_details(self, paper_id: str) -> Optional[Paper]:
         """
         Fetch detailed information for a specific Semantic Scholar paper
@@ -429,7 +498,7 @@ class SemanticSearcher(PaperSource):
                 logger.error(f"Semantic Scholar paper details fetch failed with status {status_code}")
                 return None
                 
-            results = response.json()
+            results = decode_response(response)
             paper = self._parse_paper(results)
             if paper:
                 return paper
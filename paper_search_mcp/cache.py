@@ -0,0 +1,165 @@
+# paper_search_mcp/cache.py
+"""In-memory LRU cache with per-entry TTLs, optionally backed by JSON files."""
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from . import jsonutil
+
+
+class SearchCache:
+    """
+    LRU cache of JSON-serializable values with a time-to-live per entry.
+
+    When ``directory`` is given each entry is also written to
+    ``<directory>/<sha1(key)>.json``, so a restarted process starts warm. A
+    file's mtime is its write time, which is checked against the TTL on load;
+    expired files are deleted when found, and the oldest are pruned once
+    there are more than ``maxsize``. Async callers use ``aget``/``aset``,
+    which do the file I/O in a worker thread.
+    """
+
+    # Writes between checks of how many files the directory holds
+    PRUNE_EVERY = 64
+
+    def __init__(self, maxsize: int = 2048, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory else None
+        # key -> (expires_at or None, value)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._writes = 0
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a stable cache key from JSON-serializable parts."""
+        # Built on every search call, so through orjson when available; both
+        # encoders give the same compact, key-sorted output
+        return jsonutil.dumps(parts, sort_keys=True).decode("utf-8")
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def _remember(self, key: str, expires_at: Optional[float], value: Any) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _get_memory(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at is None or time.time() < expires_at:
+            self._entries.move_to_end(key)
+            return True, value
+        del self._entries[key]
+        return False, None
+
+    def _read(self, key: str, ttl: Optional[float]):
+        """Return ``(written_at, value)`` for an unexpired entry on disk, else None."""
+        path = self._path(key)
+        try:
+            written_at = path.stat().st_mtime
+            if ttl is not None and time.time() - written_at >= ttl:
+                path.unlink()
+                return None
+            entry = jsonutil.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key:  # hash collision
+            return None
+        return written_at, entry["value"]
+
+    def _loaded(self, key: str, ttl: Optional[float], stored):
+        """Remember what ``_read`` returned and turn it into ``(found, value)``."""
+        if stored is None:
+            return False, None
+        written_at, value = stored
+        self._remember(key, None if ttl is None else written_at + ttl, value)
+        return True, value
+
+    def _write(self, key: str, value: Any, prune: bool) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(jsonutil.dumps({"key": key, "value": value}))
+            os.replace(tmp_path, path)
+            if prune:
+                self._prune()
+        except OSError:
+            # The in-memory entry is still usable
+            pass
+
+    def _prune(self) -> None:
+        """Delete the oldest files while there are more than ``maxsize``."""
+        files = []
+        for path in self.directory.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        files.sort()
+        for _, path in files[:max(0, len(files) - self.maxsize)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _store(self, key: str, value: Any, ttl: Optional[float]) -> bool:
+        """Remember ``value`` in memory; returns whether this write should prune."""
+        self._remember(key, None if ttl is None else time.time() + ttl, value)
+        self._writes += 1
+        return self._writes % self.PRUNE_EVERY == 0
+
+    def get(self, key: str, ttl: Optional[float] = None):
+        """
+        Look up ``key``.
+
+        Args:
+            key: Cache key (see ``make_key``)
+            ttl: Seconds an entry stays valid; used to age entries loaded from disk
+
+        Returns:
+            ``(found, value)``
+        """
+        found, value = self._get_memory(key)
+        if found or self.directory is None:
+            return found, value
+        return self._loaded(key, ttl, self._read(key, ttl))
+
+    async def aget(self, key: str, ttl: Optional[float] = None):
+        """``get`` for async callers: a disk lookup runs in a worker thread."""
+        found, value = self._get_memory(key)
+        if found or self.directory is None:
+            return found, value
+        return self._loaded(key, ttl, await asyncio.to_thread(self._read, key, ttl))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (forever if None)."""
+        prune = self._store(key, value, ttl)
+        if self.directory is not None:
+            self._write(key, value, prune)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """``set`` for async callers: the file is written in a worker thread."""
+        prune = self._store(key, value, ttl)
+        if self.directory is not None:
+            await asyncio.to_thread(self._write, key, value, prune)
+
+    def clear(self) -> int:
+        """Drop every entry, including those on disk. Returns how many were in memory."""
+        count = len(self._entries)
+        self._entries.clear()
+        if self.directory is not None and self.directory.is_dir():
+            for path in self.directory.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        return count
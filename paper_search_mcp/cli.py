@@ -4,25 +4,22 @@ Command-line interface for paper-search-mcp.
 Provides commands for searching and downloading academic papers from multiple sources.
 """
 import asyncio
+import contextlib
+import functools
+import glob
+import importlib
+import importlib.util
 import os
-from typing import Optional
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import json
-
-from .academic_platforms.arxiv import ArxivSearcher
-from .academic_platforms.pubmed import PubMedSearcher
-from .academic_platforms.biorxiv import BioRxivSearcher
-from .academic_platforms.medrxiv import MedRxivSearcher
-from .academic_platforms.google_scholar import GoogleScholarSearcher
-from .academic_platforms.iacr import IACRSearcher
-from .academic_platforms.semantic import SemanticSearcher
-from .academic_platforms.crossref import CrossRefSearcher
-from .academic_platforms.searxng import SearXNGSearcher
-from .knowledge import KnowledgeStore
-from .document_processor import DocumentProcessor, DOCLING_AVAILABLE
+from .eventloop import install_fast_event_loop
+from .paper import Paper
 
 app = typer.Typer(
     name="paper-search",
@@ -30,23 +27,216 @@ app = typer.Typer(
     add_completion=False,
 )
 console = Console()
+err_console = Console(stderr=True)
+
+install_fast_event_loop()
+
+# Source name -> (module, class). Platform modules are imported only when a
+# command actually uses them, which keeps --help and list-sources fast.
+SEARCHER_CLASSES = {
+    "arxiv": (".academic_platforms.arxiv", "ArxivSearcher"),
+    "pubmed": (".academic_platforms.pubmed", "PubMedSearcher"),
+    "biorxiv": (".academic_platforms.biorxiv", "BioRxivSearcher"),
+    "medrxiv": (".academic_platforms.medrxiv", "MedRxivSearcher"),
+    "google-scholar": (".academic_platforms.google_scholar", "GoogleScholarSearcher"),
+    "iacr": (".academic_platforms.iacr", "IACRSearcher"),
+    "semantic": (".academic_platforms.semantic", "SemanticSearcher"),
+    "crossref": (".academic_platforms.crossref", "CrossRefSearcher"),
+    "searxng": (".academic_platforms.searxng", "SearXNGSearcher"),
+}
+
+# Sources each command accepts, fixed at import so commands only do lookups
+SEARCH_SOURCES = tuple(SEARCHER_CLASSES)
+DOWNLOAD_SOURCES = ("arxiv", "biorxiv", "medrxiv", "iacr", "semantic")
+READ_SOURCES = DOWNLOAD_SOURCES
+STORE_SOURCES = ("arxiv", "pubmed", "biorxiv", "medrxiv", "iacr", "semantic")
+
+# Characters of extracted text shown by `read` without --all
+PREVIEW_CHARS = 1000
+
+# Concurrent requests allowed per source, so fan-out stays under upstream
+# rate limits. Google Scholar blocks aggressive clients, so it gets less.
+MAX_CONCURRENCY = int(os.environ.get("PAPER_SEARCH_MAX_CONCURRENCY", "8"))
+_SOURCE_CONCURRENCY = {"google-scholar": 2}
+
+# API hosts of the sources that share the CLI's HTTP client, for prewarming
+SOURCE_HOSTS = {
+    "arxiv": "http://export.arxiv.org",
+    "pubmed": "https://eutils.ncbi.nlm.nih.gov",
+    "biorxiv": "https://api.biorxiv.org",
+    "medrxiv": "https://api.biorxiv.org",
+    "google-scholar": "https://scholar.google.com",
+    "iacr": "https://eprint.iacr.org",
+    "semantic": "https://api.semanticscholar.org",
+    "crossref": "https://api.crossref.org",
+    "searxng": os.getenv("SEARXNG_URL", "http://localhost:8080"),
+}
+
+# Docling pulls in torch and friends, so only probe for it here
+DOCLING_AVAILABLE = importlib.util.find_spec("docling") is not None
+
+# Searchers and the HTTP client they share, created on first use inside
+# a command's event loop and closed when the command finishes
+_http_client = None
+_searchers: Dict[str, object] = {}
+_knowledge_store = None
+_source_limits: Dict[str, asyncio.Semaphore] = {}
+_prewarm_tasks: set = set()
+
+
+def get_http_client():
+    """Return the pooled ``httpx.AsyncClient`` shared by the searchers.
+
+    It negotiates HTTP/2 where the host supports it, multiplexing concurrent
+    requests over one connection, and applies the per-host limits in
+    ``ratelimit.HOST_LIMITS``.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+        from .ratelimit import RateLimitedTransport
+        _http_client = httpx.AsyncClient(
+            transport=RateLimitedTransport(
+                http2=True,
+                pool_limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+            timeout=30,
+        )
+    return _http_client
+
+
+def get_searcher(source: str):
+    """Return the searcher for ``source``, importing and creating it on demand.
+
+    Searchers that would otherwise open a client per request share one
+    pooled ``httpx.AsyncClient``, so repeated requests to the same host reuse
+    the connection.
+    """
+    searcher = _searchers.get(source)
+    if searcher is None:
+        module_name, class_name = SEARCHER_CLASSES[source]
+        searcher_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        searcher = searcher_class(client=get_http_client())
+        _searchers[source] = searcher
+    return searcher
+
+
+def get_knowledge_store():
+    """Return the knowledge store, importing the SurrealDB client on first use."""
+    global _knowledge_store
+    if _knowledge_store is None:
+        from .knowledge import KnowledgeStore
+        _knowledge_store = KnowledgeStore()
+    return _knowledge_store
+
+
+def source_limit(source: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent requests to ``source``."""
+    limit = _source_limits.get(source)
+    if limit is None:
+        limit = _source_limits[source] = asyncio.Semaphore(
+            min(MAX_CONCURRENCY, _SOURCE_CONCURRENCY.get(source, MAX_CONCURRENCY))
+        )
+    return limit
+
+
+async def prewarm(sources: List[str]) -> None:
+    """Start connecting to the hosts that ``sources`` are about to query.
+
+    A short HEAD request per host runs in the background, so DNS lookup and
+    the TCP/TLS handshake overlap with importing and setting up the
+    searchers. The searchers' own requests then reuse the pooled connection.
+    Failures are ignored; the real request reports any problem.
+    """
+    urls = dict.fromkeys(SOURCE_HOSTS[name] for name in sources if name in SOURCE_HOSTS)
+    if not urls:
+        return
+    client = get_http_client()
+    
+    async def warm(url: str) -> None:
+        with contextlib.suppress(Exception):
+            await client.head(url, timeout=2)
+    
+    for url in urls:
+        task = asyncio.create_task(warm(url))
+        _prewarm_tasks.add(task)
+        task.add_done_callback(_prewarm_tasks.discard)
+    # Let the requests start before the caller blocks on imports
+    await asyncio.sleep(0)
+
+
+async def close_searchers() -> None:
+    """Close the shared HTTP client and any per-searcher clients."""
+    global _http_client
+    for task in _prewarm_tasks:
+        task.cancel()
+    await asyncio.gather(*_prewarm_tasks, return_exceptions=True)
+    for searcher in _searchers.values():
+        aclose = getattr(searcher, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    _searchers.clear()
+    _source_limits.clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+
+
+def run_async(coro) -> None:
+    """Run a command coroutine, closing the shared HTTP clients afterwards."""
+    async def runner():
+        try:
+            await coro
+        finally:
+            await close_searchers()
+
+    asyncio.run(runner())
+
+
+def _read_cache_path(source: str, paper_id: str, output_dir: Path) -> Path:
+    """Return the sidecar file holding a paper's full extracted text."""
+    return output_dir / f"{source}_{paper_id.replace('/', '_')}.extracted.txt"
+
 
-# Initialize searchers
-arxiv_searcher = ArxivSearcher()
-pubmed_searcher = PubMedSearcher()
-biorxiv_searcher = BioRxivSearcher()
-medrxiv_searcher = MedRxivSearcher()
-google_scholar_searcher = GoogleScholarSearcher()
-iacr_searcher = IACRSearcher()
-semantic_searcher = SemanticSearcher()
-crossref_searcher = CrossRefSearcher()
-searxng_searcher = SearXNGSearcher()
+def load_cached_text(source: str, paper_id: str, output_dir: Path) -> Optional[str]:
+    """Return previously extracted text, unless a PDF of the paper is newer."""
+    cache_path = _read_cache_path(source, paper_id, output_dir)
+    try:
+        cached_at = cache_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    # Every source names its PDF "<prefix><id with / as _>.pdf"
+    pattern = f"*{glob.escape(paper_id.replace('/', '_'))}.pdf"
+    if any(pdf.stat().st_mtime > cached_at for pdf in output_dir.glob(pattern)):
+        return None
+    return cache_path.read_text(encoding="utf-8")
 
-# Initialize knowledge store
-knowledge_store = KnowledgeStore()
 
-# Initialize document processor if available
-doc_processor = DocumentProcessor() if DOCLING_AVAILABLE else None
+def store_cached_text(source: str, paper_id: str, output_dir: Path, text: str) -> None:
+    """Atomically write a paper's full extracted text next to its PDF."""
+    cache_path = _read_cache_path(source, paper_id, output_dir)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.replace(cache_path)
+
+
+def write_json(data, indent: bool = True) -> None:
+    """Write ``data`` to stdout as JSON, bypassing Rich markup.
+
+    Uses orjson when it is installed, which matters for large Docling results.
+    With ``indent=False`` the output is compact, for piping into other tools.
+    """
+    try:
+        import orjson
+    except ImportError:  # optional: falls back to the stdlib encoder
+        sys.stdout.write(json.dumps(data, indent=2 if indent else None, default=str) + "\n")
+        sys.stdout.flush()
+        return
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, default=str, option=option))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
 
 def display_papers(papers, source: str):
@@ -55,21 +245,24 @@ def display_papers(papers, source: str):
         console.print(f"[yellow]No papers found from {source}[/yellow]")
         return
     
-    table = Table(title=f"Papers from {source}")
+    # Title and authors share the space left by the fixed columns, and Rich
+    # clips them to one line with an ellipsis
+    table = Table(title=f"Papers from {source}", expand=True)
     table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Title", style="green")
-    table.add_column("Authors", style="blue")
-    table.add_column("Year", style="magenta")
+    table.add_column("Title", style="green", ratio=2, overflow="ellipsis", no_wrap=True)
+    table.add_column("Authors", style="blue", ratio=1, overflow="ellipsis", no_wrap=True)
+    table.add_column("Year", style="magenta", no_wrap=True)
     
-    for paper in papers:
-        year = paper.published_date.year if paper.published_date else "N/A"
-        authors = ", ".join(paper.authors[:3]) + ("..." if len(paper.authors) > 3 else "")
-        table.add_row(
+    for row in (
+        (
             paper.paper_id,
-            paper.title[:80] + ("..." if len(paper.title) > 80 else ""),
-            authors[:40] + ("..." if len(authors) > 40 else ""),
-            str(year)
+            paper.title,
+            ", ".join(paper.authors[:3]) + ("..." if len(paper.authors) > 3 else ""),
+            str(paper.published_date.year) if paper.published_date else "N/A",
         )
+        for paper in papers
+    ):
+        table.add_row(*row)
     
     console.print(table)
     console.print(f"\n[green]Found {len(papers)} papers[/green]")
@@ -78,79 +271,79 @@ def display_papers(papers, source: str):
 @app.command()
 def search(
     query: str = typer.Argument(..., help="Search query"),
-    source: str = typer.Option("arxiv", "--source", "-s", help="Source to search: arxiv, pubmed, biorxiv, medrxiv, google-scholar, iacr, semantic, crossref"),
-    max_results: int = typer.Option(10, "--max-results", "-n", help="Maximum number of results"),
+    source: str = typer.Option("arxiv", "--source", "-s", help=f"Source(s) to search, comma-separated: {', '.join(SEARCH_SOURCES)}"),
+    max_results: int = typer.Option(10, "--max-results", "-n", help="Maximum number of results per source"),
     year: Optional[int] = typer.Option(None, "--year", "-y", help="Filter by publication year (if supported)"),
+    json_out: bool = typer.Option(False, "--json", help="Print results as JSON instead of a table"),
 ):
-    """Search for academic papers from various sources."""
+    """Search for academic papers from one or more sources."""
+    sources = list(dict.fromkeys(name.strip() for name in source.split(",") if name.strip()))
+    
+    async def search_source(name: str):
+        searcher = get_searcher(name)
+        async with source_limit(name):
+            if year and name in ["crossref"]:
+                return await searcher.search(query, year=year, max_results=max_results)
+            return await searcher.search(query, max_results=max_results)
     
     async def run_search():
-        searchers = {
-            "arxiv": arxiv_searcher,
-            "pubmed": pubmed_searcher,
-            "biorxiv": biorxiv_searcher,
-            "medrxiv": medrxiv_searcher,
-            "google-scholar": google_scholar_searcher,
-            "iacr": iacr_searcher,
-            "semantic": semantic_searcher,
-            "crossref": crossref_searcher,
-            "searxng": searxng_searcher,
-        }
-        
-        if source not in searchers:
-            console.print(f"[red]Error: Unknown source '{source}'[/red]")
-            console.print(f"Available sources: {', '.join(searchers.keys())}")
+        unknown = [name for name in sources if name not in SEARCH_SOURCES]
+        if unknown or not sources:
+            console.print(f"[red]Error: Unknown source '{', '.join(unknown) or source}'[/red]")
+            console.print(f"Available sources: {', '.join(SEARCH_SOURCES)}")
             raise typer.Exit(1)
         
-        searcher = searchers[source]
+        await prewarm(sources)
+        # Query all sources concurrently; a failing source does not cancel
+        # the others
+        searches = asyncio.gather(*(search_source(name) for name in sources), return_exceptions=True)
+        if json_out:
+            results = await searches
+        else:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                progress.add_task(f"Searching {', '.join(sources)}...", total=None)
+                results = await searches
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task(f"Searching {source}...", total=None)
-            
-            try:
-                if year and source in ["crossref"]:
-                    papers = await searcher.search(query, year=year, max_results=max_results)
-                else:
-                    papers = await searcher.search(query, max_results=max_results)
-                
-                display_papers(papers, source)
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
-                raise typer.Exit(1)
+        failed = False
+        papers = []
+        for name, result in zip(sources, results):
+            if isinstance(result, Exception):
+                (err_console if json_out else console).print(f"[red]Error ({name}): {result}[/red]")
+                failed = True
+            elif json_out:
+                papers.extend(Paper.to_dicts(result))
+            else:
+                display_papers(result, name)
+        if json_out:
+            write_json(papers, indent=False)
+        if failed:
+            raise typer.Exit(1)
     
-    asyncio.run(run_search())
+    run_async(run_search())
 
 
 @app.command()
 def download(
     paper_id: str = typer.Argument(..., help="Paper ID to download"),
-    source: str = typer.Option("arxiv", "--source", "-s", help="Source: arxiv, biorxiv, medrxiv, iacr, semantic"),
-    output_dir: str = typer.Option("./downloads", "--output", "-o", help="Output directory"),
+    source: str = typer.Option("arxiv", "--source", "-s", help=f"Source: {', '.join(DOWNLOAD_SOURCES)}"),
+    output_dir: Path = typer.Option(Path("./downloads"), "--output", "-o", help="Output directory"),
 ):
     """Download a paper PDF by its ID."""
     
     async def run_download():
-        searchers = {
-            "arxiv": arxiv_searcher,
-            "biorxiv": biorxiv_searcher,
-            "medrxiv": medrxiv_searcher,
-            "iacr": iacr_searcher,
-            "semantic": semantic_searcher,
-        }
-        
-        if source not in searchers:
+        if source not in DOWNLOAD_SOURCES:
             console.print(f"[red]Error: Unknown source '{source}'[/red]")
-            console.print(f"Available sources for download: {', '.join(searchers.keys())}")
+            console.print(f"Available sources for download: {', '.join(DOWNLOAD_SOURCES)}")
             raise typer.Exit(1)
         
-        searcher = searchers[source]
+        searcher = get_searcher(source)
         
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
         
         with Progress(
             SpinnerColumn(),
@@ -160,42 +353,35 @@ def download(
             progress.add_task(f"Downloading paper {paper_id}...", total=None)
             
             try:
-                pdf_path = await searcher.download_pdf(paper_id, output_dir)
+                async with source_limit(source):
+                    pdf_path = await searcher.download_pdf(paper_id, output_dir)
                 console.print(f"[green]✓ Downloaded to: {pdf_path}[/green]")
             except Exception as e:
                 console.print(f"[red]Error downloading paper: {e}[/red]")
                 raise typer.Exit(1)
     
-    asyncio.run(run_download())
+    run_async(run_download())
 
 
 @app.command()
 def read(
     paper_id: str = typer.Argument(..., help="Paper ID to read"),
-    source: str = typer.Option("arxiv", "--source", "-s", help="Source: arxiv, biorxiv, medrxiv, iacr, semantic"),
-    output_dir: str = typer.Option("./downloads", "--output", "-o", help="Directory where PDF is/will be saved"),
-    show_all: bool = typer.Option(False, "--all", "-a", help="Show full text (default: first 1000 chars)"),
+    source: str = typer.Option("arxiv", "--source", "-s", help=f"Source: {', '.join(READ_SOURCES)}"),
+    output_dir: Path = typer.Option(Path("./downloads"), "--output", "-o", help="Directory where PDF is/will be saved"),
+    show_all: bool = typer.Option(False, "--all", "-a", help=f"Show full text (default: first {PREVIEW_CHARS} chars)"),
 ):
     """Read and extract text from a paper PDF."""
     
     async def run_read():
-        searchers = {
-            "arxiv": arxiv_searcher,
-            "biorxiv": biorxiv_searcher,
-            "medrxiv": medrxiv_searcher,
-            "iacr": iacr_searcher,
-            "semantic": semantic_searcher,
-        }
-        
-        if source not in searchers:
+        if source not in READ_SOURCES:
             console.print(f"[red]Error: Unknown source '{source}'[/red]")
-            console.print(f"Available sources for reading: {', '.join(searchers.keys())}")
+            console.print(f"Available sources for reading: {', '.join(READ_SOURCES)}")
             raise typer.Exit(1)
         
-        searcher = searchers[source]
+        searcher = get_searcher(source)
         
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
         
         with Progress(
             SpinnerColumn(),
@@ -205,124 +391,173 @@ def read(
             progress.add_task(f"Reading paper {paper_id}...", total=None)
             
             try:
-                text = await searcher.read_paper(paper_id, output_dir)
+                truncated = False
+                if hasattr(searcher, "read_paper_stream"):
+                    text = load_cached_text(source, paper_id, output_dir)
+                    if text is None:
+                        # Stop extracting pages once the preview is full
+                        pages = []
+                        length = 0
+                        async with contextlib.aclosing(searcher.read_paper_stream(paper_id, output_dir)) as stream:
+                            async for page in stream:
+                                pages.append(page)
+                                length += len(page)
+                                if not show_all and length > PREVIEW_CHARS:
+                                    truncated = True
+                                    break
+                        text = "".join(pages).strip()
+                        # Only complete extractions are reusable
+                        if text and not truncated:
+                            store_cached_text(source, paper_id, output_dir, text)
+                else:
+                    text = await searcher.read_paper(paper_id, output_dir)
+                
                 if text:
                     if show_all:
                         console.print(text)
                     else:
-                        console.print(text[:1000])
-                        if len(text) > 1000:
-                            console.print(f"\n[dim]... ({len(text) - 1000} more characters. Use --all to see full text)[/dim]")
-                    console.print(f"\n[green]✓ Total length: {len(text)} characters[/green]")
+                        console.print(text[:PREVIEW_CHARS])
+                        if truncated:
+                            console.print("\n[dim]... (more text available. Use --all to see full text)[/dim]")
+                        elif len(text) > PREVIEW_CHARS:
+                            console.print(f"\n[dim]... ({len(text) - PREVIEW_CHARS} more characters. Use --all to see full text)[/dim]")
+                    if not truncated:
+                        console.print(f"\n[green]✓ Total length: {len(text)} characters[/green]")
                 else:
                     console.print("[yellow]No text extracted from paper[/yellow]")
             except Exception as e:
                 console.print(f"[red]Error reading paper: {e}[/red]")
                 raise typer.Exit(1)
     
-    asyncio.run(run_read())
+    run_async(run_read())
 
 
-@app.command()
-def list_sources():
-    """List all available paper sources."""
-    sources = [
-        ("arxiv", "arXiv - Open access preprint repository", "search, download, read"),
-        ("pubmed", "PubMed - Biomedical literature database", "search"),
-        ("biorxiv", "bioRxiv - Preprint server for biology", "search, download, read"),
-        ("medrxiv", "medRxiv - Preprint server for health sciences", "search, download, read"),
-        ("google-scholar", "Google Scholar - Academic search engine", "search"),
-        ("iacr", "IACR ePrint - Cryptology preprint archive", "search, download, read"),
-        ("semantic", "Semantic Scholar - AI-powered research tool", "search, download, read"),
-        ("crossref", "CrossRef - Citation linking service", "search"),
-        ("searxng", "SearXNG - Privacy-focused metasearch engine", "search"),
-    ]
-    
+SOURCE_DESCRIPTIONS = (
+    ("arxiv", "arXiv - Open access preprint repository", "search, download, read"),
+    ("pubmed", "PubMed - Biomedical literature database", "search"),
+    ("biorxiv", "bioRxiv - Preprint server for biology", "search, download, read"),
+    ("medrxiv", "medRxiv - Preprint server for health sciences", "search, download, read"),
+    ("google-scholar", "Google Scholar - Academic search engine", "search"),
+    ("iacr", "IACR ePrint - Cryptology preprint archive", "search, download, read"),
+    ("semantic", "Semantic Scholar - AI-powered research tool", "search, download, read"),
+    ("crossref", "CrossRef - Citation linking service", "search"),
+    ("searxng", "SearXNG - Privacy-focused metasearch engine", "search"),
+)
+
+
+@functools.cache
+def _sources_table() -> Table:
+    """Build the list-sources table once; its contents never change."""
     table = Table(title="Available Paper Sources")
     table.add_column("Source", style="cyan", no_wrap=True)
     table.add_column("Description", style="green")
     table.add_column("Capabilities", style="blue")
     
-    for source, description, capabilities in sources:
+    for source, description, capabilities in SOURCE_DESCRIPTIONS:
         table.add_row(source, description, capabilities)
-    
-    console.print(table)
+    return table
+
+
+@app.command()
+def list_sources():
+    """List all available paper sources."""
+    console.print(_sources_table())
 
 
 # Knowledge management commands
 @app.command()
 def knowledge_store(
-    paper_id: str = typer.Argument(..., help="Paper ID to store in knowledge graph"),
-    source: str = typer.Option("arxiv", "--source", "-s", help="Source platform"),
+    paper_ids: Optional[List[str]] = typer.Argument(None, help="Paper ID(s) to store in knowledge graph"),
+    source: str = typer.Option("arxiv", "--source", "-s", help=f"Source platform: {', '.join(STORE_SOURCES)}"),
+    ids_file: Optional[Path] = typer.Option(None, "--file", "-f", help="File with one paper ID per line"),
     max_results: int = typer.Option(1, help="Fetch this paper"),
 ):
-    """Store a paper in the knowledge graph database."""
+    """Store one or more papers in the knowledge graph database."""
+    ids = list(paper_ids or [])
+    if ids_file is not None:
+        ids.extend(line.strip() for line in ids_file.read_text().splitlines() if line.strip())
+    
     async def run_store():
-        searchers = {
-            "arxiv": arxiv_searcher,
-            "pubmed": pubmed_searcher,
-            "biorxiv": biorxiv_searcher,
-            "medrxiv": medrxiv_searcher,
-            "iacr": iacr_searcher,
-            "semantic": semantic_searcher,
-        }
-        
-        searcher = searchers.get(source)
-        if not searcher:
+        if source not in STORE_SOURCES:
             console.print(f"[red]Source {source} not supported for storing[/red]")
             return
+        if not ids:
+            console.print("[red]No paper IDs given[/red]")
+            return
+        
+        await prewarm([source])
+        searcher = get_searcher(source)
+        
+        async def fetch(paper_id: str):
+            async with source_limit(source):
+                return await searcher.search(paper_id, max_results=1)
         
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-            progress.add_task(f"Fetching and storing paper {paper_id}...", total=None)
+            progress.add_task(f"Fetching and storing {len(ids)} paper(s)...", total=None)
             
             try:
-                # Search for the paper
-                papers = await searcher.search(paper_id, max_results=1)
+                # Fetch all papers concurrently, bounded per source
+                results = await asyncio.gather(*(fetch(paper_id) for paper_id in ids), return_exceptions=True)
+                
+                papers = []
+                for paper_id, result in zip(ids, results):
+                    if isinstance(result, Exception):
+                        console.print(f"[red]Error fetching {paper_id}: {result}[/red]")
+                    elif not result:
+                        console.print(f"[yellow]Paper {paper_id} not found[/yellow]")
+                    else:
+                        papers.append(result[0].to_dict())
                 if not papers:
-                    console.print(f"[yellow]Paper {paper_id} not found[/yellow]")
                     return
                 
-                paper = papers[0]
-                paper_data = paper.to_dict()
-                
-                # Store in knowledge graph
-                record_id = await knowledge_store.store_paper(paper_data)
-                console.print(f"[green]✓ Paper stored with ID: {record_id}[/green]")
+                # Store in knowledge graph with one batched insert
+                record_ids = await get_knowledge_store().store_papers(papers)
+                for record_id in record_ids:
+                    console.print(f"[green]✓ Paper stored with ID: {record_id}[/green]")
                 
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
     
-    asyncio.run(run_store())
+    run_async(run_store())
 
 
 @app.command()
 def knowledge_search(
     query: str = typer.Argument(..., help="Search query"),
     limit: int = typer.Option(10, "--limit", "-l", help="Maximum results"),
+    json_out: bool = typer.Option(False, "--json", help="Print results as JSON instead of a table"),
 ):
     """Search papers in the knowledge graph."""
     async def run_search():
+        if json_out:
+            try:
+                papers = await get_knowledge_store().search_papers(query, limit)
+            except Exception as e:
+                err_console.print(f"[red]Error: {e}[/red]")
+                raise typer.Exit(1)
+            write_json(papers, indent=False)
+            return
+        
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
             progress.add_task("Searching knowledge graph...", total=None)
             
             try:
-                papers = await knowledge_store.search_papers(query, limit)
+                papers = await get_knowledge_store().search_papers(query, limit)
                 
                 if not papers:
                     console.print("[yellow]No papers found in knowledge graph[/yellow]")
                     return
                 
-                table = Table(title=f"Knowledge Graph Results for '{query}'")
-                table.add_column("Paper ID", style="cyan")
-                table.add_column("Title", style="green")
-                table.add_column("Source", style="blue")
+                table = Table(title=f"Knowledge Graph Results for '{query}'", expand=True)
+                table.add_column("Paper ID", style="cyan", no_wrap=True)
+                table.add_column("Title", style="green", ratio=1, overflow="ellipsis", no_wrap=True)
+                table.add_column("Source", style="blue", no_wrap=True)
                 
-                for paper in papers:
-                    table.add_row(
-                        paper.get('paper_id', 'N/A'),
-                        paper.get('title', 'Untitled')[:60] + "...",
-                        paper.get('source', 'unknown')
-                    )
+                for row in (
+                    (paper.get('paper_id', 'N/A'), paper.get('title', 'Untitled'), paper.get('source', 'unknown'))
+                    for paper in papers
+                ):
+                    table.add_row(*row)
                 
                 console.print(table)
                 console.print(f"[green]Found {len(papers)} papers[/green]")
@@ -330,7 +565,7 @@ def knowledge_search(
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
     
-    asyncio.run(run_search())
+    run_async(run_search())
 
 
 @app.command()
@@ -338,7 +573,7 @@ def knowledge_stats():
     """Get statistics about the knowledge graph."""
     async def run_stats():
         try:
-            stats = await knowledge_store.get_knowledge_stats()
+            stats = await get_knowledge_store().get_knowledge_stats()
             
             console.print("\n[bold cyan]Knowledge Graph Statistics[/bold cyan]\n")
             console.print(f"  Papers:        {stats.get('papers', 0)}")
@@ -348,43 +583,69 @@ def knowledge_stats():
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
     
-    asyncio.run(run_stats())
+    run_async(run_stats())
 
 
 # Document processing commands
 @app.command()
 def process_pdf(
-    pdf_path: str = typer.Argument(..., help="Path to PDF file"),
+    pdf_paths: List[str] = typer.Argument(..., help="Path(s) to PDF files"),
     output_format: str = typer.Option("markdown", "--format", "-f", help="Output format: markdown, json"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Worker processes for multiple PDFs (default: one per CPU)"),
+    output_parquet: Optional[Path] = typer.Option(None, "--output-parquet", help="Write results to a Parquet file instead of printing them"),
 ):
-    """Process a PDF with advanced Docling parser."""
-    if not doc_processor:
+    """Process one or more PDFs with advanced Docling parser."""
+    if not DOCLING_AVAILABLE:
         console.print("[red]Docling not available. Install with: pip install docling[/red]")
         return
     
+    from .document_processor import (
+        DocumentProcessor,
+        iter_processed_pdfs,
+        process_pdfs_parallel,
+        write_results_parquet,
+    )
+    
+    def show_result(result):
+        console.print("\n[bold cyan]Extracted Text (Markdown):[/bold cyan]\n")
+        console.print(result.get('text', '')[:2000])
+        if len(result.get('text', '')) > 2000:
+            console.print("\n[dim]... (truncated)[/dim]")
+        
+        console.print(f"\n[green]✓ Metadata:[/green]")
+        for key, value in result.get('metadata', {}).items():
+            console.print(f"  {key}: {value}")
+    
     async def run_process():
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-            progress.add_task(f"Processing {pdf_path}...", total=None)
+            progress.add_task(f"Processing {', '.join(pdf_paths)}...", total=None)
             
             try:
-                result = await doc_processor.process_pdf(pdf_path)
-                
-                if output_format == "json":
-                    console.print(json.dumps(result, indent=2, default=str))
+                if output_parquet is not None:
+                    # Results go to disk as they complete instead of piling up
+                    count = await write_results_parquet(
+                        iter_processed_pdfs(pdf_paths, max_workers=workers), str(output_parquet)
+                    )
+                    console.print(f"[green]✓ Wrote {count} document(s) to {output_parquet}[/green]")
+                    return
+                if len(pdf_paths) == 1:
+                    results = [await DocumentProcessor().process_pdf(pdf_paths[0])]
                 else:
-                    console.print("\n[bold cyan]Extracted Text (Markdown):[/bold cyan]\n")
-                    console.print(result.get('text', '')[:2000])
-                    if len(result.get('text', '')) > 2000:
-                        console.print("\n[dim]... (truncated)[/dim]")
-                    
-                    console.print(f"\n[green]✓ Metadata:[/green]")
-                    for key, value in result.get('metadata', {}).items():
-                        console.print(f"  {key}: {value}")
-                
+                    # Docling is CPU-bound; spread the files over processes
+                    results = await process_pdfs_parallel(pdf_paths, max_workers=workers)
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
+                return
+        
+        if output_format == "json":
+            write_json(results[0] if len(results) == 1 else dict(zip(pdf_paths, results)))
+        else:
+            for path, result in zip(pdf_paths, results):
+                if len(pdf_paths) > 1:
+                    console.print(f"\n[bold]{path}[/bold]")
+                show_result(result)
     
-    asyncio.run(run_process())
+    run_async(run_process())
 
 
 if __name__ == "__main__":
@@ -2,16 +2,22 @@
 Document processing module using Docling for paper-search-mcp.
 Provides advanced PDF parsing, structure extraction, and text processing.
 """
+import asyncio
+import logging
+import multiprocessing
 import os
-from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 try:
     from docling.document_converter import DocumentConverter
     DOCLING_AVAILABLE = True
 except ImportError:
     DOCLING_AVAILABLE = False
-    print("Docling not available. Install with: pip install docling")
+    logger.warning("Docling not available. Install with: pip install docling")
 
 class DocumentProcessor:
     """
@@ -40,8 +46,8 @@ class DocumentProcessor:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         try:
-            # Convert document
-            result = self.converter.convert(pdf_path)
+            # Convert document; conversion is CPU-bound, so off the event loop
+            result = await asyncio.to_thread(self.converter.convert, pdf_path)
             doc = result.document
             
             # Extract structured information
@@ -65,7 +71,7 @@ class DocumentProcessor:
             return processed_data
             
         except Exception as e:
-            print(f"Error processing PDF with Docling: {e}")
+            logger.error(f"Error processing PDF with Docling: {e}")
             # Fallback to basic text extraction
             return await self._fallback_extraction(pdf_path)
     
@@ -81,7 +87,7 @@ class DocumentProcessor:
                         'content': getattr(section, 'text', '')
                     })
         except Exception as e:
-            print(f"Error extracting sections: {e}")
+            logger.error(f"Error extracting sections: {e}")
         return sections
     
     def _extract_tables(self, doc) -> list:
@@ -96,7 +102,7 @@ class DocumentProcessor:
                         'page': getattr(table, 'page', 0)
                     })
         except Exception as e:
-            print(f"Error extracting tables: {e}")
+            logger.error(f"Error extracting tables: {e}")
         return tables
     
     def _extract_figures(self, doc) -> list:
@@ -110,7 +116,7 @@ class DocumentProcessor:
                         'page': getattr(figure, 'page', 0)
                     })
         except Exception as e:
-            print(f"Error extracting figures: {e}")
+            logger.error(f"Error extracting figures: {e}")
         return figures
     
     def _extract_references(self, doc) -> list:
@@ -120,24 +126,22 @@ class DocumentProcessor:
             if hasattr(doc, 'references'):
                 references = [str(ref) for ref in doc.references]
         except Exception as e:
-            print(f"Error extracting references: {e}")
+            logger.error(f"Error extracting references: {e}")
         return references
     
     async def _fallback_extraction(self, pdf_path: str) -> Dict:
         """Fallback to basic PDF text extraction."""
-        from PyPDF2 import PdfReader
+        from .pdftext import iter_page_texts
         
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            pages = await asyncio.to_thread(list, iter_page_texts(pdf_path))
+            text = "".join(page + "\n" for page in pages)
             
             return {
                 'text': text.strip(),
                 'metadata': {
                     'title': '',
-                    'num_pages': len(reader.pages),
+                    'num_pages': len(pages),
                     'has_tables': False,
                     'has_figures': False,
                 },
@@ -151,7 +155,7 @@ class DocumentProcessor:
                 'extraction_method': 'fallback'
             }
         except Exception as e:
-            print(f"Fallback extraction failed: {e}")
+            logger.error(f"Fallback extraction failed: {e}")
             return {
                 'text': '',
                 'metadata': {},
@@ -164,16 +168,19 @@ class DocumentProcessor:
         """
         Process a document from URL.
         
+        Docling fetches the document into memory itself, so nothing is
+        written to disk.
+        
         Args:
             url: URL to document
-            output_dir: Directory to save temporary files
+            output_dir: Unused; accepted for compatibility
             
         Returns:
             Processed document data
         """
         try:
             # Docling can process URLs directly
-            result = self.converter.convert(url)
+            result = await asyncio.to_thread(self.converter.convert, url)
             doc = result.document
             
             return {
@@ -185,7 +192,7 @@ class DocumentProcessor:
                 'format': 'markdown'
             }
         except Exception as e:
-            print(f"Error processing URL with Docling: {e}")
+            logger.error(f"Error processing URL with Docling: {e}")
             return {
                 'text': '',
                 'metadata': {'source_url': url},
@@ -214,3 +221,199 @@ class DocumentProcessor:
             return json.dumps(doc_data, indent=2)
         else:
             return doc_data.get('text', '')
+
+
+# Per-process DocumentProcessor used by process_pdfs_parallel workers, so
+# each worker loads the Docling models once rather than once per file
+_worker_processor: Optional[DocumentProcessor] = None
+
+
+def _init_worker() -> None:
+    global _worker_processor
+    _worker_processor = DocumentProcessor()
+
+
+def _process_pdf_in_worker(pdf_path: str) -> Tuple[str, Dict]:
+    return pdf_path, asyncio.run(_worker_processor.process_pdf(pdf_path))
+
+
+def _process_url_in_worker(url: str, output_dir: str) -> Dict:
+    return asyncio.run(_worker_processor.process_url(url, output_dir))
+
+
+# Long-lived pool for single documents, so repeated calls reuse workers
+# that already loaded the models. Each worker holds its own copy of the
+# Docling models, so only a few run at once.
+POOL_WORKERS = max(1, int(os.environ.get("PAPER_SEARCH_DOCLING_WORKERS", "2")))
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Spawned rather than forked: the server has threads running (to_thread
+        # workers, the log listener) that a forked child would inherit mid-call
+        _pool = ProcessPoolExecutor(
+            max_workers=POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _pool
+
+
+async def process_pdf_in_pool(pdf_path: str) -> Dict:
+    """
+    Process one PDF in a worker process, keeping the event loop free.
+    
+    Args:
+        pdf_path: Path to PDF file
+        
+    Returns:
+        Processed document data, as from ``DocumentProcessor.process_pdf``
+    """
+    if not DOCLING_AVAILABLE:
+        raise ImportError("Docling is required for document processing")
+    if not os.path.exists(pdf_path):
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    _, result = await asyncio.get_running_loop().run_in_executor(_get_pool(), _process_pdf_in_worker, pdf_path)
+    return result
+
+
+async def process_url_in_pool(url: str, output_dir: str = "./downloads") -> Dict:
+    """
+    Process a document from URL in a worker process, keeping the event loop free.
+    
+    Args:
+        url: URL to document
+        output_dir: Unused; accepted for compatibility
+        
+    Returns:
+        Processed document data, as from ``DocumentProcessor.process_url``
+    """
+    if not DOCLING_AVAILABLE:
+        raise ImportError("Docling is required for document processing")
+    return await asyncio.get_running_loop().run_in_executor(_get_pool(), _process_url_in_worker, url, output_dir)
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes started by ``process_*_in_pool``."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def iter_processed_pdfs(pdf_paths: List[str], max_workers: Optional[int] = None) -> AsyncIterator[Tuple[str, Dict]]:
+    """
+    Process PDFs in parallel worker processes, yielding results as they finish.
+    
+    Docling's layout analysis is CPU-bound, so documents are spread across
+    processes instead of threads. Consumers can handle (and drop) each
+    result before the rest are done, which bounds memory on large batches.
+    
+    Args:
+        pdf_paths: Paths to PDF files
+        max_workers: Worker process count (default: one per CPU, capped at
+            the number of files)
+        
+    Yields:
+        ``(pdf_path, processed document data)`` in completion order
+    """
+    if not DOCLING_AVAILABLE:
+        raise ImportError("Docling is required for document processing")
+    
+    max_workers = max_workers or min(len(pdf_paths), os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    # Spawned for the same reason as _get_pool's workers (callers such as the
+    # CLI have threads running)
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+    try:
+        futures = [loop.run_in_executor(pool, _process_pdf_in_worker, path) for path in pdf_paths]
+        for next_done in asyncio.as_completed(futures):
+            yield await next_done
+    finally:
+        # Returns at once, so a consumer that stops early (or fails) does not
+        # block the event loop until the remaining documents are done
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def process_pdfs_parallel(pdf_paths: List[str], max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Process several PDFs in parallel worker processes.
+    
+    Args:
+        pdf_paths: Paths to PDF files
+        max_workers: Worker process count (default: one per CPU, capped at
+            the number of files)
+        
+    Returns:
+        Processed document data, in the same order as ``pdf_paths``
+    """
+    results = {path: result async for path, result in iter_processed_pdfs(pdf_paths, max_workers)}
+    return [results[path] for path in pdf_paths]
+
+
+async def write_results_parquet(results: AsyncIterator[Tuple[str, Dict]], output_path: str,
+                                batch_size: int = 64) -> int:
+    """
+    Stream processed documents into a Parquet file.
+    
+    Rows are ``(path, text, format, metadata, structure)`` with the last two
+    JSON-encoded. Every ``batch_size`` documents are flushed as a row group,
+    so only one batch is held in memory. The file is written under a
+    temporary name and moved into place once complete.
+    
+    Args:
+        results: ``(pdf_path, processed document data)`` pairs
+        output_path: Destination ``.parquet`` file
+        batch_size: Documents per row group
+        
+    Returns:
+        Number of documents written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet output. Install with: pip install pyarrow")
+    import json
+    
+    schema = pa.schema([
+        ('path', pa.string()),
+        ('text', pa.string()),
+        ('format', pa.string()),
+        ('metadata', pa.string()),
+        ('structure', pa.string()),
+    ])
+    tmp_path = f"{output_path}.tmp"
+    batch = {name: [] for name in schema.names}
+    written = 0
+    
+    def flush(writer):
+        writer.write_table(pa.Table.from_pydict(batch, schema=schema))
+        for column in batch.values():
+            column.clear()
+    
+    try:
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            async for path, result in results:
+                batch['path'].append(path)
+                batch['text'].append(result.get('text', ''))
+                batch['format'].append(result.get('format', ''))
+                batch['metadata'].append(json.dumps(result.get('metadata', {}), default=str))
+                batch['structure'].append(json.dumps(result.get('structure', {}), default=str))
+                written += 1
+                if written % batch_size == 0:
+                    flush(writer)
+            if batch['path']:
+                flush(writer)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return written
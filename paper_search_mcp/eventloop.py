@@ -0,0 +1,16 @@
+# paper_search_mcp/eventloop.py
+"""Event loop selection shared by the server and the CLI."""
+import asyncio
+import sys
+
+
+def install_fast_event_loop() -> None:
+    """Use uvloop (winloop on Windows) for new event loops when it is installed."""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:  # optional: keeps the default asyncio loop
+        return
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
@@ -0,0 +1,23 @@
+# paper_search_mcp/httpclient.py
+"""HTTP client handling shared by the platform searchers."""
+import contextlib
+from typing import AsyncContextManager, Optional
+
+import httpx
+
+
+class SharedClientMixin:
+    """
+    For searchers that send their requests through ``self.client``.
+
+    The server injects one pooled ``httpx.AsyncClient`` there; a searcher
+    used on its own (``client=None``) opens a client per call instead.
+    """
+
+    client: Optional[httpx.AsyncClient]
+
+    def _client_context(self) -> AsyncContextManager[httpx.AsyncClient]:
+        """Return the shared client if one was injected, else a one-off client."""
+        if self.client is not None:
+            return contextlib.nullcontext(self.client)
+        return httpx.AsyncClient()
@@ -0,0 +1,33 @@
+# paper_search_mcp/jsonutil.py
+"""JSON encoding and decoding through orjson when it is installed."""
+import json
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Decode a UTF-8 JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON; unknown types become strings."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj, default=str, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def decode_response(response: httpx.Response) -> Any:
+    """Decode a JSON response body; errors are ``ValueError`` either way."""
+    return loads(response.content)
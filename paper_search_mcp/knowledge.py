@@ -100,6 +100,32 @@ class KnowledgeStore:
         result = await self.db.create('paper', paper_data)
         return result[0]['id'] if result else None
     
+    async def store_papers(self, papers: List[Dict]) -> List[str]:
+        """
+        Store several papers in the knowledge graph with a single insert.
+        
+        Args:
+            papers: List of dictionaries with paper information
+            
+        Returns:
+            Record IDs of stored papers
+        """
+        if not papers:
+            return []
+        
+        await self.connect()
+        
+        # Add storage timestamp
+        stored_at = datetime.utcnow().isoformat()
+        for paper_data in papers:
+            paper_data['stored_at'] = stored_at
+        
+        # Store all papers in one round-trip
+        result = await self.db.insert('paper', papers)
+        if isinstance(result, dict):
+            result = [result]
+        return [record['id'] for record in result] if result else []
+    
     async def get_paper(self, paper_id: str) -> Optional[Dict]:
         """
         Retrieve a paper by its ID.
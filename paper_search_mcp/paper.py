@@ -1,9 +1,9 @@
 # paper_search_mcp/paper.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Standardized paper format with core fields for academic sources"""
     # 核心字段（必填，但允许空值或默认值）
@@ -25,6 +25,10 @@ class Paper:
     references: Optional[List[str]] = None     # List of reference IDs/DOIs
     extra: Optional[Dict] = None               # Source-specific extra metadata
 
+    # to_dict() result, built on first use. Papers are not modified after
+    # construction, so it never goes stale.
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Post-initialization to handle default values"""
         if self.authors is None:
@@ -40,10 +44,24 @@ class Paper:
 
     def to_dict(self) -> Dict:
         """Convert paper to dictionary format for serialization"""
+        # Callers may add keys (KnowledgeStore stamps stored_at), so each
+        # gets its own shallow copy of the memoized dict
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict.copy()
+
+    @staticmethod
+    def to_dicts(papers: Iterable["Paper"]) -> List[Dict]:
+        """Convert papers that are discarded afterwards, skipping the memo and its copy"""
+        return [paper._build_dict() for paper in papers]
+
+    def _build_dict(self) -> Dict:
+        # List fields are never None after __post_init__, and joining an
+        # empty list already gives ''
         return {
             'paper_id': self.paper_id,
             'title': self.title,
-            'authors': '; '.join(self.authors) if self.authors else '',
+            'authors': '; '.join(self.authors),
             'abstract': self.abstract,
             'doi': self.doi,
             'published_date': self.published_date.isoformat() if self.published_date else '',
@@ -51,9 +69,9 @@ class Paper:
             'url': self.url,
             'source': self.source,
             'updated_date': self.updated_date.isoformat() if self.updated_date else '',
-            'categories': '; '.join(self.categories) if self.categories else '',
-            'keywords': '; '.join(self.keywords) if self.keywords else '',
+            'categories': '; '.join(self.categories),
+            'keywords': '; '.join(self.keywords),
             'citations': self.citations,
-            'references': '; '.join(self.references) if self.references else '',
+            'references': '; '.join(self.references),
             'extra': str(self.extra) if self.extra else ''
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,193 @@
+# paper_search_mcp/pdfcache.py
+"""Content-addressed cache of downloaded PDFs."""
+import asyncio
+import contextlib
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+import httpx
+
+# Bytes read from the socket per write, so PDFs never sit whole in memory
+CHUNK_SIZE = 1 << 16
+
+
+class PdfCache:
+    """
+    Stores each downloaded PDF once, as ``<directory>/<sha256>.pdf``.
+
+    ``index.sqlite`` maps every URL fetched to the hash of its content, the
+    size and mtime of the cached file, and the validators (ETag,
+    Last-Modified) the server sent. A repeat download is then a conditional
+    GET; on 304 the cached file is hard-linked to the destination, so
+    nothing is transferred or copied. The same paper reached through
+    different IDs or URLs is stored only once.
+
+    Index queries and file checks run in worker threads, so the event loop
+    is never held up by them.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._db: Optional[sqlite3.Connection] = None
+        # The connection is shared by the worker threads
+        self._lock = threading.Lock()
+
+    def _index(self) -> sqlite3.Connection:
+        # Callers hold self._lock
+        if self._db is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.directory / "index.sqlite", check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pdfs ("
+                "url TEXT PRIMARY KEY, sha256 TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                "size INTEGER, mtime_ns INTEGER)"
+            )
+            # Indexes written before size/mtime were recorded
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(pdfs)")}
+            for column in ("size", "mtime_ns"):
+                if column not in columns:
+                    self._db.execute(f"ALTER TABLE pdfs ADD COLUMN {column} INTEGER")
+        return self._db
+
+    def _lookup(self, url: str) -> Optional[Tuple[Path, Optional[str], Optional[str]]]:
+        """Return ``(cached_path, etag, last_modified)`` if ``url``'s PDF is on disk."""
+        with self._lock:
+            row = self._index().execute(
+                "SELECT sha256, etag, last_modified, size, mtime_ns FROM pdfs WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.directory / f"{row[0]}.pdf"
+        # Downloads are hard links to the cached file, so rewriting one in
+        # place would change it too; only trust a file whose size and mtime
+        # are still those recorded when it was stored
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if (st.st_size, st.st_mtime_ns) != (row[3], row[4]):
+            return None
+        return path, row[1], row[2]
+
+    def _remember(self, url: str, path: Path, sha256: str, response: httpx.Response) -> None:
+        st = path.stat()
+        with self._lock, self._index() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO pdfs VALUES (?, ?, ?, ?, ?, ?)",
+                (url, sha256, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 st.st_size, st.st_mtime_ns),
+            )
+
+    async def download(self, client: httpx.AsyncClient, url: str, dest: str, **request_kwargs) -> str:
+        """
+        Fetch the PDF at ``url`` into ``dest``, reusing the cached copy if the
+        server reports it unchanged.
+
+        Args:
+            client: Client to send the request with
+            url: PDF URL
+            dest: File path to write
+            **request_kwargs: Passed to ``client.stream`` (e.g. ``headers``, ``timeout``)
+
+        Returns:
+            ``dest``
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        cached = await asyncio.to_thread(self._lookup, url)
+        headers = dict(request_kwargs.pop("headers", None) or {})
+        if cached is not None:
+            _, etag, last_modified = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with client.stream("GET", url, headers=headers, **request_kwargs) as response:
+            if response.status_code == 304 and cached is not None:
+                await asyncio.to_thread(_link, cached[0], dest)
+                return dest
+            response.raise_for_status()
+
+            # Hash while streaming to a temporary file, then move it to
+            # its content address
+            digest = hashlib.sha256()
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                path = self.directory / f"{digest.hexdigest()}.pdf"
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            await asyncio.to_thread(self._remember, url, path, digest.hexdigest(), response)
+
+        await asyncio.to_thread(_link, path, dest)
+        return dest
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+async def stream_to_file(client: httpx.AsyncClient, url: str, dest: str, **request_kwargs) -> str:
+    """
+    Download ``url`` into ``dest`` chunk by chunk.
+
+    The body goes to a temporary file that is renamed once complete, so an
+    interrupted download never leaves a truncated PDF where a later read
+    would find it.
+
+    Args:
+        client: Client to send the request with
+        url: File URL
+        dest: File path to write
+        **request_kwargs: Passed to ``client.stream`` (e.g. ``headers``, ``timeout``)
+
+    Returns:
+        ``dest``
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    dest_path = Path(dest)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    async with client.stream("GET", url, **request_kwargs) as response:
+        response.raise_for_status()
+        fd, tmp_path = tempfile.mkstemp(dir=dest_path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return dest
+
+
+def _link(src: Path, dest: str) -> None:
+    """Hard-link ``src`` to ``dest``, copying where linking is not possible."""
+    dest_path = Path(dest)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest_path.with_name(dest_path.name + ".link")
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:  # e.g. across filesystems
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dest_path)
+
@@ -0,0 +1,78 @@
+# paper_search_mcp/pdftext.py
+"""PDF text extraction, through PDFium when pypdfium2 is installed."""
+import io
+import logging
+import threading
+from typing import IO, Iterator, Union
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional: falls back to the pure-Python PyPDF2
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+# PDFium is not thread-safe, and callers extract in worker threads
+_PDFIUM_LOCK = threading.Lock()
+
+PdfSource = Union[str, bytes, IO[bytes]]
+
+
+def iter_page_texts(source: PdfSource) -> Iterator[str]:
+    """
+    Yield the text of each page of a PDF file path, bytes or binary stream.
+
+    Extraction is CPU-bound, so async callers should advance the iterator in
+    a worker thread. A page whose text cannot be extracted yields ''.
+    """
+    if pdfium is not None:
+        yield from _iter_pdfium(source)
+        return
+    from PyPDF2 import PdfReader  # only imported when PDFium is unavailable
+    reader = PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+    for page_num, page in enumerate(reader.pages):
+        try:
+            yield page.extract_text() or ""
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
+            yield ""
+
+
+def extract_text(source: PdfSource) -> str:
+    """Return the text of every page of a PDF, one page after another."""
+    return "".join(text + "\n" for text in iter_page_texts(source)).strip()
+
+
+def extract_paged_text(source: PdfSource) -> str:
+    """Return the text of every page of a PDF, marking where each page starts."""
+    text = ""
+    for page_num, page_text in enumerate(iter_page_texts(source)):
+        if page_text:
+            text += f"\n--- Page {page_num + 1} ---\n"
+            text += page_text + "\n"
+    return text
+
+
+def _iter_pdfium(source: PdfSource) -> Iterator[str]:
+    # The lock is taken per page rather than for the whole document, so
+    # a caller that stops early or reads slowly does not stall the others
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(source)
+        page_count = len(pdf)
+    try:
+        for page_num in range(page_count):
+            try:
+                with _PDFIUM_LOCK:
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    # PDFium ends lines with \r\n
+                    text = textpage.get_text_range().replace("\r\n", "\n")
+                    textpage.close()
+                    page.close()
+            except Exception as e:
+                logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
+                text = ""
+            yield text
+    finally:
+        with _PDFIUM_LOCK:
+            pdf.close()
@@ -0,0 +1,106 @@
+# paper_search_mcp/ratelimit.py
+"""Per-host request limits applied at the HTTP transport."""
+import asyncio
+import contextlib
+import os
+import random
+import time
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+# host -> (max concurrent requests, min seconds between request starts).
+# CrossRef's polite pool allows 50 req/s, arXiv asks for one request every
+# 3 seconds, NCBI E-utilities allow 3 req/s, or 10 with an API key, and
+# Semantic Scholar API keys get 1 req/s (unauthenticated calls share a
+# pool that rate-limits at least as hard).
+HOST_LIMITS: Dict[str, Tuple[int, float]] = {
+    "api.crossref.org": (40, 0.0),
+    "export.arxiv.org": (1, 3.0),
+    "eutils.ncbi.nlm.nih.gov": (10, 0.1) if os.getenv("NCBI_API_KEY", "").strip() else (3, 1 / 3),
+    "api.semanticscholar.org": (1, 1.0),
+}
+
+
+def retry_delay(response: httpx.Response, attempt: int, base_delay: float) -> float:
+    """
+    Compute how long to wait before retrying a rate-limited request.
+
+    Honors a numeric Retry-After header when present, otherwise backs off
+    exponentially from ``base_delay``. Jitter keeps concurrent tasks from
+    retrying in lockstep.
+    """
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = base_delay * (2 ** attempt)
+    return max(delay, 0.0) + random.uniform(0, 0.5)
+
+
+class HostRateLimiter:
+    """
+    Bounds concurrent requests per host and optionally spaces their starts.
+
+    Hosts without an entry in ``limits`` are not limited. Semaphores are
+    created on first use, inside the event loop that uses them.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[int, float]]] = None):
+        self.limits = HOST_LIMITS if limits is None else limits
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextlib.asynccontextmanager
+    async def limit(self, host: str):
+        """Hold one of ``host``'s request slots for the duration of the block."""
+        if host not in self.limits:
+            yield
+            return
+        concurrency, interval = self.limits[host]
+        slot = self._slots.get(host)
+        if slot is None:
+            slot = self._slots[host] = asyncio.Semaphore(concurrency)
+        async with slot:
+            if interval:
+                # Reserve the next start time before sleeping, so waiters
+                # are spaced out rather than all waking at once
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps an ``httpx.AsyncHTTPTransport`` so every request passes through a
+    ``HostRateLimiter``.
+
+    Keyword arguments other than ``limits`` (e.g. ``http2``) configure the
+    wrapped transport; pass a ``httpx.Limits`` as ``pool_limits``.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        pool_limits: Optional[httpx.Limits] = None,
+        **transport_kwargs,
+    ):
+        if transport is None:
+            if pool_limits is not None:
+                transport_kwargs["limits"] = pool_limits
+            transport = httpx.AsyncHTTPTransport(**transport_kwargs)
+        self._transport = transport
+        self.limiter = HostRateLimiter(limits)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # HEAD requests only warm connections and are not API calls
+        if request.method == "HEAD":
+            return await self._transport.handle_async_request(request)
+        async with self.limiter.limit(request.url.host):
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -1,6 +1,15 @@
 # paper_search_mcp/server.py
-from typing import List, Dict, Optional
-from fastmcp import FastMCP
+import asyncio
+import contextlib
+import inspect
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Union
+import httpx
+from fastmcp import Context, FastMCP
 from .academic_platforms.arxiv import ArxivSearcher
 from .academic_platforms.pubmed import PubMedSearcher
 from .academic_platforms.biorxiv import BioRxivSearcher
@@ -13,102 +22,358 @@ from .academic_platforms.searxng import SearXNGSearcher
 
 # from .academic_platforms.hub import SciHubSearcher
 from .paper import Paper
-from .knowledge import KnowledgeStore
-from .document_processor import DocumentProcessor, DOCLING_AVAILABLE
+from .cache import SearchCache
+from .pdfcache import PdfCache
+from .ratelimit import RateLimitedTransport
+from . import document_processor
+from .document_processor import DOCLING_AVAILABLE
+from .eventloop import install_fast_event_loop
+
+# Named explicitly: __name__ is "__main__" when run with -m
+logger = logging.getLogger("paper_search_mcp.server")
+
+# Pooled HTTP client shared by the searchers while the server runs. Several
+# sessions can run the lifespan at once, so it is reference counted.
+http_client: Optional[httpx.AsyncClient] = None
+_client_users = 0
+_negotiated_hosts: set = set()
+_prewarm_task: Optional[asyncio.Task] = None
+
+# Hosts the shared client talks to. They are contacted once at startup so
+# the first real query finds a pooled connection instead of paying for DNS
+# and the TCP/TLS handshake.
+PREWARM_URLS = (
+    "http://export.arxiv.org",
+    "https://eutils.ncbi.nlm.nih.gov",
+    "https://api.biorxiv.org",
+    "https://api.semanticscholar.org",
+    "https://eprint.iacr.org",
+    "https://scholar.google.com",
+    "https://api.crossref.org",
+)
+# Set PAPER_SEARCH_PREWARM=0 where outbound connections at startup are
+# unwanted (offline use, tests)
+PREWARM = os.getenv("PAPER_SEARCH_PREWARM", "1").strip().lower() not in ("0", "false", "no", "")
+
+
+async def _log_http_version(response: httpx.Response) -> None:
+    """Log the protocol negotiated with each host the first time it answers."""
+    host = response.request.url.host
+    if host not in _negotiated_hosts:
+        _negotiated_hosts.add(host)
+        logger.info("%s speaks %s", host, response.http_version)
+
+
+async def prewarm_connections(client: httpx.AsyncClient) -> None:
+    """Open pooled connections to the known hosts; failures are ignored."""
+    await asyncio.gather(
+        *(client.head(url, timeout=5) for url in PREWARM_URLS),
+        return_exceptions=True,
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(server):
+    """Inject one pooled HTTP client into the searchers and close it on shutdown."""
+    global http_client, _client_users, _prewarm_task
+    if http_client is None:
+        # HTTP/2 multiplexes concurrent requests to a host (search_all,
+        # IACR detail pages) over one connection; HTTP/1.1 hosts fall back.
+        # Per-host rate limits keep that fan-out under upstream quotas, so
+        # a small pool covers the HTTP/1.1 hosts too.
+        http_client = httpx.AsyncClient(
+            transport=RateLimitedTransport(
+                http2=True,
+                pool_limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60),
+            ),
+            timeout=30,
+            event_hooks={"response": [_log_http_version]},
+        )
+        for searcher in SHARED_CLIENT_SEARCHERS:
+            searcher.client = http_client
+        # In the background, so startup is not held up by slow hosts
+        if PREWARM:
+            _prewarm_task = asyncio.create_task(prewarm_connections(http_client))
+    _client_users += 1
+    try:
+        yield
+    finally:
+        _client_users -= 1
+        if _client_users == 0:
+            if _prewarm_task is not None:
+                _prewarm_task.cancel()
+                await asyncio.gather(_prewarm_task, return_exceptions=True)
+                _prewarm_task = None
+            for searcher in SHARED_CLIENT_SEARCHERS:
+                searcher.client = None
+            client, http_client = http_client, None
+            await client.aclose()
+            document_processor.shutdown_pool()
+
 
 # Initialize MCP server
-mcp = FastMCP("paper_search_server")
+mcp = FastMCP("paper_search_server", lifespan=lifespan)
+
+# Search results and downloaded PDFs are persisted here so restarts start
+# warm; set PAPER_SEARCH_CACHE_DIR="" to keep only an in-memory search cache
+CACHE_DIR = os.getenv("PAPER_SEARCH_CACHE_DIR", os.path.expanduser("~/.cache/paper-search-mcp"))
+# Each PDF is stored once by content hash; repeat downloads are conditional GETs
+pdf_cache = PdfCache(os.path.join(CACHE_DIR, "pdfs")) if CACHE_DIR else None
 
 # Instances of searchers
-arxiv_searcher = ArxivSearcher()
+arxiv_searcher = ArxivSearcher(pdf_cache=pdf_cache)
 pubmed_searcher = PubMedSearcher()
-biorxiv_searcher = BioRxivSearcher()
-medrxiv_searcher = MedRxivSearcher()
+biorxiv_searcher = BioRxivSearcher(pdf_cache=pdf_cache)
+medrxiv_searcher = MedRxivSearcher(pdf_cache=pdf_cache)
 google_scholar_searcher = GoogleScholarSearcher()
-iacr_searcher = IACRSearcher()
-semantic_searcher = SemanticSearcher()
+iacr_searcher = IACRSearcher(pdf_cache=pdf_cache)
+semantic_searcher = SemanticSearcher(pdf_cache=pdf_cache)
 crossref_searcher = CrossRefSearcher()
 searxng_searcher = SearXNGSearcher()
 # scihub_searcher = SciHubSearcher()
 
-# Initialize knowledge store
-knowledge_store = KnowledgeStore()
-
-# Initialize document processor if available
-doc_processor = DocumentProcessor() if DOCLING_AVAILABLE else None
-
+# Searchers that use the server's shared client
+SHARED_CLIENT_SEARCHERS = (
+    arxiv_searcher,
+    pubmed_searcher,
+    biorxiv_searcher,
+    medrxiv_searcher,
+    google_scholar_searcher,
+    iacr_searcher,
+    semantic_searcher,
+    crossref_searcher,
+    searxng_searcher,
+)
+
+# Searchers by platform name, for tools that query several at once
+SEARCHERS = {
+    "arxiv": arxiv_searcher,
+    "pubmed": pubmed_searcher,
+    "biorxiv": biorxiv_searcher,
+    "medrxiv": medrxiv_searcher,
+    "google_scholar": google_scholar_searcher,
+    "iacr": iacr_searcher,
+    "semantic": semantic_searcher,
+    "crossref": crossref_searcher,
+    "searxng": searxng_searcher,
+}
+# Queried by search_all unless sources are given; Google Scholar and SearXNG
+# are opt-in since one rate-limits hard and the other needs a local instance
+DEFAULT_SEARCH_ALL_SOURCES = ["arxiv", "pubmed", "biorxiv", "medrxiv", "semantic", "crossref"]
+# Seconds search_all waits for each source
+SEARCH_ALL_TIMEOUT = 15
+SEARCHER_NAMES = {searcher: name for name, searcher in SEARCHERS.items()}
+# Most results each platform can return for one search; larger max_results
+# are clamped before anything is fetched or cached
+MAX_RESULTS_LIMITS = {
+    "arxiv": 2000,
+    "pubmed": 10000,
+    "biorxiv": 1000,
+    "medrxiv": 1000,
+    "google_scholar": 100,
+    "semantic": 100,
+    "crossref": CrossRefSearcher.MAX_RESULTS,
+}
+
+# Seconds search results stay cached. Preprint servers update at most daily;
+# everything else gets an hour.
+SEARCH_CACHE_TTLS = {"arxiv": 86400, "biorxiv": 86400, "medrxiv": 86400}
+DEFAULT_SEARCH_CACHE_TTL = 3600
+# Platforms whose search ignores query case, so differently cased queries
+# can share a cache entry. Elsewhere uppercase AND/OR/NOT are operators.
+CASE_INSENSITIVE_SOURCES = {"crossref"}
+# DOI metadata rarely changes once registered
+DOI_CACHE_TTL = 86400
+search_cache = SearchCache(maxsize=2048, directory=CACHE_DIR)
+# Lookups currently being fetched, by cache key, so identical concurrent
+# calls share one upstream request
+_in_flight: Dict[str, asyncio.Task] = {}
+
+
+async def _single_flight(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Await ``fetch()``, sharing one run among concurrent callers with the same key.
+
+    The fetch runs as its own task and callers await it through shield(),
+    so a caller that gives up does not cancel it for the others.
+    """
+    task = _in_flight.get(key)
+    if task is None:
+        task = _in_flight[key] = asyncio.ensure_future(fetch())
+        task.add_done_callback(lambda done: _in_flight.pop(key, None))
+    return await asyncio.shield(task)
+
+# Created on first use: importing the SurrealDB client is a large part of
+# startup, and most sessions never touch the knowledge tools
+_knowledge_store = None
+
+
+def get_knowledge_store():
+    """Return the knowledge store, importing the SurrealDB client on first use."""
+    global _knowledge_store
+    if _knowledge_store is None:
+        from .knowledge import KnowledgeStore
+        _knowledge_store = KnowledgeStore()
+    return _knowledge_store
 
 
 # Asynchronous helper to adapt async searchers
 async def async_search(searcher, query: str, max_results: int, **kwargs) -> List[Dict]:
-    # Searchers now use httpx internally and are async
-    if 'year' in kwargs:
-        papers = await searcher.search(query, year=kwargs['year'], max_results=max_results)
-    else:
-        papers = await searcher.search(query, max_results=max_results)
-    return [paper.to_dict() for paper in papers]
+    # Repeated queries are served from search_cache; empty results are not
+    # cached since searchers also return [] on errors
+    name = SEARCHER_NAMES.get(searcher, type(searcher).__name__)
+    if max_results < 1:
+        return []
+    max_results = min(max_results, MAX_RESULTS_LIMITS.get(name, max_results))
+    ttl = SEARCH_CACHE_TTLS.get(name, DEFAULT_SEARCH_CACHE_TTL)
+    # Runs of whitespace never change a search, so they should not miss the cache
+    normalized = " ".join(query.split())
+    if name in CASE_INSENSITIVE_SOURCES:
+        normalized = normalized.casefold()
+    key = SearchCache.make_key(name, normalized, max_results, kwargs)
+    found, papers = await search_cache.aget(key, ttl)
+    if found:
+        return papers
+
+    async def fetch() -> List[Dict]:
+        papers = Paper.to_dicts(await searcher.search(query, max_results=max_results, **kwargs))
+        if papers:
+            await search_cache.aset(key, papers, ttl)
+        return papers
+
+    return await _single_flight(key, fetch)
 
 
 # Tool definitions
 @mcp.tool()
-async def search_arxiv(query: str, max_results: int = 10) -> List[Dict]:
-    """Search academic papers from arXiv.
+async def search_all(
+    query: str,
+    max_results: int = 10,
+    sources: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Union[List[Dict], str]]:
+    """Search several academic platforms concurrently.
 
     Args:
         query: Search query string (e.g., 'machine learning').
-        max_results: Maximum number of papers to return (default: 10).
-    Returns:
-        List of paper metadata in dictionary format.
-    """
-    papers = await async_search(arxiv_searcher, query, max_results)
-    return papers if papers else []
+        max_results: Maximum number of papers to return per platform (default: 10).
+        sources: Platforms to query (default: arxiv, pubmed, biorxiv, medrxiv, semantic, crossref).
+            Also available: google_scholar, iacr, searxng.
+    Returns:
+        Dictionary mapping each platform to its list of paper metadata, or to an
+        error message if that platform failed or timed out.
+    """
+    sources = list(dict.fromkeys(sources or DEFAULT_SEARCH_ALL_SOURCES))
+    known = [source for source in sources if source in SEARCHERS]
 
+    async def run(source: str):
+        try:
+            result = await asyncio.wait_for(
+                async_search(SEARCHERS[source], query, max_results), SEARCH_ALL_TIMEOUT
+            )
+        except Exception as e:
+            result = e
+        return source, result
 
-@mcp.tool()
-async def search_pubmed(query: str, max_results: int = 10) -> List[Dict]:
-    """Search academic papers from PubMed.
+    # Tool results are sent as one message, so report each source as it
+    # finishes; clients that asked for progress see the fast platforms
+    # without waiting for the slowest one
+    outcomes = {}
+    for done in asyncio.as_completed([run(source) for source in known]):
+        source, result = await done
+        outcomes[source] = result
+        if ctx is not None:
+            found = "failed" if isinstance(result, Exception) else f"{len(result)} papers"
+            await ctx.report_progress(len(outcomes), len(known), f"{source}: {found}")
+    response: Dict[str, Union[List[Dict], str]] = {}
+    for source in sources:
+        result = outcomes.get(source)
+        if source not in outcomes:
+            response[source] = f"Error: unknown source (available: {', '.join(SEARCHERS)})"
+        elif isinstance(result, asyncio.TimeoutError):
+            response[source] = f"Error: timed out after {SEARCH_ALL_TIMEOUT}s"
+        elif isinstance(result, Exception):
+            response[source] = f"Error: {result}"
+        else:
+            response[source] = result
+    return response
 
-    Args:
-        query: Search query string (e.g., 'machine learning').
-        max_results: Maximum number of papers to return (default: 10).
-    Returns:
-        List of paper metadata in dictionary format.
+
+async def _map_papers(method: str, source: str, paper_ids: List[str], save_path: str, concurrency: int) -> List[str]:
+    """
+    Call ``SEARCHERS[source].<method>(paper_id, save_path)`` for each ID, at
+    most ``concurrency`` at a time over the shared connection pool.
+
+    A failure is reported in that paper's slot rather than cancelling the
+    rest of the batch.
     """
-    papers = await async_search(pubmed_searcher, query, max_results)
-    return papers if papers else []
+    searcher = SEARCHERS.get(source)
+    if searcher is None:
+        return [f"Error: unknown source (available: {', '.join(SEARCHERS)})"] * len(paper_ids)
+    limit = asyncio.Semaphore(max(concurrency, 1))
+
+    async def one(paper_id: str) -> str:
+        async with limit:
+            try:
+                # Platforms without PDFs have synchronous stubs
+                result = getattr(searcher, method)(paper_id, save_path)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except NotImplementedError as e:
+                return str(e)
+            except Exception as e:
+                logger.exception("Error in %s for %s paper %s", method, source, paper_id)
+                return f"Error: {e}"
+
+    return await asyncio.gather(*(one(paper_id) for paper_id in paper_ids))
 
 
 @mcp.tool()
-async def search_biorxiv(query: str, max_results: int = 10) -> List[Dict]:
-    """Search academic papers from bioRxiv.
+async def download_many(
+    source: str, paper_ids: List[str], save_path: str = "./downloads", concurrency: int = 8
+) -> List[str]:
+    """Download the PDFs of several papers from one platform concurrently.
 
     Args:
-        query: Search query string (e.g., 'machine learning').
-        max_results: Maximum number of papers to return (default: 10).
+        source: Platform the IDs belong to (e.g., 'arxiv', 'biorxiv', 'iacr', 'semantic').
+        paper_ids: Paper identifiers as accepted by that platform's download tool.
+        save_path: Directory to save the PDFs (default: './downloads').
+        concurrency: Most downloads in flight at once (default: 8).
     Returns:
-        List of paper metadata in dictionary format.
+        List[str]: The path of each downloaded PDF (or an error message), in order.
     """
-    papers = await async_search(biorxiv_searcher, query, max_results)
-    return papers if papers else []
+    return await _map_papers("download_pdf", source, paper_ids, save_path, concurrency)
 
 
 @mcp.tool()
-async def search_medrxiv(query: str, max_results: int = 10) -> List[Dict]:
-    """Search academic papers from medRxiv.
+async def read_many(
+    source: str, paper_ids: List[str], save_path: str = "./downloads", concurrency: int = 8
+) -> List[str]:
+    """Read and extract text content from several papers from one platform concurrently.
 
     Args:
-        query: Search query string (e.g., 'machine learning').
-        max_results: Maximum number of papers to return (default: 10).
+        source: Platform the IDs belong to (e.g., 'arxiv', 'biorxiv', 'iacr', 'semantic').
+        paper_ids: Paper identifiers as accepted by that platform's read tool.
+        save_path: Directory where the PDFs are/will be saved (default: './downloads').
+        concurrency: Most papers fetched at once (default: 8).
     Returns:
-        List of paper metadata in dictionary format.
+        List[str]: The extracted text content (or an error message) for each paper, in order.
     """
-    papers = await async_search(medrxiv_searcher, query, max_results)
-    return papers if papers else []
+    if source == "semantic":
+        # Looks up paper details in batches instead of one request per paper
+        return await read_semantic_papers(paper_ids, save_path, concurrency)
+    return await _map_papers("read_paper", source, paper_ids, save_path, concurrency)
 
 
-@mcp.tool()
-async def search_google_scholar(query: str, max_results: int = 10) -> List[Dict]:
-    """Search academic papers from Google Scholar.
+def _make_search_tool(name: str, label: str):
+    """Register a ``search_<name>`` tool that queries ``SEARCHERS[name]``."""
+    searcher = SEARCHERS[name]
+
+    async def search(query: str, max_results: int = 10) -> List[Dict]:
+        return await async_search(searcher, query, max_results)
+
+    search.__name__ = search.__qualname__ = f"search_{name}"
+    search.__doc__ = f"""Search academic papers from {label}.
 
     Args:
         query: Search query string (e.g., 'machine learning').
@@ -116,8 +381,18 @@ async def search_google_scholar(query: str, max_results: int = 10) -> List[Dict]
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = await async_search(google_scholar_searcher, query, max_results)
-    return papers if papers else []
+    return mcp.tool()(search)
+
+
+# Platforms whose search tool takes only a query and max_results
+for _name, _label in (
+    ("arxiv", "arXiv"),
+    ("pubmed", "PubMed"),
+    ("biorxiv", "bioRxiv"),
+    ("medrxiv", "medRxiv"),
+    ("google_scholar", "Google Scholar"),
+):
+    globals()[f"search_{_name}"] = _make_search_tool(_name, _label)
 
 
 @mcp.tool()
@@ -133,93 +408,79 @@ async def search_iacr(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = await iacr_searcher.search(query, max_results, fetch_details)
-    return [paper.to_dict() for paper in papers] if papers else []
-
+    return await async_search(iacr_searcher, query, max_results, fetch_details=fetch_details)
 
-@mcp.tool()
-async def download_arxiv(paper_id: str, save_path: str = "./downloads") -> str:
-    """Download PDF of an arXiv paper.
 
-    Args:
-        paper_id: arXiv paper ID (e.g., '2106.12345').
-        save_path: Directory to save the PDF (default: './downloads').
-    Returns:
-        Path to the downloaded PDF file.
-    """
-    return await arxiv_searcher.download_pdf(paper_id, save_path)
+def _make_download_tool(name: str, label: str, id_doc: str):
+    """Register a ``download_<name>`` tool for ``SEARCHERS[name]``."""
+    searcher = SEARCHERS[name]
 
+    async def download(paper_id: str, save_path: str = "./downloads") -> str:
+        return await searcher.download_pdf(paper_id, save_path)
 
-@mcp.tool()
-async def download_pubmed(paper_id: str, save_path: str = "./downloads") -> str:
-    """Attempt to download PDF of a PubMed paper.
+    download.__name__ = download.__qualname__ = f"download_{name}"
+    download.__doc__ = f"""Download PDF of {label} paper.
 
     Args:
-        paper_id: PubMed ID (PMID).
+        paper_id: {id_doc}.
         save_path: Directory to save the PDF (default: './downloads').
     Returns:
-        str: Message indicating that direct PDF download is not supported.
+        Path to the downloaded PDF file.
     """
-    try:
-        return await pubmed_searcher.download_pdf(paper_id, save_path)
-    except NotImplementedError as e:
-        return str(e)
-
+    return mcp.tool()(download)
 
-@mcp.tool()
-async def download_biorxiv(paper_id: str, save_path: str = "./downloads") -> str:
-    """Download PDF of a bioRxiv paper.
 
-    Args:
-        paper_id: bioRxiv DOI.
-        save_path: Directory to save the PDF (default: './downloads').
-    Returns:
-        Path to the downloaded PDF file.
-    """
-    return await biorxiv_searcher.download_pdf(paper_id, save_path)
+def _make_read_tool(name: str, label: str, id_doc: str):
+    """Register a ``read_<name>_paper`` tool for ``SEARCHERS[name]``."""
+    searcher = SEARCHERS[name]
 
+    async def read(paper_id: str, save_path: Optional[str] = None) -> str:
+        try:
+            if save_path is None:
+                return await searcher.read_paper_bytes(paper_id)
+            return await searcher.read_paper(paper_id, save_path)
+        except Exception:
+            logger.exception("Error reading paper %s", paper_id)
+            return ""
 
-@mcp.tool()
-async def download_medrxiv(paper_id: str, save_path: str = "./downloads") -> str:
-    """Download PDF of a medRxiv paper.
+    read.__name__ = read.__qualname__ = f"read_{name}_paper"
+    read.__doc__ = f"""Read and extract text content from {label} paper PDF.
 
     Args:
-        paper_id: medRxiv DOI.
-        save_path: Directory to save the PDF (default: './downloads').
+        paper_id: {id_doc}.
+        save_path: Directory to save the PDF in, or where it already is. If omitted the
+            PDF is read in memory and not saved.
     Returns:
-        Path to the downloaded PDF file.
+        str: The extracted text content of the paper.
     """
-    return await medrxiv_searcher.download_pdf(paper_id, save_path)
+    return mcp.tool()(read)
 
 
-@mcp.tool()
-async def download_iacr(paper_id: str, save_path: str = "./downloads") -> str:
-    """Download PDF of an IACR ePrint paper.
-
-    Args:
-        paper_id: IACR paper ID (e.g., '2009/101').
-        save_path: Directory to save the PDF (default: './downloads').
-    Returns:
-        Path to the downloaded PDF file.
-    """
-    return await iacr_searcher.download_pdf(paper_id, save_path)
+# Platforms with PDFs that can also be read in memory
+for _name, _label, _id_doc in (
+    ("arxiv", "an arXiv", "arXiv paper ID (e.g., '2106.12345')"),
+    ("biorxiv", "a bioRxiv", "bioRxiv DOI"),
+    ("medrxiv", "a medRxiv", "medRxiv DOI"),
+    ("iacr", "an IACR ePrint", "IACR paper ID (e.g., '2009/101')"),
+):
+    globals()[f"download_{_name}"] = _make_download_tool(_name, _label, _id_doc)
+    globals()[f"read_{_name}_paper"] = _make_read_tool(_name, _label, _id_doc)
 
 
 @mcp.tool()
-async def read_arxiv_paper(paper_id: str, save_path: str = "./downloads") -> str:
-    """Read and extract text content from an arXiv paper PDF.
+async def download_pubmed(paper_id: str, save_path: str = "./downloads") -> str:
+    """Attempt to download PDF of a PubMed paper.
 
     Args:
-        paper_id: arXiv paper ID (e.g., '2106.12345').
-        save_path: Directory where the PDF is/will be saved (default: './downloads').
+        paper_id: PubMed ID (PMID).
+        save_path: Directory to save the PDF (default: './downloads').
     Returns:
-        str: The extracted text content of the paper.
+        str: Message indicating that direct PDF download is not supported.
     """
     try:
-        return await arxiv_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
+        return await pubmed_searcher.download_pdf(paper_id, save_path)
+    except NotImplementedError as e:
+        return str(e)
 
 
 @mcp.tool()
@@ -235,57 +496,6 @@ async def read_pubmed_paper(paper_id: str, save_path: str = "./downloads") -> st
     return await pubmed_searcher.read_paper(paper_id, save_path)
 
 
-@mcp.tool()
-async def read_biorxiv_paper(paper_id: str, save_path: str = "./downloads") -> str:
-    """Read and extract text content from a bioRxiv paper PDF.
-
-    Args:
-        paper_id: bioRxiv DOI.
-        save_path: Directory where the PDF is/will be saved (default: './downloads').
-    Returns:
-        str: The extracted text content of the paper.
-    """
-    try:
-        return biorxiv_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
-
-
-@mcp.tool()
-async def read_medrxiv_paper(paper_id: str, save_path: str = "./downloads") -> str:
-    """Read and extract text content from a medRxiv paper PDF.
-
-    Args:
-        paper_id: medRxiv DOI.
-        save_path: Directory where the PDF is/will be saved (default: './downloads').
-    Returns:
-        str: The extracted text content of the paper.
-    """
-    try:
-        return medrxiv_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
-
-
-@mcp.tool()
-async def read_iacr_paper(paper_id: str, save_path: str = "./downloads") -> str:
-    """Read and extract text content from an IACR ePrint paper PDF.
-
-    Args:
-        paper_id: IACR paper ID (e.g., '2009/101').
-        save_path: Directory where the PDF is/will be saved (default: './downloads').
-    Returns:
-        str: The extracted text content of the paper.
-    """
-    try:
-        return iacr_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
-
-
 @mcp.tool()
 async def search_semantic(query: str, year: Optional[str] = None, max_results: int = 10) -> List[Dict]:
     """Search academic papers from Semantic Scholar.
@@ -300,8 +510,7 @@ async def search_semantic(query: str, year: Optional[str] = None, max_results: i
     kwargs = {}
     if year is not None:
         kwargs['year'] = year
-    papers = await async_search(semantic_searcher, query, max_results, **kwargs)
-    return papers if papers else []
+    return await async_search(semantic_searcher, query, max_results, **kwargs)
 
 
 @mcp.tool()
@@ -345,13 +554,42 @@ async def read_semantic_paper(paper_id: str, save_path: str = "./downloads") ->
     """
     try:
         return await semantic_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
+    except Exception:
+        logger.exception("Error reading paper %s", paper_id)
         return ""
 
 
 @mcp.tool()
-async def search_crossref(query: str, max_results: int = 10, **kwargs) -> List[Dict]:
+async def read_semantic_papers(
+    paper_ids: List[str], save_path: str = "./downloads", concurrency: int = 8
+) -> List[str]:
+    """Read and extract text content from several Semantic Scholar papers.
+
+    Paper details are looked up in batches of up to 500 IDs, so this is much
+    faster than calling read_semantic_paper once per paper.
+
+    Args:
+        paper_ids: Paper identifiers in any format accepted by read_semantic_paper.
+        save_path: Directory where the PDFs are/will be saved (default: './downloads').
+        concurrency: Most PDFs downloaded and parsed at once (default: 8).
+    Returns:
+        List[str]: The extracted text content (or an error message) for each paper, in order.
+    """
+    try:
+        return await semantic_searcher.read_papers(paper_ids, save_path, concurrency)
+    except Exception:
+        logger.exception("Error reading papers %s", paper_ids)
+        return [""] * len(paper_ids)
+
+
+@mcp.tool()
+async def search_crossref(
+    query: str,
+    max_results: int = 10,
+    filter: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+) -> List[Dict]:
     """Search academic papers from CrossRef database.
     
     CrossRef is a scholarly infrastructure organization that provides 
@@ -361,11 +599,10 @@ async def search_crossref(query: str, max_results: int = 10, **kwargs) -> List[D
 
     Args:
         query: Search query string (e.g., 'machine learning', 'climate change').
-        max_results: Maximum number of papers to return (default: 10, max: 1000).
-        **kwargs: Additional search parameters:
-            - filter: CrossRef filter string (e.g., 'has-full-text:true,from-pub-date:2020')
-            - sort: Sort field ('relevance', 'published', 'updated', 'deposited', etc.)
-            - order: Sort order ('asc' or 'desc')
+        max_results: Maximum number of papers to return (default: 10, max: 10000).
+        filter: CrossRef filter string (e.g., 'has-full-text:true,from-pub-date:2020').
+        sort: Sort field ('relevance', 'published', 'updated', 'deposited', etc.).
+        order: Sort order ('asc' or 'desc').
     Returns:
         List of paper metadata in dictionary format.
         
@@ -379,8 +616,14 @@ async def search_crossref(query: str, max_results: int = 10, **kwargs) -> List[D
         # Search sorted by publication date
         search_crossref("neural networks", 15, sort="published", order="desc")
     """
-    papers = await async_search(crossref_searcher, query, max_results, **kwargs)
-    return papers if papers else []
+    kwargs = {}
+    if filter is not None:
+        kwargs['filter'] = filter
+    if sort is not None:
+        kwargs['sort'] = sort
+    if order is not None:
+        kwargs['order'] = order
+    return await async_search(crossref_searcher, query, max_results, **kwargs)
 
 
 @mcp.tool()
@@ -395,9 +638,21 @@ async def get_crossref_paper_by_doi(doi: str) -> Dict:
     Example:
         get_crossref_paper_by_doi("10.1038/nature12373")
     """
-    async with httpx.AsyncClient() as client:
-        paper = crossref_searcher.get_paper_by_doi(doi)
-        return paper.to_dict() if paper else {}
+    # Found papers are also kept in search_cache, so they survive restarts
+    key = SearchCache.make_key("crossref_doi", doi.strip().lower())
+    found, paper_dict = await search_cache.aget(key, DOI_CACHE_TTL)
+    if found:
+        return paper_dict
+
+    async def fetch() -> Dict:
+        paper = await crossref_searcher.get_paper_by_doi(doi)
+        if paper is None:
+            return {}
+        paper_dict = paper.to_dict()
+        await search_cache.aset(key, paper_dict, DOI_CACHE_TTL)
+        return paper_dict
+
+    return await _single_flight(key, fetch)
 
 
 @mcp.tool()
@@ -449,8 +704,19 @@ async def search_searxng(query: str, max_results: int = 10, category: str = "sci
     Returns:
         List of search results from multiple engines in dictionary format.
     """
-    papers = await searxng_searcher.search(query, max_results, category)
-    return [paper.to_dict() for paper in papers] if papers else []
+    return await async_search(searxng_searcher, query, max_results, category=category)
+
+
+@mcp.tool()
+async def clear_cache() -> str:
+    """Clear cached search results and CrossRef DOI lookups.
+
+    Returns:
+        Message with the number of cleared search entries.
+    """
+    count = search_cache.clear()
+    crossref_searcher.invalidate()
+    return f"Cleared {count} cached searches and the CrossRef DOI cache"
 
 
 # Knowledge management tools
@@ -463,7 +729,7 @@ async def store_paper_knowledge(paper_data: Dict) -> str:
     Returns:
         Record ID of the stored paper in SurrealDB.
     """
-    return await knowledge_store.store_paper(paper_data)
+    return await get_knowledge_store().store_paper(paper_data)
 
 
 @mcp.tool()
@@ -475,7 +741,7 @@ async def get_paper_knowledge(paper_id: str) -> Optional[Dict]:
     Returns:
         Paper data dictionary or None if not found.
     """
-    return await knowledge_store.get_paper(paper_id)
+    return await get_knowledge_store().get_paper(paper_id)
 
 
 @mcp.tool()
@@ -488,7 +754,7 @@ async def search_knowledge(query: str, limit: int = 10) -> List[Dict]:
     Returns:
         List of matching papers from the knowledge graph.
     """
-    return await knowledge_store.search_papers(query, limit)
+    return await get_knowledge_store().search_papers(query, limit)
 
 
 @mcp.tool()
@@ -502,7 +768,7 @@ async def add_concept_knowledge(name: str, description: str, category: str = "ge
     Returns:
         Record ID of the concept.
     """
-    return await knowledge_store.add_concept(name, description, category)
+    return await get_knowledge_store().add_concept(name, description, category)
 
 
 @mcp.tool()
@@ -516,7 +782,7 @@ async def relate_paper_concept(paper_id: str, concept_name: str, strength: float
     Returns:
         Relationship record ID.
     """
-    return await knowledge_store.relate_paper_to_concept(paper_id, concept_name, strength)
+    return await get_knowledge_store().relate_paper_to_concept(paper_id, concept_name, strength)
 
 
 @mcp.tool()
@@ -529,7 +795,7 @@ async def get_similar_papers_knowledge(paper_id: str, limit: int = 5) -> List[Di
     Returns:
         List of similar papers with shared concept counts.
     """
-    return await knowledge_store.get_similar_papers(paper_id, limit)
+    return await get_knowledge_store().get_similar_papers(paper_id, limit)
 
 
 @mcp.tool()
@@ -539,7 +805,7 @@ async def get_knowledge_stats() -> Dict:
     Returns:
         Dictionary with counts of papers, concepts, and relationships.
     """
-    return await knowledge_store.get_knowledge_stats()
+    return await get_knowledge_store().get_knowledge_stats()
 
 
 # Document processing tools
@@ -555,10 +821,10 @@ async def process_pdf_advanced(pdf_path: str) -> Dict:
     Note:
         Requires Docling to be installed. Falls back to basic PDF extraction if unavailable.
     """
-    if not doc_processor:
+    if not DOCLING_AVAILABLE:
         return {"error": "Docling not available. Install with: pip install docling"}
     
-    return await doc_processor.process_pdf(pdf_path)
+    return await document_processor.process_pdf_in_pool(pdf_path)
 
 
 @mcp.tool()
@@ -567,15 +833,40 @@ async def process_document_url(url: str, output_dir: str = "./downloads") -> Dic
 
     Args:
         url: URL to document (supports PDF, DOCX, PPTX, HTML, etc.)
-        output_dir: Directory for temporary files (default: './downloads').
+        output_dir: Unused; the document is processed in memory (kept for compatibility).
     Returns:
         Processed document data with text and metadata.
     """
-    if not doc_processor:
+    if not DOCLING_AVAILABLE:
         return {"error": "Docling not available. Install with: pip install docling"}
     
-    return await doc_processor.process_url(url, output_dir)
+    return await document_processor.process_url_in_pool(url, output_dir)
+
+
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Send the package's logs to stderr through a background thread.
+
+    stdout carries the stdio transport's JSON-RPC frames, so nothing may be
+    printed there. The QueueHandler keeps tool handlers from blocking on a
+    slow stderr; the returned listener does the writing.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    package_logger = logging.getLogger("paper_search_mcp")
+    package_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    package_logger.setLevel(level)
+    listener.start()
+    return listener
 
 
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
+    # Before mcp.run creates the loop; the tools are mostly socket waits
+    install_fast_event_loop()
+    listener = configure_logging()
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        listener.stop()
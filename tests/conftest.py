@@ -0,0 +1,6 @@
+# tests/conftest.py
+
+
+def pytest_configure(config):
+    # Tests that call the live platform APIs; deselect them with -m "not network"
+    config.addinivalue_line("markers", "network: test talks to a live external API")
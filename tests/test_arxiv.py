@@ -1,9 +1,15 @@
 # tests/test_arxiv.py
 import unittest
 import asyncio
+import io
+import os
+import httpx
+import pytest
+from PyPDF2 import PdfWriter
 from paper_search_mcp.academic_platforms.arxiv import ArxivSearcher
 
 class TestArxivSearcher(unittest.TestCase):
+    @pytest.mark.network
     def test_search(self):
         searcher = ArxivSearcher()
         papers = asyncio.run(searcher.search("machine learning", max_results=10))
@@ -13,5 +19,58 @@ class TestArxivSearcher(unittest.TestCase):
         self.assertEqual(len(papers), 10)
         self.assertTrue(papers[0].title)
 
+    def test_search_uses_injected_client(self):
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v1</id>
+    <updated>2021-01-02T00:00:00Z</updated>
+    <published>2021-01-01T00:00:00Z</published>
+    <title>Example</title>
+    <summary>Abstract</summary>
+    <author><name>Ada Lovelace</name></author>
+    <link title="pdf" href="http://arxiv.org/pdf/2101.00001v1" rel="related" type="application/pdf"/>
+    <category term="cs.LG"/>
+  </entry>
+</feed>"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request.url.host)
+            return httpx.Response(200, content=feed)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                searcher = ArxivSearcher(client=client)
+                first = await searcher.search("example", max_results=1)
+                second = await searcher.search("example", max_results=1)
+                self.assertFalse(client.is_closed)
+                return first + second
+
+        papers = asyncio.run(run())
+        self.assertEqual(requests_seen, ["export.arxiv.org"] * 2)
+        self.assertEqual(papers[0].paper_id, "2101.00001v1")
+        self.assertEqual(papers[0].authors, ["Ada Lovelace"])
+
+    def test_read_paper_bytes_skips_disk(self):
+        writer = PdfWriter()
+        writer.add_blank_page(width=72, height=72)
+        pdf = io.BytesIO()
+        writer.write(pdf)
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(str(request.url))
+            return httpx.Response(200, content=pdf.getvalue())
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await ArxivSearcher(client=client).read_paper_bytes("2101.00001")
+
+        cwd_before = set(os.listdir("."))
+        self.assertEqual(asyncio.run(run()), "")
+        self.assertEqual(requests_seen, ["https://arxiv.org/pdf/2101.00001.pdf"])
+        self.assertEqual(set(os.listdir(".")), cwd_before)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
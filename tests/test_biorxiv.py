@@ -1,29 +1,27 @@
 import unittest
 import asyncio
+import functools
 import os
-import requests
+import httpx
+import pytest
 from paper_search_mcp.academic_platforms.biorxiv import BioRxivSearcher
 
+@functools.lru_cache(maxsize=None)
 def check_api_accessible():
-    """检查 bioRxiv API 是否可访问"""
+    """检查 bioRxiv API 是否可访问 (probed at most once per run)"""
     try:
-        response = requests.get("https://api.biorxiv.org/details/biorxiv/0/1", timeout=5)
-        return response.status_code == 200
-    except:
+        with httpx.Client(timeout=5.0) as client:
+            return client.get("https://api.biorxiv.org/details/biorxiv/0/1").status_code == 200
+    except httpx.HTTPError:
         return False
 
 class TestBioRxivSearcher(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.api_accessible = check_api_accessible()
-        if not cls.api_accessible:
-            print("\nWarning: bioRxiv API is not accessible, some tests will be skipped")
-
     def setUp(self):
         self.searcher = BioRxivSearcher()
 
+    @pytest.mark.network
     def test_search(self):
-        if not self.api_accessible:
+        if not check_api_accessible():
             self.skipTest("bioRxiv API is not accessible")
         
         papers = asyncio.run(self.searcher.search("machine learning", max_results=10))
@@ -33,8 +31,9 @@ class TestBioRxivSearcher(unittest.TestCase):
         self.assertTrue(len(papers) > 0)
         self.assertTrue(papers[0].title)
 
+    @pytest.mark.network
     def test_download_and_read(self):
-        if not self.api_accessible:
+        if not check_api_accessible():
             self.skipTest("bioRxiv API is not accessible")
             
         papers = asyncio.run(self.searcher.search("machine learning", max_results=1))
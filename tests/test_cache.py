@@ -0,0 +1,84 @@
+# tests/test_cache.py
+import unittest
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from paper_search_mcp.cache import SearchCache
+
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="search_cache_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_get_set_and_ttl(self):
+        cache = SearchCache()
+        key = SearchCache.make_key("arxiv", "query", 10, {})
+        self.assertEqual(cache.get(key), (False, None))
+        cache.set(key, [{"paper_id": "1"}], ttl=60)
+        self.assertEqual(cache.get(key), (True, [{"paper_id": "1"}]))
+        cache.set(key, [], ttl=-1)  # already expired
+        self.assertEqual(cache.get(key), (False, None))
+
+    def test_lru_eviction(self):
+        cache = SearchCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.get("c"), (True, 3))
+
+    def test_make_key_ignores_kwarg_order(self):
+        self.assertEqual(
+            SearchCache.make_key("crossref", "q", 5, {"sort": "published", "order": "desc"}),
+            SearchCache.make_key("crossref", "q", 5, {"order": "desc", "sort": "published"}),
+        )
+
+    def test_persists_across_instances(self):
+        key = SearchCache.make_key("pubmed", "crispr", 10, {})
+        SearchCache(directory=self.test_dir).set(key, [{"paper_id": "42"}], ttl=60)
+
+        restarted = SearchCache(directory=self.test_dir)
+        self.assertEqual(restarted.get(key, ttl=60), (True, [{"paper_id": "42"}]))
+
+        # Files older than the TTL are ignored
+        old = time.time() - 120
+        for name in os.listdir(self.test_dir):
+            os.utime(os.path.join(self.test_dir, name), (old, old))
+        self.assertEqual(SearchCache(directory=self.test_dir).get(key, ttl=60), (False, None))
+        # ... and deleted once seen
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_async_get_set(self):
+        key = SearchCache.make_key("pubmed", "crispr", 10, {})
+        asyncio.run(SearchCache(directory=self.test_dir).aset(key, [{"paper_id": "42"}], ttl=60))
+        restarted = SearchCache(directory=self.test_dir)
+        self.assertEqual(asyncio.run(restarted.aget(key, ttl=60)), (True, [{"paper_id": "42"}]))
+        self.assertEqual(asyncio.run(restarted.aget("missing", ttl=60)), (False, None))
+
+    def test_prunes_oldest_files(self):
+        cache = SearchCache(maxsize=2, directory=self.test_dir)
+        cache.PRUNE_EVERY = 1
+        for i, key in enumerate("abc"):
+            cache.set(key, i)
+            old = time.time() - 100 + i
+            os.utime(cache._path(key), (old, old))
+        cache.set("d", 3)
+        self.assertEqual(sorted(os.listdir(self.test_dir)), sorted(cache._path(k).name for k in "cd"))
+
+    def test_clear(self):
+        cache = SearchCache(directory=self.test_dir)
+        cache.set("a", 1, ttl=60)
+        self.assertEqual(cache.clear(), 1)
+        self.assertEqual(cache.get("a", ttl=60), (False, None))
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 import unittest
 import asyncio
+import functools
 import os
+import pytest
 import requests
 from paper_search_mcp.academic_platforms.google_scholar import GoogleScholarSearcher
 
+@functools.lru_cache(maxsize=None)
 def check_scholar_accessible():
     """检查 Google Scholar 是否可访问"""
     try:
@@ -13,17 +16,12 @@ def check_scholar_accessible():
         return False
 
 class TestGoogleScholarSearcher(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.scholar_accessible = check_scholar_accessible()
-        if not cls.scholar_accessible:
-            print("\nWarning: Google Scholar is not accessible, some tests will be skipped")
-
     def setUp(self):
         self.searcher = GoogleScholarSearcher()
 
+    @pytest.mark.network
     def test_search(self):
-        if not self.scholar_accessible:
+        if not check_scholar_accessible():
             self.skipTest("Google Scholar is not accessible")
             
         papers = asyncio.run(self.searcher.search("machine learning", max_results=5))
@@ -0,0 +1,103 @@
+# tests/test_pdfcache.py
+import unittest
+import asyncio
+import os
+import shutil
+import sqlite3
+import tempfile
+import httpx
+from paper_search_mcp.pdfcache import PdfCache, stream_to_file
+
+PDF_BYTES = b"%PDF-1.4 fake pdf content" * 100
+
+
+class TestPdfCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="pdf_cache_test_")
+        self.cache = PdfCache(os.path.join(self.test_dir, "cache"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def download_all(self, urls):
+        statuses = []
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                statuses.append(304)
+                return httpx.Response(304)
+            statuses.append(200)
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=PDF_BYTES)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return [
+                    await self.cache.download(client, url, os.path.join(self.test_dir, f"paper{i}.pdf"))
+                    for i, url in enumerate(urls)
+                ]
+
+        return asyncio.run(run()), statuses
+
+    def test_repeat_download_is_conditional(self):
+        url = "https://example.org/paper.pdf"
+        (first, second), statuses = self.download_all([url, url])
+        self.assertEqual(statuses, [200, 304])
+        for path in (first, second):
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), PDF_BYTES)
+        self.assertTrue(os.path.samefile(first, second))
+
+    def test_same_content_is_stored_once(self):
+        self.download_all(["https://a.example/x.pdf", "https://b.example/y.pdf"])
+        blobs = [name for name in os.listdir(self.cache.directory) if name.endswith(".pdf")]
+        self.assertEqual(len(blobs), 1)
+
+    def test_modified_cached_file_is_refetched(self):
+        url = "https://example.org/paper.pdf"
+        (first,), _ = self.download_all([url])
+        with open(first, "wb") as f:  # rewrites the shared inode
+            f.write(b"corrupted")
+        (second,), statuses = self.download_all([url])
+        self.assertEqual(statuses, [200])
+        with open(second, "rb") as f:
+            self.assertEqual(f.read(), PDF_BYTES)
+
+    def test_index_without_file_stats_is_upgraded(self):
+        url = "https://example.org/paper.pdf"
+        os.makedirs(self.cache.directory)
+        db = sqlite3.connect(os.path.join(self.cache.directory, "index.sqlite"))
+        db.execute(
+            "CREATE TABLE pdfs (url TEXT PRIMARY KEY, sha256 TEXT NOT NULL, etag TEXT, last_modified TEXT)"
+        )
+        db.execute("INSERT INTO pdfs VALUES (?, 'ab', '\"v1\"', NULL)", (url,))
+        db.commit()
+        db.close()
+        # The old row has no recorded size/mtime, so it is fetched in full
+        (_,), statuses = self.download_all([url])
+        self.assertEqual(statuses, [200])
+        (_,), statuses = self.download_all([url])
+        self.assertEqual(statuses, [304])
+
+    def test_stream_to_file_leaves_nothing_on_failure(self):
+        dest = os.path.join(self.test_dir, "out", "paper.pdf")
+
+        def handler(request):
+            if request.url.path == "/missing.pdf":
+                return httpx.Response(404)
+            return httpx.Response(200, content=PDF_BYTES)
+
+        async def run(url):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await stream_to_file(client, url, dest)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(run("https://example.org/missing.pdf"))
+        self.assertEqual(os.listdir(os.path.dirname(dest)), [])
+        self.assertEqual(asyncio.run(run("https://example.org/paper.pdf")), dest)
+        with open(dest, "rb") as f:
+            self.assertEqual(f.read(), PDF_BYTES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# tests/test_pubmed.py
+import unittest
+import asyncio
+import httpx
+import pytest
+from paper_search_mcp.academic_platforms.pubmed import PubMedSearcher
+
+class TestPubMedSearcher(unittest.TestCase):
+    @pytest.mark.network
+    def test_search(self):
+        searcher = PubMedSearcher()
+        papers = asyncio.run(searcher.search("machine learning", max_results=10))
+        print(f"Found {len(papers)} papers for query 'machine learning':")
+        for i, paper in enumerate(papers, 1):
+            print(f"{i}. {paper.title} (ID: {paper.paper_id})")
+        self.assertEqual(len(papers), 10)
+        self.assertTrue(papers[0].title)
+    
+    def test_search_posts_ids_in_one_efetch(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.url.path.endswith('esearch.fcgi'):
+                return httpx.Response(200, content=b"<eSearchResult><IdList><Id>1</Id><Id>2</Id></IdList></eSearchResult>")
+            articles = b"".join(
+                b"<PubmedArticle><PMID>%s</PMID><ArticleTitle>Paper %s</ArticleTitle>"
+                b"<PubDate><Year>2020</Year></PubDate></PubmedArticle>" % (pmid, pmid)
+                for pmid in (b"1", b"2")
+            )
+            return httpx.Response(200, content=b"<PubmedArticleSet>%s</PubmedArticleSet>" % articles)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                searcher = PubMedSearcher(client=client)
+                searcher.api_key = "secret"
+                return await searcher.search("crispr", max_results=2)
+
+        papers = asyncio.run(run())
+        self.assertEqual([paper.paper_id for paper in papers], ["1", "2"])
+        self.assertEqual([request.method for request in requests_seen], ["GET", "POST"])
+        self.assertEqual(requests_seen[0].url.params["api_key"], "secret")
+        self.assertIn(b"id=1%2C2", requests_seen[1].content)
+        self.assertIn(b"api_key=secret", requests_seen[1].content)
+
+    def test_pdf_unsupported(self):
+        searcher = PubMedSearcher()
+        with self.assertRaises(NotImplementedError):
+            searcher.download_pdf("12345678", "./downloads")
+    
+    def test_read_paper_message(self):
+        searcher = PubMedSearcher()
+        message = asyncio.run(searcher.read_paper("12345678"))
+        self.assertIn("PubMed papers cannot be read directly", message)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
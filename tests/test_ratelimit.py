@@ -0,0 +1,50 @@
+# tests/test_ratelimit.py
+import unittest
+import asyncio
+import time
+import httpx
+from paper_search_mcp.ratelimit import RateLimitedTransport, retry_delay
+
+
+class TestRateLimitedTransport(unittest.TestCase):
+    def run_requests(self, limits, urls):
+        active = 0
+        peak = {}
+
+        async def handler(request):
+            nonlocal active
+            active += 1
+            peak[request.url.host] = max(peak.get(request.url.host, 0), active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        async def run():
+            transport = RateLimitedTransport(httpx.MockTransport(handler), limits=limits)
+            async with httpx.AsyncClient(transport=transport) as client:
+                await asyncio.gather(*(client.get(url) for url in urls))
+
+        asyncio.run(run())
+        return peak
+
+    def test_bounds_concurrency_per_host(self):
+        peak = self.run_requests({"limited.example": (2, 0.0)}, ["https://limited.example/"] * 6)
+        self.assertEqual(peak["limited.example"], 2)
+
+        peak = self.run_requests({}, ["https://free.example/"] * 6)
+        self.assertEqual(peak["free.example"], 6)
+
+    def test_spaces_request_starts(self):
+        start = time.monotonic()
+        self.run_requests({"slow.example": (3, 0.05)}, ["https://slow.example/"] * 3)
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_retry_delay_honors_retry_after(self):
+        delay = retry_delay(httpx.Response(429, headers={"Retry-After": "7"}), attempt=0, base_delay=1)
+        self.assertTrue(7 <= delay <= 7.5)
+        delay = retry_delay(httpx.Response(429), attempt=2, base_delay=1)
+        self.assertTrue(4 <= delay <= 4.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
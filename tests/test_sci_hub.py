@@ -1,45 +1,130 @@
 # tests/test_sci_hub.py
 import unittest
 import asyncio
+import functools
 import tempfile
-import shutil
 import os
-import requests
+import socket
+import hashlib
+import httpx
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 from paper_search_mcp.academic_platforms.sci_hub import SciHubFetcher
 
 
-def check_sci_hub_accessible():
-    """Check if Sci-Hub is accessible"""
+# Sci-Hub often blocks or serves CAPTCHAs, so the live tests are opt-in
+SCI_HUB_LIVE = os.getenv("SCI_HUB_LIVE", "").strip().lower() not in ("0", "false", "no", "")
+
+# (response, identifier, substring the filename must contain) for
+# test_generate_filename; _generate_filename only reads url and content
+FILENAME_CASES = [
+    # PDF URL: named after the URL, with the hash separator
+    (SimpleNamespace(url="https://example.com/paper.pdf", content=b"fake pdf content"), "10.1234/test", "_"),
+    # Non-PDF URL: named after the identifier
+    (SimpleNamespace(url="https://example.com/page", content=b"fake content"), "test-paper", "test-paper"),
+]
+
+# One event loop for the whole module, so the shared fetcher's pooled
+# client (and its Sci-Hub connection) survives from test to test
+loop = None
+
+
+def setUpModule():
+    global loop
+    loop = asyncio.new_event_loop()
+
+
+def tearDownModule():
+    loop.close()
+
+
+def run_in_loop(coro):
+    """Run ``coro`` to completion on the module's event loop."""
+    return loop.run_until_complete(coro)
+
+
+async def first_success(fetch, items):
+    """Run ``fetch`` on all items at once; return the first ``(item, result)``
+    with a truthy result, or ``(None, None)``.
+
+    The calls still running when one succeeds are cancelled.
+    """
+    async def attempt(item):
+        return item, await fetch(item)
+
+    tasks = [asyncio.ensure_future(attempt(item)) for item in items]
     try:
-        # Test with a simple request to see if sci-hub responds
-        response = requests.get("https://sci-hub.se", timeout=10)
-        return response.status_code == 200
-    except:
-        return False
+        for next_done in asyncio.as_completed(tasks):
+            item, result = await next_done
+            if result:
+                return item, result
+        return None, None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def use_mock_transport(fetcher, handler):
+    """Point the fetcher's pooled client at an in-process mock transport."""
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    fetcher._client_loop = asyncio.get_running_loop()
+
+
+@functools.lru_cache(maxsize=None)
+def check_sci_hub_accessible():
+    """Check if Sci-Hub is accessible (probed at most once per run)"""
+    # Whether the host accepts a TCP connection is all the skip needs; the
+    # live tests themselves find out about blocking and CAPTCHA pages. One
+    # retry keeps a dropped connect from skipping them for the whole run.
+    for _ in range(2):
+        try:
+            socket.create_connection(("sci-hub.se", 443), timeout=3).close()
+            return True
+        except OSError:
+            pass
+    return False
 
 
 class TestSciHubFetcher(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.sci_hub_accessible = check_sci_hub_accessible()
-        if not cls.sci_hub_accessible:
-            print("\nWarning: Sci-Hub is not accessible, some tests will be skipped")
+        # One directory for the whole class; most tests never write to it
+        cls._tmp = tempfile.TemporaryDirectory(prefix="sci_hub_test_")
+        cls.test_dir = cls._tmp.name
+        cls.fetcher = SciHubFetcher(output_dir=cls.test_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        run_in_loop(cls.fetcher.aclose())
+        cls._tmp.cleanup()
 
     def setUp(self):
-        # Create temporary directory for downloads
-        self.test_dir = tempfile.mkdtemp(prefix="sci_hub_test_")
-        self.fetcher = SciHubFetcher(output_dir=self.test_dir)
+        self.fetcher.output_dir = Path(self.test_dir)
+
+    def require_sci_hub(self):
+        """Skip unless live tests are enabled and Sci-Hub answers.
+
+        Probed on first use, not at import, and never when disabled.
+        """
+        if not SCI_HUB_LIVE:
+            self.skipTest("live Sci-Hub tests disabled (set SCI_HUB_LIVE=1)")
+        if not check_sci_hub_accessible():
+            self.skipTest("Sci-Hub not accessible")
 
-    def tearDown(self):
-        # Clean up temporary directory
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    def use_download_dir(self):
+        """Point the fetcher at a fresh subdirectory, for tests that write files."""
+        download_dir = tempfile.mkdtemp(dir=self.test_dir)
+        self.fetcher.output_dir = Path(download_dir)
+        return download_dir
 
     def test_init(self):
         """Test initialization of SciHubFetcher"""
         self.assertEqual(self.fetcher.base_url, "https://sci-hub.se")
         self.assertTrue(os.path.exists(self.test_dir))
-        self.assertIsNotNone(self.fetcher.session)
+        self.assertIn('User-Agent', self.fetcher.headers)
 
     def test_init_custom_url(self):
         """Test initialization with custom URL"""
@@ -48,15 +133,17 @@ class TestSciHubFetcher(unittest.TestCase):
 
     def test_download_pdf_empty_query(self):
         """Test download with empty query"""
-        result = asyncio.run(self.fetcher.download_pdf(""))
+        result = run_in_loop(self.fetcher.download_pdf(""))
         self.assertIsNone(result)
 
-        result = asyncio.run(self.fetcher.download_pdf("   "))
+        result = run_in_loop(self.fetcher.download_pdf("   "))
         self.assertIsNone(result)
 
-    @unittest.skipUnless(check_sci_hub_accessible(), "Sci-Hub not accessible")
+    @pytest.mark.network
     def test_download_pdf_known_doi(self):
         """Test download with well-known DOIs"""
+        self.require_sci_hub()
+        self.use_download_dir()
         # List of valid DOIs for testing (mix of older and newer papers)
         test_dois = [
             "10.1038/nature12373",  # Nature paper on CRISPR-Cas9
@@ -66,72 +153,144 @@ class TestSciHubFetcher(unittest.TestCase):
             "10.1038/35057062",  # Nature paper on human genome
         ]
         
-        success_count = 0
-        
-        for doi in test_dois:
-            print(f"\nTesting PDF download for DOI: {doi}")
-            result = asyncio.run(self.fetcher.download_pdf(doi))
-            
-            if result:
-                # Download successful
-                self.assertIsInstance(result, str)
-                self.assertTrue(os.path.exists(result))
-                self.assertTrue(result.endswith('.pdf'))
-                
-                # Check file size (should be > 0)
-                file_size = os.path.getsize(result)
-                self.assertGreater(file_size, 0)
-                print(f"PDF successfully downloaded: {result} (size: {file_size} bytes)")
-                success_count += 1
-                break  # Stop after first successful download
-            else:
-                print(f"Download failed for {doi} (may be blocked or unavailable)")
-        
-        if success_count == 0:
+        # Any one download is enough, so try them all at once
+        doi, result = run_in_loop(first_success(self.fetcher.download_pdf, test_dois))
+        if result is None:
             # All downloads failed - likely due to blocking
-            print("All downloads failed - this may be expected due to Sci-Hub blocking or CAPTCHA")
             self.skipTest("All Sci-Hub downloads failed (possibly blocked or CAPTCHA)")
+        
+        # Failures are reported against the DOI that was downloaded
+        with self.subTest(doi=doi):
+            self.assertIsInstance(result, str)
+            self.assertTrue(result.endswith('.pdf'))
+            # One stat both checks the file exists (raising if not) and
+            # gives its size (should be > 0)
+            self.assertGreater(os.stat(result).st_size, 0)
 
-    @unittest.skipUnless(check_sci_hub_accessible(), "Sci-Hub not accessible")
+    @pytest.mark.network
     def test_download_pdf_invalid_doi(self):
         """Test download with invalid DOI"""
+        self.require_sci_hub()
         invalid_doi = "10.1234/invalid.doi.123456789"
+        self.use_download_dir()
         
-        print(f"\nTesting download for invalid DOI: {invalid_doi}")
-        result = asyncio.run(self.fetcher.download_pdf(invalid_doi))
+        result = run_in_loop(self.fetcher.download_pdf(invalid_doi))
         
         # Should return None for invalid DOI
         self.assertIsNone(result)
 
     def test_generate_filename(self):
         """Test filename generation"""
-        # Mock response object
-        class MockResponse:
-            def __init__(self, url, content):
-                self.url = url
-                self.content = content.encode()
-        
-        # Test with PDF URL
-        response = MockResponse("https://example.com/paper.pdf", "fake pdf content")
-        filename = self.fetcher._generate_filename(response, "10.1234/test")
-        self.assertTrue(filename.endswith('.pdf'))
-        self.assertIn('_', filename)  # Should contain hash separator
-        
-        # Test with non-PDF URL
-        response = MockResponse("https://example.com/page", "fake content")
-        filename = self.fetcher._generate_filename(response, "test-paper")
-        self.assertTrue(filename.endswith('.pdf'))
-        self.assertIn('test-paper', filename)
+        for response, identifier, expected in FILENAME_CASES:
+            with self.subTest(url=response.url):
+                filename = self.fetcher._generate_filename(response, identifier)
+                self.assertTrue(filename.endswith('.pdf'))
+                self.assertIn(expected, filename)
+
+    def test_download_pdf_streams_to_file(self):
+        """Test that a PDF is streamed to disk and named after its content hash"""
+        pdf_bytes = b"%PDF-1.4 fake pdf content" * 1000
+        download_dir = self.use_download_dir()
+
+        def handler(request):
+            if request.url.path.endswith(".pdf"):
+                return httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=pdf_bytes)
+            html = b'<html><body><embed type="application/pdf" src="//mirror.example/paper.pdf#view=FitH"></body></html>'
+            return httpx.Response(200, headers={"Content-Type": "text/html"}, content=html)
+
+        async def run():
+            use_mock_transport(self.fetcher, handler)
+            try:
+                first = await self.fetcher.download_pdf("10.1234/test")
+                second = await self.fetcher.download_pdf("10.1234/test")
+                self.assertEqual(first, second)
+                return first
+            finally:
+                await self.fetcher.aclose()
+
+        result = run_in_loop(run())
+        self.assertIsNotNone(result)
+        self.assertEqual(os.listdir(download_dir), [os.path.basename(result)])
+        with open(result, 'rb') as f:
+            self.assertEqual(f.read(), pdf_bytes)
+        self.assertEqual(os.path.basename(result), f"{hashlib.blake2b(pdf_bytes, digest_size=4).hexdigest()}_paper.pdf")
+        self.assertEqual([name for name in os.listdir(download_dir) if name.endswith('.part')], [])
+
+    def test_download_pdf_failed_rename_leaves_no_part_file(self):
+        """Test that a failure after streaming still removes the .part file"""
+        download_dir = self.use_download_dir()
+
+        def handler(request):
+            if request.url.path.endswith(".pdf"):
+                return httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=b"%PDF-1.4")
+            html = b'<embed type="application/pdf" src="//mirror.example/paper.pdf">'
+            return httpx.Response(200, headers={"Content-Type": "text/html"}, content=html)
+
+        async def run():
+            use_mock_transport(self.fetcher, handler)
+            try:
+                with mock.patch.object(self.fetcher, "_generate_filename", side_effect=OSError("disk full")):
+                    return await self.fetcher.download_pdf("10.1234/test")
+            finally:
+                await self.fetcher.aclose()
+
+        self.assertIsNone(run_in_loop(run()))
+        self.assertEqual(os.listdir(download_dir), [])
 
     def test_get_direct_url_pdf_url(self):
         """Test _get_direct_url with direct PDF URL"""
         pdf_url = "https://example.com/paper.pdf"
-        result = self.fetcher._get_direct_url(pdf_url)
+        result = run_in_loop(self.fetcher._get_direct_url(pdf_url))
         self.assertEqual(result, pdf_url)
 
-    @unittest.skipUnless(check_sci_hub_accessible(), "Sci-Hub not accessible")
+    def test_get_direct_url_from_html(self):
+        """Test _get_direct_url extracts and normalizes PDF links from the page"""
+        pages = {
+            "/protocol-relative": b'<embed type="application/pdf" src="//mirror.example/a.pdf#view=FitH">',
+            "/root-relative": b"<iframe src='/downloads/b.pdf'></iframe>",
+            "/escaped": b'<a href="https://mirror.example/c.pdf?x=1&amp;y=2">PDF</a>',
+            "/onclick": b"<button onclick=\"location.href='//mirror.example/d?download=pdf'\">Save</button>",
+            # Other .pdf links ahead of the embed are not the paper
+            "/decoy": b'<link href="help/guide.pdf"><a href="/faq.pdf">FAQ</a>'
+                      b'<embed src="/downloads/e.pdf" type="application/pdf">',
+        }
+
+        def handler(request):
+            return httpx.Response(200, headers={"Content-Type": "text/html"}, content=pages[request.url.path])
+
+        async def run():
+            use_mock_transport(self.fetcher, handler)
+            try:
+                return [await self.fetcher._get_direct_url(path.lstrip("/")) for path in pages]
+            finally:
+                await self.fetcher.aclose()
+
+        self.assertEqual(run_in_loop(run()), [
+            "https://mirror.example/a.pdf#view=FitH",
+            f"{self.fetcher.base_url}/downloads/b.pdf",
+            "https://mirror.example/c.pdf?x=1&y=2",
+            "https://mirror.example/d?download=pdf",
+            f"{self.fetcher.base_url}/downloads/e.pdf",
+        ])
+
+    def test_get_direct_url_not_found(self):
+        """Test that "article not found" pages return None"""
+        html = b'<html><body><p>Article not found</p><a href="/help.pdf">Help</a></body></html>'
+
+        async def run():
+            use_mock_transport(self.fetcher, lambda request: httpx.Response(
+                200, headers={"Content-Type": "text/html"}, content=html))
+            try:
+                return await self.fetcher._get_direct_url("10.1234/missing")
+            finally:
+                await self.fetcher.aclose()
+
+        self.assertIsNone(run_in_loop(run()))
+
+    @pytest.mark.network
     def test_get_direct_url_doi(self):
         """Test _get_direct_url with DOI"""
+        self.require_sci_hub()
         # Use well-known DOIs
         test_dois = [
             "10.1038/nature12373",  # Nature CRISPR paper
@@ -139,44 +298,50 @@ class TestSciHubFetcher(unittest.TestCase):
             "10.1073/pnas.1320040111",  # PNAS paper
         ]
         
-        for doi in test_dois:
-            print(f"\nTesting direct URL extraction for DOI: {doi}")
-            result = self.fetcher._get_direct_url(doi)
-            
-            if result:
+        doi, result = run_in_loop(first_success(self.fetcher._get_direct_url, test_dois))
+        if result:
+            with self.subTest(doi=doi):
                 self.assertIsInstance(result, str)
                 # Should be a URL
                 self.assertTrue(result.startswith('http'))
-                print(f"Direct URL found: {result}")
-                break  # Stop after first success
-            else:
-                print(f"No direct URL found for {doi} (may be blocked)")
         
         # Note: This test may not assert success due to Sci-Hub blocking
 
     def test_session_headers(self):
-        """Test that session has proper headers"""
-        self.assertIn('User-Agent', self.fetcher.session.headers)
-        user_agent = self.fetcher.session.headers['User-Agent']
+        """Test that requests carry browser-like headers"""
+        self.assertIn('User-Agent', self.fetcher.headers)
+        user_agent = self.fetcher.headers['User-Agent']
         self.assertIn('Mozilla', user_agent)
 
     def test_output_directory_creation(self):
         """Test that output directory is created"""
-        new_dir = os.path.join(self.test_dir, "subdir", "nested")
+        new_dir = os.path.join(self.use_download_dir(), "subdir", "nested")
         fetcher = SciHubFetcher(output_dir=new_dir)
         self.assertTrue(os.path.exists(new_dir))
 
-    @unittest.skipUnless(check_sci_hub_accessible(), "Sci-Hub not accessible")
     def test_error_handling(self):
         """Test error handling for various scenarios"""
-        # Test with clearly invalid/malformed identifier
-        result = asyncio.run(self.fetcher.download_pdf("this-is-definitely-not-a-valid-doi-or-identifier-12345"))
-        # Note: Sci-Hub might still return something, so we just check it doesn't crash
-        self.assertIsInstance(result, (str, type(None)))
-        
-        # Test with empty string
-        result = asyncio.run(self.fetcher.download_pdf(""))
-        self.assertIsNone(result)
+        self.use_download_dir()
+        requested = []
+        html = b'<html><body><p>Article not found</p></body></html>'
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(200, headers={"Content-Type": "text/html"}, content=html)
+
+        async def run():
+            use_mock_transport(self.fetcher, handler)
+            try:
+                # Clearly invalid/malformed identifier: the not-found page yields None
+                malformed = await self.fetcher.download_pdf("this-is-definitely-not-a-valid-doi-or-identifier-12345")
+                # Empty string never reaches the network
+                empty = await self.fetcher.download_pdf("")
+                return malformed, empty
+            finally:
+                await self.fetcher.aclose()
+
+        self.assertEqual(run_in_loop(run()), (None, None))
+        self.assertEqual(len(requested), 1)
 
 
 if __name__ == '__main__':
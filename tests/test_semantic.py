@@ -1,10 +1,15 @@
 import unittest
 import asyncio
+import functools
 import os
+import json
+import httpx
+import pytest
 import requests
 from paper_search_mcp.academic_platforms.semantic import SemanticSearcher
 
 
+@functools.lru_cache(maxsize=None)
 def check_semantic_accessible():
     """Check if Semantic Scholar is accessible"""
     try:
@@ -15,20 +20,14 @@ def check_semantic_accessible():
 
 
 class TestSemanticSearcher(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.semantic_accessible = check_semantic_accessible()
-        if not cls.semantic_accessible:
-            print(
-                "\nWarning: Semantic Scholar is not accessible, some tests will be skipped"
-            )
-
     def setUp(self):
         self.searcher = SemanticSearcher()
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_search_basic(self):
         """Test basic search functionality"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         results = asyncio.run(self.searcher.search("secret sharing", max_results=3))
 
         self.assertIsInstance(results, list)
@@ -43,21 +42,27 @@ class TestSemanticSearcher(unittest.TestCase):
             self.assertTrue(hasattr(paper, "url"))
             self.assertEqual(paper.source, "semantic")
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_search_empty_query(self):
         """Test search with empty query"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         results = asyncio.run(self.searcher.search("", max_results=3))
         self.assertIsInstance(results, list)
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_search_max_results(self):
         """Test max_results parameter"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         results = asyncio.run(self.searcher.search("cryptography", max_results=2))
         self.assertLessEqual(len(results), 2)
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_download_pdf_functionality(self):
         """Test PDF download method with actual download"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         import tempfile
         import shutil
 
@@ -108,9 +113,11 @@ class TestSemanticSearcher(unittest.TestCase):
             if os.path.exists(test_dir):
                 shutil.rmtree(test_dir)
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_read_paper_functionality(self):
         """Test read paper method with text extraction functionality"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         import tempfile
         import shutil
 
@@ -169,9 +176,11 @@ class TestSemanticSearcher(unittest.TestCase):
             if os.path.exists(test_dir):
                 shutil.rmtree(test_dir)
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_get_paper_details(self):
         """Test getting detailed paper information"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         paper_id = "5bbfdf2e62f0508c65ba6de9c72fe2066fd98138"  # A known paper
         paper_details = self.searcher.get_paper_details(paper_id)
 
@@ -199,9 +208,11 @@ class TestSemanticSearcher(unittest.TestCase):
         else:
             self.fail("Could not fetch paper details")
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_search_with_fetch_details(self):
         """Test search functionality with fetch_details parameter"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         # Test with fetch_details=True (detailed information)
         print("\nTesting search with fetch_details=True")
         detailed_papers = asyncio.run(self.searcher.search(
@@ -249,9 +260,11 @@ class TestSemanticSearcher(unittest.TestCase):
             print(f"Categories: {', '.join(paper.categories)}")
             print(f"Abstract preview length: {len(paper.abstract)} chars")
 
-    @unittest.skipUnless(check_semantic_accessible(), "Semantic Scholar not accessible")
+    @pytest.mark.network
     def test_search_performance_comparison(self):
         """Test performance difference between detailed and compact search"""
+        if not check_semantic_accessible():
+            self.skipTest("Semantic Scholar not accessible")
         import time
 
         query = "encryption"
@@ -269,7 +282,54 @@ class TestSemanticSearcher(unittest.TestCase):
             f"Compact search took {compact_time:.2f} seconds for {len(compact_papers)} papers"
         )
 
-
+    def test_get_papers_batch(self):
+        """Test that batch lookups chunk IDs and keep input order"""
+        batch_sizes = []
+
+        def handler(request):
+            ids = json.loads(request.content)["ids"]
+            batch_sizes.append(len(ids))
+            return httpx.Response(200, json=[
+                None if paper_id == "missing" else {
+                    "paperId": paper_id,
+                    "title": f"Paper {paper_id}",
+                    "authors": [{"name": "Ada Lovelace"}],
+                    "publicationDate": "2020-01-01",
+                }
+                for paper_id in ids
+            ])
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                self.searcher.client = client
+                return await self.searcher.get_papers_batch(paper_ids)
+
+        self.searcher.BATCH_SIZE = 2
+        paper_ids = ["a", "missing", "c", "d", "e"]
+        papers = asyncio.run(run())
+        self.assertEqual(sorted(batch_sizes), [1, 2, 2])
+        self.assertEqual([paper and paper.paper_id for paper in papers], ["a", None, "c", "d", "e"])
+
+    def test_read_papers_bounds_concurrency(self):
+        active = []
+        peak = []
+
+        async def fake_batch(paper_ids):
+            return [None] * len(paper_ids)
+
+        async def fake_read(paper, paper_id, save_path):
+            active.append(paper_id)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(paper_id)
+            return paper_id
+
+        self.searcher.get_papers_batch = fake_batch
+        self.searcher._read_pdf = fake_read
+        paper_ids = [str(i) for i in range(6)]
+        results = asyncio.run(self.searcher.read_papers(paper_ids, "out", concurrency=2))
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(results, paper_ids)
 
 
 if __name__ == "__main__":
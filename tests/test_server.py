@@ -2,9 +2,43 @@
 import unittest
 import asyncio
 import os
+from datetime import datetime
+from unittest import mock
+import pytest
 from paper_search_mcp import server
+from paper_search_mcp.cache import SearchCache
+from paper_search_mcp.paper import Paper
+
+
+class FakeSearcher:
+    """Searcher that answers after a delay, or fails."""
+
+    def __init__(self, delay, error=None):
+        self.delay = delay
+        self.error = error
+
+    async def search(self, query, max_results=10):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [Paper(paper_id=f"{query}-{self.delay}", title=query, authors=[], abstract="",
+                      doi="", published_date=datetime(2020, 1, 1), pdf_url="", url="", source="fake")]
+
+
+class CountingSearcher(FakeSearcher):
+    """FakeSearcher that records the queries it is asked to run."""
+
+    def __init__(self, delay, error=None):
+        super().__init__(delay, error)
+        self.calls = []
+
+    async def search(self, query, max_results=10):
+        self.calls.append(query)
+        return await super().search(query, max_results)
+
 
 class TestPaperSearchServer(unittest.TestCase):
+    @pytest.mark.network
     def test_search_arxiv(self):
         """Test the search_arxiv tool returns 10 results."""
         result = asyncio.run(server.search_arxiv("machine learning", max_results=10))
@@ -14,6 +48,7 @@ class TestPaperSearchServer(unittest.TestCase):
             self.assertIn('title', paper, "Each result should contain a title")
             self.assertIn('paper_id', paper, "Each result should contain a paper_id")
 
+    @pytest.mark.network
     def test_download_arxiv_from_search(self):
         """Test downloading 10 arXiv papers based on search results."""
         # 先搜索 10 个结果
@@ -32,5 +67,107 @@ class TestPaperSearchServer(unittest.TestCase):
             self.assertTrue(result.endswith(".pdf"), f"Result for {paper_id} should be a PDF file path")
             self.assertTrue(os.path.exists(result), f"PDF file for {paper_id} should exist on disk")
 
+    def test_search_all_runs_sources_concurrently(self):
+        events = []
+
+        class RecordingSearcher(FakeSearcher):
+            async def search(self, query, max_results=10):
+                events.append("start")
+                try:
+                    return await super().search(query, max_results)
+                finally:
+                    events.append("end")
+
+        searchers = {
+            "first": RecordingSearcher(0.01),
+            "second": RecordingSearcher(0.01),
+            "broken": FakeSearcher(0, RuntimeError("boom")),
+        }
+        names = {searcher: name for name, searcher in searchers.items()}
+        with mock.patch.dict(server.SEARCHERS, searchers, clear=True), \
+                mock.patch.dict(server.SEARCHER_NAMES, names, clear=True), \
+                mock.patch.object(server, "search_cache", SearchCache(maxsize=16)):
+            result = asyncio.run(server.search_all("q", sources=["second", "first", "broken", "nope"]))
+        # Both searches were under way before either one finished
+        self.assertEqual(events, ["start", "start", "end", "end"])
+        self.assertEqual(list(result), ["second", "first", "broken", "nope"])
+        self.assertEqual(len(result["first"]), 1)
+        self.assertEqual(result["broken"], "Error: boom")
+        self.assertTrue(result["nope"].startswith("Error: unknown source"))
+
+    def test_search_cache_ignores_query_spacing(self):
+        searcher = CountingSearcher(0)
+        with mock.patch.object(server, "search_cache", SearchCache(maxsize=16)):
+            first = asyncio.run(server.async_search(searcher, "a AND b", 5))
+            second = asyncio.run(server.async_search(searcher, "  a   AND b ", 5))
+            # Case can matter (lowercase "and" is not an operator), so this is a new search
+            asyncio.run(server.async_search(searcher, "a and b", 5))
+        self.assertEqual(searcher.calls, ["a AND b", "a and b"])
+        self.assertEqual(first, second)
+
+    def test_search_cache_ignores_query_case_for_crossref(self):
+        searcher = CountingSearcher(0)
+        with mock.patch.dict(server.SEARCHER_NAMES, {searcher: "crossref"}), \
+                mock.patch.object(server, "search_cache", SearchCache(maxsize=16)):
+            asyncio.run(server.async_search(searcher, "Machine Learning", 5))
+            asyncio.run(server.async_search(searcher, "machine learning", 5))
+        self.assertEqual(searcher.calls, ["Machine Learning"])
+
+    def test_download_many_bounds_concurrency(self):
+        active = []
+        peak = []
+
+        class DownloadingSearcher:
+            async def download_pdf(self, paper_id, save_path):
+                active.append(paper_id)
+                peak.append(len(active))
+                await asyncio.sleep(0.01)
+                active.remove(paper_id)
+                if paper_id == "bad":
+                    raise RuntimeError("missing")
+                return f"{save_path}/{paper_id}.pdf"
+
+        ids = [str(i) for i in range(6)] + ["bad"]
+        with mock.patch.dict(server.SEARCHERS, {"fake": DownloadingSearcher()}):
+            result = asyncio.run(server.download_many("fake", ids, "out", concurrency=2))
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(result[:6], [f"out/{i}.pdf" for i in range(6)])
+        self.assertEqual(result[6], "Error: missing")
+
+    def test_read_many_passes_concurrency_to_semantic(self):
+        calls = []
+
+        class BatchReader:
+            async def read_papers(self, paper_ids, save_path, concurrency=None):
+                calls.append((paper_ids, save_path, concurrency))
+                return list(paper_ids)
+
+        with mock.patch.object(server, "semantic_searcher", BatchReader()):
+            result = asyncio.run(server.read_many("semantic", ["a", "b"], "out", concurrency=3))
+        self.assertEqual(result, ["a", "b"])
+        self.assertEqual(calls, [(["a", "b"], "out", 3)])
+
+    def test_concurrent_doi_lookups_share_one_request(self):
+        calls = []
+
+        class DoiSearcher:
+            async def get_paper_by_doi(self, doi):
+                calls.append(doi)
+                await asyncio.sleep(0.01)
+                return Paper(paper_id=doi, title="t", authors=[], abstract="", doi=doi,
+                             published_date=datetime(2020, 1, 1), pdf_url="", url="", source="crossref")
+
+        async def run():
+            return await asyncio.gather(
+                *(server.get_crossref_paper_by_doi(doi) for doi in ("10.1/x", "10.1/X ", "10.1/x"))
+            )
+
+        with mock.patch.object(server, "crossref_searcher", DoiSearcher()), \
+                mock.patch.object(server, "search_cache", SearchCache(maxsize=16)):
+            results = asyncio.run(run())
+        self.assertEqual(calls, ["10.1/x"])
+        self.assertEqual({r["doi"] for r in results}, {"10.1/x"})
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file